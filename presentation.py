@@ -15,14 +15,41 @@ Licence: GPLv3 or higher <http://www.gnu.org/licenses/gpl.html>
 import sys
 import os
 import time
-import select
+start_time = time.time() # of the startup phases
 import getopt
 import textwrap
+import socket
 import mimetypes
+import re
 import base64
+import struct
+import hashlib
+import marshal
+import json
+import copy
+import threading
+import traceback
+
+from math import exp, hypot, log, sqrt, ceil
+from stat import S_ISFIFO, S_ISSOCK
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import defaultdict, OrderedDict, deque
 
-from math import exp, hypot
-from collections import defaultdict
+try:
+	import queue
+except ImportError: # python 2
+	import Queue as queue
+
+try:
+	from urllib.request import urlopen
+except ImportError: # python 2
+	from urllib2 import urlopen
+
+try:
+	import tracemalloc
+except ImportError: # python 2, memory is not measured
+	tracemalloc = None
 
 if sys.version_info[0] == 3:
 	sys.stdin  = sys.stdin.detach()  # so that sys.stdin.readline returns bytes
@@ -44,20 +71,36 @@ Licence: <a href='http://www.gnu.org/licenses/gpl-3.0.txt'>GPLv3</a>+ <br/>
 Icon courtesy of <a href="http://www.dlanham.com/">David Lanham</a>
 """ % (HOME, VERSION)
 
-ICON = base64.b64decode(b'iVBORw0KGgoAAAANSUhEUgAAAQAAAAEACAYAAABccqhmAABGaElEQVR42u2dd3hU1fb3AyqCiILYaDYE6/UqzS6oVEGwooSiIEWFUKSXgIgoTSxICyC9JHRCC5AEQkivpDfS26SA/n73ve/713n3OrNOsudkyp6Zc2bOmdnzPN/neqnDzPl899prrb22jyAIPpbEX/zlQa9mZtQcJf9x3b+scW3CODcA/vJw2CXIb0PdTnSHGd1O/ZrmejcDbgD85a0ruznYWxC1JGpFdBeqNdHdqNb4Y/Dzd+Kvv13PZsANgL+8GfY7KdgB8HuI2hLdN3369CeuXo0cfuVKxIicnNzF8fEJYyMirg4/ffpMX/Lz7fHXtcHf25IyA10ZATcA/vLEUN4S7C3NwU70QFhY+AeZmVlLSkpKD9XW1pXcuvW3YEn19TdvVVRUnk1Nve5Hfu/9+OfcTRkBHRFwA+Av/nIj7K1xpb4XYb//+PETbwPspaVlhwyGmjRrsNsSmEFGRqY/+XMfRCNojX//7XowAW4A/KUn2M0BbxX2EydOvJ2SkupXWFgUUFVVfc0Z2K2putqQfuDAwf64PWiD7+kOfK/NuAHwF385DzudpKNhbwewb9q0qWdMTOwXubl569SEXa6bqDoSDcTGxc8i7+UhfF+ttG4C3AD4Sy+w0/v29lu3bn0pNjbui7y8vLUAO4TirgJeDr5cUdHRs8l7fBjfq2QCmtwOcAPgL1fC3swR2L/9dmpXSNLl5eWvheSbrSSdO+GXdPjwkVHkvXfASKClVnMC3AD4yx2wWyq/wf5Zysj7awV2e8CXVFtX//f7w4e/iNuBe6jEIDcA/vLYUN7ejPwDly9fHiGV35zNyGsFfkk5uXnHyb/xcfh3otG10FoUwA2Av5zdtzOX31yVkXc3+LSmT58xgPzbu2CishW1FeAGwF8emZEXYd+4ETLyMV/oDXaxtl+SKNRmnRJqEjcL1VeXCFXnxwtVF78VDLHrhdq8i3YZQGZW1knyeXTHpGAbNEnNVAW4AfCXMxl5WNXab96ypQdk5KXymzsy8g7DXp4p1BGoa1N3CYaolUJVyHijzjdVJegc+e+IxUJ91Q0mA6iprfuHfEaQC3gUzbGVlnIB3AB4ks6+jPxUkpEPv/xBXn7B2opKkqSrqy/RTShfXSjUFUY2wF4twc4AfeW5L01UdYWYQG2lZfhv3mrQ3r1755DP7ilMCNK5AG4A/KXtjHw4gT1fhL3KCPvf/wgN0gPsGYGCIZrAHvqtCLwz0IMqzjaqOn6TTfhBJDoKIp/lC5gLaIsGq4ltADcAnpGnMvJXRmRlZYs98jU1tWl/07DLpSXYa6uM+3YCe03ceqH68myh+sIEAvsExaE30ZkvTKMAGfiSSDmzkny+fYi6+hgPD92llW0ANwCvzciffBtOsxUVFQdIsMulVfAB9jqE3SDBLskF0IPKUTUFV63CL2n+/PlfkM/9GSoZqIltADcAL8jIQ4+8BDs5tHLNHOw2wXcT/CLs2aeE2qTNQk3kElPY3QR9g05/IVTFbbQJP4jMEdhAvot/a20bwA3AwzLyW0hGPi4OeuTz1wHs5OG7ZQt4raz69RUkI59PMvLXd4mwGwjcBnPAuxl6WhUXZzEZAGl0yiPfT2+iJ7S0DeAGoOOM/FSSkZeSdJUkI28v7O5c9cUknQj7bqEm5ifBcHGCUTqAvkzUOKOCxwm1pelMJtCrV+9BsmrAHe7eBnAD0ElG3hT2qrN1JCPvKOyuXvUB9nqSka/LCDLCHja1EXidQk+rKnEHkwEEBgb9RL7LfxF1xi2a25uCuAHoKCOvtNQAX8zIl5J9e2aQUJvwq1ATDrB/hfIc6EGloFPjhPLQhUwGQM48XCXfbS8f4/kATTQFcQNwP+wNGfmysnLVYFcr3DeBPWKOUHPpKwp4z4W+UWNF1VUWMJkA+b5f8zG2Bj+Iz8Id3AA8K0nHXH5jychradUXYc8hGfnkLULNNX8Rdkmugf5LTUEv6uRYoYSoOu04kwFs3759IXkOnifq5NN4TNhtJwS5AahTfsMRVZt7GqfWOJaRd+eqf5Nk5OvzLwl1KQT2KFPYOfRG6GlVRK5hMoDk5JRz5Nno4dN4NsCt5UBuAApm5KWpNe6G3d5VvwH2tN1CbezPQk3oV2aB59Cb0Qmjik+MEeprKmwaAHYFvkL0pI9xTkBrd+YBvNEANJ2RVxv8m4Yiob7omlBP9u11BPbay9OMwHPoHYKeliHvClMUMHfu3PHkOXrWxzgyzK1dgd5gAE5fGgGwq52RVwP+m3XVws2yJKE+67BQF2eEvTZ0oigOvTLQFx9vVEX0BiYDIJOLD/sYjwg/gttFt20DPM0AFMjIn3gbYC8r0w/sIvA07Im/CbWRcxtg1wL0lR4KPagIVXxqEpMBFBeXQFfgyz4aOBykZwPQfUbeKeAJ7Ddzg4X61K1CXfRSoTZsolEuhL6KQy8UHQONblDNjTgmE/D19f2EPINP+7j5cJBeDEDxjLyuYK/MEm7mnW4KO4deE9BLKiSqiNvOZABnzpz9w6dxRoDbugK1aACKZOTxQIzmMvJMsN8IFerT9wj18auEOgJ4nRx4Dr2moC882qjiM35MBkDuE4SuwN7YFdjeXV2BWjAAr8jIm4WdZORvFl8TbmYfNsIePoloIodeZ9A3ylcoPOIr1FWwdQX26dNnIHYF0oeDvMIA5MA7lJHXFewkSXeLhj3CD4H3dOi/8Arob1CqTD3G2hW4yN1dga42ADn4d1Cre5Mk3ZUrESP0mpEXk3QAe/LvQv21eRTsHHpPhL5Bh32F4vPz7O0KfMxdXYGuNAAafGkP3xqd776AgICXrl9P029GniTpbl7fKtRHzRPqm8CufegNCZuE2oIIMv/+Gw69A9BLKhA1SqgzWO4KrEcZamr+hzz7rxJ1c1dXoKsMoJlsxYd/aFs/P7+upAw3vbZWR6t7WXIj7LHLhPrLk4zSIvQhqLAZlld6AjyAT2b5i4LhFpUXvuHQOwC9qCCjqjLOWYVf0tq166a5sytQbQNoRsHfAkN9WPEfIOHPdK3v4W9VZQm3CkOFmxl7hfqEVY2w24I+TAPQI+jVkd8LNemHBEPiJjLLfr5JeF997UdxpZLgNzWBrzn0dkJPqyR8lVXwJUUbuwJfcldXoJoGIA/5YdVvN2HCV93LyyvOaw72miLhVkmUcDNzr3AzcTUBfHJT4HUCfYMI8DVph0xkSN5JrrsippB5ogn4chOoCPmaQ28H9PmgQKMKjk6wCT+o3Hg4yG1dgWobwG0Y8kM2v/2YMWOeITfApmsF9ls5R0TYb0ZOF+qvTPYM6KXwPnS6YEjd28QAarLPCHVVxVbhl5sAM/TB3g29UZ83qCrnslX4JY0aJXYFumVkuFoGQIf9AP/9o0aNetZgMGS4HPZ6kpEvTzbCnvK7cDN6vnCTwA7yGOjlh21CJpGQP6AJ/LVF8Uzgy02g/PzXHHpG6PMONaok4ncmAzAzMtxlXYFqGIAU+kthP3Q5dSHnoKNdAjzAnn+6CeweDz1VsoOMvgn8JNyHkVX2wm9iAue+1jb0R9WDPt8O6GkVnJjKZADFpiPD27tyG6CGATTHN98KkxqdSXnvdzVhv5UWINyM+164GTG5CfDeAr2Ura+O+cV01ScZ/rpag8PwN5pAmlB2bkpT6E9x6E100Kjcg5+JMhSnMZlAr97uGRmutAHQ+37I9neYP39BP/IA/a1URv4WSdLdgn07wC7Jy6Gnb6wVE33XidKPCLXl2U6Db2ICJcQEzk7h0NuAnlZZ3F4mA3DXyHClDaA5OldrzGg+Tu6MP+5Qkg5gzyKwJ60WbhHIb9HAc+ibKvQ7I/hENTkhiqz65lRDTKD0zBQT6Es49KY60KiC4NlMBpBhHBne08fFI8OVNAB69QcH6zRgwMCX7Vn9xcx8zAIC+xQOvT1tuBf9hOqUvSL8tcXJqoDf1AQmuwf6I9qHPofW/s+EmvJ8mwZQbRC7Al0+MlxpA7gdExiw+j9x7tx5f2b407dx6B3pvT83UahOCBAMWezlPaVMoOT0ZA69Behz9o9sUEXaWaYoYPv2HTAy/DmijriFVr0cqKQBSJn/NtjW+Aw58xzMBD9k7Zmgn8Shl3XkVcdvJFNoolwGftNI4FsOvRnoQdmgfSOFwos/MRlAVHSM1BX4qKu6ApUyACn8b4l1TKhn/pt0/OWw1OmhEUdv0Fe7EXqpI68q5jenynuKJAZJ1FF+bb1QHDzJM6E/4Bj0ctVCyzVbVyA9Mlz1cqCSBiCV/tpjPbM30+oPvfYagd6gA+jLafhVSvQ5YgJVKUFGIzg7XRnoD+sfelF7PxWyiCqywpmigHnz5n/pysNBShqAlP1/EBMZrzMZAOnQ49DbceCGdOXV5EdoAny5CVQSE6hM2i+UR/1BjMDPg6Af6RD0tArDf7VtAORzDAsL24kjw6WuQFW3AUoZgFT+uxv7maGvuS+LAYhDMzj0TAduKiNWCLUVBZqD39QEAkUTEI3g2h/ijDxvhV7UHqOyD46zCr4kMg8DugL7uOpwkJIG0AIzlx1xzNE7dhkAh97qgRtD+gnNgm/RBBKNKiNGUHR6mrah36889KDMBn0iVBddtwq/JF/f0R9TI8PvVnMboKQBSN1/nbCj6V3S/19tcwtA5uRx6C2dshsnVIQtFHvx9QC/iQkkBwoVBH5a5THbxHFZ3gR95u5GFV3dYhV8SYcOBf6MI8NV7wpUywDgzfcnXYBpLOO0OPSm0EsHbqoSd+gKfBMTqCwWKsyYQEXiPqGMGEHRubleAT0oA5UdNIXps8OR4b1cMTJc1QiAXMQRxjIam0NvOkCj/MJMoaYwTrfwNzWBfUYlmKosOkAoOjvXo6HP2GUqQ1ke02fXu7drRoarmgM4c+ZMIEsegEPfqMpra8mYrnLdw29iAkmHGqAvN6NSYgSFYASHx3gk9Bm7PhaVvvNjoSQ+iOlz27bNNSPDla4CSF2AUMfsR044/cVkAIy31noq9KLIKTu4XtpTwDc1gSLRBMotGEB5vFFlsTuFopClQl7QGJdBn2UD+kwFoKeVe2oR02eWlJTskpHhapQBH8IM5luLFi1mOgsAV1d7I/TSAI2KKz+Q8l6+R8JPm0A5bQLxllUWs1MoDPEX8gLHeAT0JvrrY6G22naEZzC4ZmS4qo1AS5b4L2aKABJ+9TroJVWnHfdo8JuYQOIhy+DH7zVRacxfQuF5fyH30GjdQ58m6iNRpSmnmT6vOXPmjle7K1DpVmDpJOCT2NP8AYsB1GcGeRX0cIa+PHSheJjGW+C3ZAJy6GGAhlyl0cQILiwXcoO+tAP6TzUFfYN2fCQUXFzH9FlFGw8HvajmyHA1zwJAN9P7TFsAMAAvgF5SZcJ2rwPfnAlYg96ciq/+qVvoJV0nSt8zmulzwq5AVUeGq3EasB0mLmC6yXvZ2Tk2JwHfLE1SFvpz2oMeVBYywyPKe0qZQFnCQWb4S4lyD0/ULfQN2g76UChPD2X6nHx91R0ZrrQB3IkHGB7Bc82DcnJy01kMwFOhlyblVESu8ajynitMAKAvjTWq4OwS3UNP60b4JqbPCEeGv4CHgxTvClR6IIg0DqwzvukBYWHhZ1i2AVqCvkwh6EWRqTmG3CsceGvbgZSTZqGXVBTxp0dAnwraZlT6/olMn09eXn4yjgxXpStQjYlADjUDqQ19uZrQWxiKWX55uceX95RQXY1BNAE5+KWxe0TlBH3lEdDLVXUjlbErsPdAtUaGK20A9JFgKF/0Xbdu3SomA7i6xH7oz2oPemlGXpUXlfcUM4Hkkw3QSyo4u9ijoE8J+KBBRbGBtj8XItJQtxLb6+muQEW2AUoPBZV6AR5Cx3pj8eIlS1gMwBC1UvfQl5CZeGUXF3hleU85EzjRAH/RlQ0eBz2tjEA/q+BLSjR2BfakugIV2waoNRX4Aexgem3o0KGTWAygJmWXbqGXBmJWxG/nICtlAjEk9A/8yuOgT9lqVDLKUJpnFX5QVbVBGhneTemR4WqOBe+KNcwRTN2A6YHah/5EU+hBJefITbw3eHlPSRMoIQbgqdAbNUJUSVKwRfBpkZHhC9QYGa7GxSAtMUx5HM80DyPTgQ02m4HyLuoKemkEdvnV1by8p5IKw9Z7JPTJWxqVfWq5TfhB16KiVRkZrpYBtMM3CqeZhpBmIJu9APUlibqBXhQZg13Ny3uqqyhis8dBn0Rr8wib8IPKyMxwNUaGK303IH01WBfsYx6Ymno91qYBlGdqH3pUWdj3vLznQpWRwzOZ+8Z6FPS0Sq9fYjKBufPmfYldgYodDlLjctAW8slApJspiCUPoGXopcsuqq4f41C6QfnnVigOfaoboU/aPFxIBG0aLuScW8NkAMHBp6Er8N9KjgxX63ZgaTAIJC3eZh0MAjPvtQg9XGxRcmE+L++5SQWXfmGG/rpmoR9uAj2t1N0TmAygqLhhZPgTSh0OUssAZINBFjENBqm6ukJT0NOCiy54ss/FbcJkcEb20ZkeCX2DNg4XEogqClKYTKBXr16DlOwKVNoAnBoMUgkGoCHo5ddalV5ZzcF0kaoLU4WMvWM8Gnqj3heVe3EDkwEcCgz8CbfWiowMV8MAHB4MAvfbaw16uSpTeQ5AbcHEHG+AXtSfRl3fP5XJANJNR4Y73RWolgE4NBgEDECL0NNXWhWeIGPLinkuQL39/jqvgT5epqqSXCYTwK7A7kp0BaphAGYHgxQWFhXabAYqTtQk9PK77IrJpRZ11TwfoPh+/8gMr4M+foOkYcKNqINMBhCwbftCpUaGq2UADg0GqStOUB36QgehN73Hzlcojfydg6uQ4FgsjMlyKfRbtAE9KA6VcXwpkwEkNo4Mf9TZkeFKG4DDg0FuwWSguipNQy+/x64y/SwH2Nn9fvJpr4Y+7g9TGarKHOkKdHhkuFoGYNdgkFuUtA49fZddwTEyx7D4OgfZoQtEy4V8Mh2XQ9+oWKLC+JNMUYBSI8PVMoAmg0G2b9++wRr4ksouLdA09Kb32I0SCs/M4UDbKTgCm3V4BoceoY/9fWiDMoNXMRlAlEIjw9UwAPlgEGgGenMxmQxiC/5bt/4WysgYLWWg91UNevkFljDimoPNpsqcaCFtt6/roN/sDPTvuwR6WvGbPmUygEKFRoaraQDywSCTrYEvqSJ6gy6gl5R/bLJ4wUVNaRYH3OZ+P5hDb06/DRViKJVmRjGZwCgFRoarZQDywSCQsBhhC35QVfIBzUNvInJ/XdHFH8QooJaXBi0O+AD4r+/y5dBbgN6o94SYX98Tss//wXY4SIGR4WoZwG3YDCQNBoGxxu8bamr/1xL4kuCuPM1Db+bW2vwT34pjrTnwpqqpKBJKEo4JWUdnewf0vzsGvaRoooSAcYxdgRlXnR0ZrqYB0INBxGagLDIYxBr8oJrCeN1AL7+1Fi6uLOUmYFLfL4reJ+RfWMehtwF9g9YbxdQVWFfv9MhwNQ1AagaSBoMMSklNjbMGP6i2NF130Mtvra3Ki/F6+CsyI4TCyF3CjSvbhOs7fV0OfYIOoZcUtX6IkB95wCr4kgICti1yZmS4GgZANwNJg0Fgn9I/ODg4yJYBgPQIPa3cwC+8Nh8gDvQkIT/AD8o8Mlsx6BO1Cv1vykAv6hejEnd+bRN+UGJiklMjw9U0gBaYmewoDQYhk4ECWQxAj9DLb6yFu+y8sb5fGLWvAf68kHUcejugl8tQWWYRfElVVdVOjQxX0wDoZiAoVby1cOFCfxYDKLm0TJfQm4jcZAOjrb2mvp+X0AC+FPqn/uXLobcT+mvrGnUj9oRV+CWtWbPGz9GR4WoZgHwwiHRL0GJWA9Ar9PI77Dw9HyCW+FLPm8Avhv6Hv+PQOwD9tXWDG5QatMQm/KBr16IcHhmupgHQtwTBoYVXn3322dEsBlCRuF/X0NN32WUfHOex+QAo8RXHH6PA3ykUXt0p5J1fy6F3EPpra42KJIr+/SMmAygrK3d4ZLjaBiAfDDLcHgPQK/RZsnvsCkJ+9MgSn3G/b4Re0o3LAULKjlEuhn6Yx0BvojWDhaKkC0wmMGrUqE8cGRmupgHQtwQ9hmOMht64UVhoywDgwg29Qy+/1qo04bDHwF8OJb6rMvBRGUHfceidhN6oQaLSjq9kMgBSYXNoZLgrDIAeDDI4Ozs73ZYB1NyIZ4Y+V8PQy6+1gkGXet/viyG/DHpJuST059A7D/1VSjGbRtuEv5YIDwf1sfdwkFoGYG4wCLjTgOjomHBbBlBfU+kx0NNXWmUHTtFtPkAs8V3b1wR6SQWXtwrJ2z/n0CsA/dXVpirPTbIKvyQcGf60PV2BahuAmVuCTjM1A3kK9OI9dtRddnDDjR5LfJbAl5QeOItDryD0oAjQqoFC1oUAq+BLOnjw0M/YdNcZI2+bXYFqGwB9SxAMBum3bdu2DSwGUHBiqnug36M89HLBXXe6KfGlnLcMfoRRcLUVh15Z6GnFBUyyCT8oLb3hcBB9c5DVKEBNA2hm5pagNxctWryEqR04xN+joKdvt0knF15UaTwfUFNuLPFZgl5SfjgJ/bd9zqFXGPoG/TxQuEJUWZRjEXxaa9f9MpUaFWbzbIArDEDqBYA55q9NmjR5JosBFIX+7FHQyy+6gBHYMBdPkyW+glTT/X6EeRUQpR+axaFXCXpa+VHHmQygqtrwz8RJk96jjgjTUUAzVxuA+cEgDAZQRqbseBr08ssuYCim5kp8GRE2oTfqLyH77BoOvULQX/nZnAYIV34yKunAQiYDABWXlGZjFNCJKgne7g4DMD8YxFDzv7YMoDz5qLrQ73YP9PLx1zApRzMlvrhjNqGXlBe+RUgK+IxDryL0l2WqrihlNgFyhdgJ7Ax8iGoMarIVcIUBNB0MkmW7F8BQEOex0NPTcGFAJpTY3F7ii9xnE3pRV4xKOzjTSeiHcugZoL+0/B3h7OK+wom5bwiZoXuYDQB0PuTCIuTO4lbAFQbQZDBINkwGYjAAT4VePhgzM2i6+0p8uQnM0EvKPrNacehjbEAf7QXQh/34rnB+aT8R9qAZrwj7vukt7JrUU9iJOjL3XaE0J4nZAKoNNX8PGDiwN54SvNfcVkBNA3B6MIhHQb/N+jTcgrCNbhjUeZ4Zekl5YVuExK2fceidhL4B9nkE9pmNsEuSoN850VSnlo2waysQFh6+BvNvD2BFrgUdBbjCABweDOLp0MtVlhbqmpCflPgKowOZoad1/eAMDr0D0IfQsH9LYJ/c0wR4a9DLFfbH1/YmBJ+nmoNMzgi4wgCaDAZZt27dKqZmIDJVx9Ohp8dlpf41SvV8QGVBinAjcq9d0IPyibJI6M+htw19yNK3heAFbwpHv3tNODCtjxF2SQ5C36geohJP/MlsAph8N3tGQG0DcGowSMGZJR4NfbKZcVnph/zUu5jj+iW7oRd1+S8hN3SLkLB5JId+lTnY3xJhP0hg303DriD08PsOTO0jHJv9mnCamAtEFAXx55kMYJ2xOcjsUWFXGIDDg0GKI7fqEPoP7IZePjUH6vBKgl9NRkwXxR61G3paqQdmeD30F0lG/syivgj7yyLskpSFvocI+5FZrwqn5r8hXCCwh/7wbhPFbPdjMoDNW7YskR0VbugOdJUBODQYpJTM1PMW6OWTcyqyo5VZ9VMviUm7pO1jhJzz6+2CXlLW6dVeB70IOym/HZ/zuhA4/RUCeS+U8tAfmPoygf01Avubwnn/fkLYineFMDPAi1ou6R2xRMhiACEXLuzBeRyPU5ODXWYAZgeDkDFGBlsGUJkV7lXQ00M04GhtDbkr3hn4AWp5nf46qd9DJt8W9PmXd4iC0B8urLQJ/a/6hb4B9rkE9hk07MpDf2CaGdglMULfoO/ZDODsufP7LI0Mc6UBtMWmhB5EQ1gGg1Tnx3oV9PKz9BlH5jl2kIcYR1rQXIt1+oQtI4XMUz9ahJ5W6v7pHgV96I/9hXMEvJMEQBH2Kb3MAK8M9Pu/7SMcnvmqmP2HZp6wFf1NgXcQelosBnD6zNkDkHvD8zgmo8PVNgAfqhnoXtyDwF5kIMtgkNqKAq+DXn6lFYTo9mb5k/8az1SnT941Sci5sMEs+PnhO4Qsclc9czeeBqEPI7CfJ0k6Cfa9pNYuAq8C9BLsJwns55b0Ff9uI/DKQw+6CFrGZgDkEtGDcBLX3LAQVxiA2cEgwcGWB4PcpOSN0MuP1pZnRTHBXxR/0u7mnLgNHwhphxc2QJ+Hyr20WYjb+Kl2obcA+ymSkQ+c8aop7ApDv/fr3mJeQII9nPzdIFdBf3HZ26KurBvJaACnwQDeoq4Sd7kB0INBxGagQ4cC/7IFPygrcLJXQk+fsEvZOd5qPgB+TqzRO9Gck7DVV8g6+0uDAaTsm87Ud+8O6C+T5poLBAaA/QjJyO+HjLwcdoWgByOB6AGSgQB76A/vNADvDuhp5cedYzKA+QsW+KMBuC0CkA8GIbcELfK3Br6k3FOLvBJ6+Sm7jBPLzIf8+SlCyt5vFWjOMcIO4GecWKEZ6KGT7sLyRtghibaHrMC7v+6tOPTQjgs9+JAMhDwBwErD3gD9CvWgv2gD+gskyonbPV8oTI1gbgR66qmnx7lzCyBvBoJExOuTJk2aZQt+UB6Zoeet0MsP3NyIOmgCfwkp8TnXnMN+ws5V0ENG/tRCU9gl7Z6iHPR7yO855PeyePAGEnShBN7wlf3NAu8s9JecgD46YJqQcnydkHP1qFCSnWjXaUBQTm5eEeHtI7w/sDtWAVyaBJQPBnkSSxIf3LQBP6g4ardXQy/f08OKD/BD8k7v0Evlt2MkvD5E9tQ07EpCv+drAvv0RtgBwssrBxiB1xD0kRvGC4mHlguZl/Y4BLs5/bVz137ouyF62Vw7sCsNQN4M9D6LARQRA/B26Gkl7fhSDPn1Bv1FAoexseYNi7ArAX0D7FB6W9IIuyT1oH/HLugj/5xAYP9BhN2ecN4elVdU/qfrk09+DfdxYPm9yd2BrjIAejDIY9JgkMys7AxbBlCZF+v10OttpRdr7VL5bfqrYtbcKvBOQB9IYD82h/THL3qLJAbfNp6tXzlAGeh/UAb6BthDAfarqsBufkDout2Es88h6Y4nAjvJB4W60gDulN0SNCiLDAZhMQAOvXahD6NgP0w63PZ+3ccm8I5CD6U3yMafoWGXpBHoI34hsxL2zBfSz24RigjsVXac3VdSFy5eiiWMTcTw/1UzTUAuOQxk6ZYgGAwyIDQs7AzLNoBDrw3ow1Y2NtaIsH/TB4FXHno4bGOEva+4ipobl+Vu6CPWm8Je7SbY5UpITMonfE0jGgUDeHAS16PUOQCXHQc21wzUEcORd0iHUiC7AXDoHYN+iEPQX8by22kCIMC+nxxYEYFXAXqAHU7YwbFaOF5rbUaeu6AP/3mYJmGX6/CRI9cIW98RfUE0DBPu3bEBqI2rJwJZGgwCI4v7rl27bpVNA7h5S5yZpzfo42xAH6sh6C+To64i7CRJd/g7GewKQ3+QlN6OzqZhtz0Y09XQh//8vnjUNv3cFvHMfUVhtiZhp5VfUHDziy++3IHwT4AqGzb/PI8t+E1Wf1caAN0L8JA0GGQRmQxiDXxJWccXcOgVgh5q7RfIw94A+zQzsCsE/X5ypv0wOdMeTOr6Icvetmsarqugv7zqfSGWwJ6hI9hNZ/5dzpkxY+YhwtNiohlE44k+hGv4MPR/XDYP8DZ3GQA9GKQbNCa8N3ToJGvgSyoI28ShdwB6gB0y8gD7UbKfPkiSaHvJoRVRCkMvwQ75AYAdYLV3BLYroAfYr5/4RbhBYK8ksNfpCPbU62nVJ08Fp5Hs/qXRY8bsJQz9gODPJoJy3xhM+vVF+LvignuPpctB3GEA0i1B0Jgwwhb8oMLIXRx6G9BLsJ8hte9jc2WwKww9RA2QF6Bhd3TuvZrQS7DnRR4Vykhjja3rtTUJ+9p1l3xHj4Zmnp+IVhAtI4J5/3NxxZ9CBK2+H0NlDTv+XsB+m4dk48Cbu9MA6MEgj+NgkGGlZDCIJfAllSYFc+hl0Btr7f1E2A/NMAO7QtDvI39GEDnmCr34UAEIJ9A6e9mFGtCzwK5V8HPz8m+RiliuBdhhnNd8ojkI/LdEkzDJ9zmG+4Nxv98TT/w9ipG2tPK75W5AW7cEiYNB4JYgWwZQkRPt1dCHrjTCfoKsuEEkzN5Hwm2Q0tDLYYcav1I33CgJfdSmr4TkoBVCdtheJti1BL8E+9atAZEAe8eOHX+xAvtUXOEhqTcWgf8Yw/zB2ODzGoL/LK76HbHjto0t+F1pAOYGg8AeZWByckqsLQMwlOV5DfRhK42NNScWmMKuBvRNYBen5gzSFPRRmwnshwns4XuF4utX7YbdneCLsIeG5W4xwn6AwL7eTtg/gW0ydM1C3wwm9t7A7fNLmOHvjt21HXF7fS9utVtYCvvdZQBmB4OcOhUcZMsAQJ4IvVh+Iw0lwaSzzRzsSkIfJI2mWtJPuERWUdNRWdqAPmrzRAL7j0bY0yKFOrjBCOQE9K6Cn2xl/xsdE1tMYL82bZrfUQL7r+T5/pFoORGcx1+IsM9kgH0gru5vYB2/J07Seg4raF0xiu6E+/z2CH5ratWXsv3NrEHpagMwMxjk0F8sBpC87XNdQ395lbHWHgxjpWe/bhF2JaCXRlOdJWfaL61418J8PPdCH/n7KCFh30Ih4/xWEXZDZVkj8LQ0CL4c9h49emySwS4l6WZhRx5k6L/CZN0oO2F/Elf4LsjNQ7jSt8PF9G6s799Jgd/cFviKGgCjOVgYDLLQn8UAYECmXqA3gZ2U36CxZr8N4B2FHg7bwAk7cYAFwG51KKZ7oAfYE/cT2ENswK5B8O2AHRpw/Ii+wR58SNKNJvoUm3KG2gl7Rwr2+3CFb4Or/F240kvQ306D7yirahuA2cEgcEsQkwEcnscG/QbXQg/AXSIPOay2Yq3d7xUEXnnoYdbdcXKm/czifuQs/buMk3BdB33g0g+FK2uGC3F/TRcy7YFdQ/AD7PsPHIxf4u9/ZtDgwTvshH0kZuWHYZLuXczOv4pVrxdx3/60g7C3kAFPr/Z2N/e4wwDMDwZhMAC40srd0F9da6y1A+zHsLGmEXZloW+AnezZ4Sy9NERDC9CfXj5U2Ov/qbBhwRfCitnfCAtmzhC+nrZIVFl5pf3Auwl8AnvJ/gMHEpYsIbAPEmFfqQDsr+FdfC9hnusZbHx7XGHYmzmb2XeXATQdDMJiAPQlFy6A/hpda8eJNdAAI0ph6CFqgLwAbBlE2GWTc9wF/YUVg4WgpR8JWxeNEVbPnSz4fzetAXRLik9MdTn4dXY01hhhH/SXrNa+GDPyAPt0J2Hvjs/2I5ikexhr8vfhcXhp364I7HozAHODQYZmZmZl2OwFIFdlqQU9NNaEEyjE8hvU2kkS7YAEu8LQQ9QAWwU4ZQfZeADU3Lgsd0C/c8nnwvr5E4SlBHQ/v3k2YTenoKOn3b7q2+iis9RYM56C/SMnYW9vBvZWasCuRwOQDwYZzNQMJBoAw7FaG9BDY81lGvZZxuGTkpSEvgF2mENHEnQRqwdanZHnrpU+fucMIe3Ur8LMOcsdgp7W73/+5dJV307YrTXWDMGz830R9j4Owt4aYW/pCtj1agAmzUCXLoWesWUAtdXlDkEPGfkQzMiLsJNw+4Dfy4pDL/bHk9N1ADtUAOA8PctgTFdDH7+LwB78q5AfdVwoy002gXL1us1OGwCYiFrw55HGmjDsohvtGOzWGmt6YA/9sxTsjyoAe3M1YdezAXTGEsgAFgMA2YKehv0I2VMbYX9FcejhzzoyW4L9XTGioCfnRKoJ/c/s0MdsnSikHP1RyLm8TyhOj7QJJoTvzhoAKL+gyGnwCex/k+cib8uWrVG+vr4Hqcaa7xH2BSo01nTGWrtuYNd7BPBv8vrAYKj5XxYDoKfhWoddWegBdphoCwm6K6sGmo7K0gj0sQT2VDtgN6er1+IUMQD4c+yBPycn95+QkAuFf/75Z/zIkSOPP/zww1vIswE98qvwyKs/Aj8bk3RqNdbQGXldwK7nJKCYAyC90rtY4IctQMiPQ4VjpMPNPOzKQA+ww8UUId8bT76ZnY/nZuijNviKsOcS2EschN2cYOVWwgBMEoE2Vvrz50OK//jjj6R58+aFf/rpyOMdOnSARpvV1Fn3uQj9FEzU+SLww6kk3ZsK1tp1Bbuey4BQF+1dU1P7D4sBpJGJLUpDL4ddPGpraSimm6CP2jBaSD64SMi6ECDCXlNpvCOwTiUpkQiEXIIze/3y8or/xscn3Nizd28ImRq1tWvXrlNxpf8QV/l3cYXvg8A/ZyZJZw52R8pvuntp1QCayzsBT5w4uZx19T+5eJBT0IsDLMgJOxPYJTkM/SBFobcEO606laVYIlDh0l5efsGNy1cijs+cOWsirvY9EPxuVLLuQepgDB3KeyzsejEAev8vnQZ8vrCwKIHFALIijtoFvRH2t8RSH5ylNzsjz83QR67/QEjYPdMq7K6GX9FEYH6hat18VdWGfxKTkvetWbP2Q0zgdaFOxd1DnYprQR2Q8Vjg9WQA0kQgcSAIC/ygk8tGWIQeSm8npTPtpKZtbSimu6AH2BMJ7NkXA4SipAtCVXGOTdhdDb7iicDIWJf071dWVZfGxSf88Nnnnz+LJtAOV/9W1Jl4sz3z3ABcawD0UNAn/f39RzPt/UODGoAPJB16x/GYK8BuMjlHI9A7C7s74Vc0EXjktEtP7hlqav8mu4SgVavX9MFnrK2Z8/HNuQG4xwDk9wI8/csv66eyGEDk1mlCGNmzRxJgm4zL0gD0AHvG6d+EgujjTsPuTvBVSQS6aUgHGMHqNaIR0BNy7pRNyOFbABcbgMnNQC+99BLTIaC8sB2agT5xzywh4wzAfkIoJ110SsHuCvDJufb/p6VEoNoTeiAiSEvPWD9u3BdPUTPyWlGz8T02GtCqAcjvBuzP0gBUmZ/iFujjt002wh5DYM9TB3a14Cez6P65cOFi4R8b/kycOHHiJXJHfKZWEoGunssHOYJLoWFfUfmB1maiAW4AKhqAuRZg8XLQ7OycNGvw16Pit45VFfr47ZOFtOM/CXkRB4TS9GsugV0p8El5DAZP5m3esiWaJMKOYBfdBqKN8+bNDycr//+198+EI71KGEBoeKxQWl7bRBVVtUJldZ0oQ22dS4ygsKg4ZNQo32dxW3APRgPMs/O4ASgTAdADQfsfOHBwlzXwJeWGblcMehPYM641/j0uht4R+MtIg0xoWHgeOQxzzdd3NPTH/0Y+x5/xUIykVWR7FUCGXZQ6aiow1MP5LcAK4UBQiJBbYGBSQZFBKCypEQ1CLWOAbcHFi5cmYjTQ1p7pudwAlMkBtMEcADRw9Bs/fvxcW/CDaqrKheg/PrYb+phNY4SUwMVNYaelUfAB9pjYuOKtAWQWnV/DLLqV2CIrnX5biD3y8/F/F/322+/nyisq/uvsNmLBklVOGcCipeuFjVsPMRuAJVMoLqsRDUFJI8jKztmBC1F7TEx71JZA61UAaSAotHJ+UlJSarAEPq3ilItWoY8lsKcGLhFyLm0TYQfTsPVnagV+C7DLZ9HNoybWTMWpNVNQXz/22GNzkpKT85TKI8C5fkfh/27ej8KyFRtEOWMAtPJuGISiUuXMoKS0LHrkyM+ew5Ih0yUa3ACU6QOg7wZ8f/fu3fvrGQwAVJoZJaQGLRGS9n6HsG8nsEexwa4h8AH2AwcPxVuBXT6LDibWfOljvPwReuI/w8k1oM9nzpq1sqKy6j9KgF9ZVSeG4ocOhwjfTvd3KPSX4AfFJOQoZgKS8gsNQllFrdPbBGK8GR9+9NG/sIX4XjN5AW4AKnQCtqOmAQ18slu3ySRT+x+7AHZGLoY+lsB+kMDu77/0zGDHpszCeKr38RDMIBxk0R+Pvb53KDBou7PQ19TWi3tvAEuC7GpUuuC//HdxNWcB/xu/xcKcBatM4AeduxiruAHQUQG8b2eMoNpQ8/fmzVvew/6Utp5gAlo1ALoXoANOXoFZa58GBR0+5QngE9hLSGIzgXQ5SrA7MmX2feqYK4yneh2jpd543LU3/v83ExKTzisBPoAkhys9q6wBYjACgHvG7OXCtJlLG6CH/4Yfm7dotfhr5PCD7EkEOmsEzpjAnxs3DcXnkjYBXW4HtH4vgNQO3BWPcw6D456qRgEqwJ6Wll4dHByctm7dL5cUnjIrzaKTxlM9hUddu+N/P//6G2/0JXMUr6gBPq0163eYhdoeOZsItHdr4GiOAExg/oIFb3mCCehhIEhbPMEFD/k7sI8lFzFs0Sr4NOyjXTNlVhpP1REfyI74eXV9993+L5eWlWU7s8enQ31r2rbzmNMGoGQikFWQw3BkW0B6JjKHDRv2Em4H7sVnVXfVAS0bgLQNuBsTL3CW+xUMeyeQ6a7h7gbfTtjVmjLbDk2yLZ6ehM+qy5D33utJEldZjoBvqKkXbhTX2AXSkRNhihiAGolAlmigymCHCYBhEBUVFcdidPogVgekEiE3ACcNgK4GSMnALghEPx/jHWrfkEaNOFfBn0+66MLCwnMDAraJU2YduKtdiSmz9CWP0ngqSXfjz3cYPnzEiwT+TIcaeypsh/vmBIlAJQxAzUSgLZVX1jKBTys19fpuH+MosQfwO2ihp6Sg1g1AHgV0xeTWIAyZ/Y4dP35VafAVhl3pKbP0xJo78P+3wl8Ln9FjBTcKLzqy14dw2FF46ESgM3JFItCaoH+AFf4a1NFjx6ZhdHYfmrFu8gFaNgB5FNAW97fQGARjnoYicNPHT5gQcKOwqN4R+GGmHIE9L4A01hDYD1gZKa0E7EpMmaV1OxrA3fjnPJKTm3fUXvirDfXMe31r+m3DXl0lAplMwAz4NPwgMnXo7wEDB/bGiE1KCkr5AG4AThpAc6oicB/C8xyWvIZhwwuAuWDWd98duHIlIruiovK/5sAH2KHWDrD7mW+sWehjelc7DbszI6WVnDLbjEqS0p9L5+iYmB8dSfQ5EvKb0+59wbpMBFo0ARvg0yLGG4rf+UNUPkDzWwGtGwBdEWhBrXQQMj+PCbMhuBJDNn0mrtjLevbq9cfYseP2jBkzdt+YsWP39uzZ808LsJurtftinkFN2B0dPCmZojQ1WYyM9u0/MNpe+Msr6xSF5tSZq4oYAOQTNGECJTVM8EsKDAqajs9Be/y+Nb8V0IMB0FuBOxGm+3HP9SxmzKFc9gGCOxEjgpkYus9FzcYfs3V98yAsN76JsEvz490BuzVDlE5MPjRs2Psvwek1d8KvZCIQjEQLBgAqK6+xCb4kkngtx2dS2gq01HpVQE8G0Fy2522PibPuCOjrWEp7H0N1Xwzdx6Gk3niW65vpyyJcdlc7I/xSYrQ1JgwfJ2OtLrkbfklKGABsJbRiACCYScBqAlFR0ZvxuXmQqgpoNgrQiwGYM4HWmDx7GFfkpzEsfxlX73ew3DYQ1R/DeEuNNd18ml4W8YAbYbcV+oul0WtR0SvtuV4bSl1qwqJEIhD+DC0ZQB5RdQ2bCZAu1X/69ev3Gi4a7aiEIDcAJw2AhkDKCbRCMNujETyCZbWncRX/N0YHL2Kd/Tn8uW4+Gryr3c7Qv8PgwUN6MYX+OGKrsqpWdVg8KRFo0jFYbGCOAi5cvLgOI1MpIajZKEBvBmApGrgLP+h2GKI/jCF7Z3TiLlS7rGbvarcz9H8iMyv7OCv81Qblsv3elAiUNwqx5QLKy3HxeUTrUYBeDUAeDdyOcLSkuuLuwdCdVhvZyq6XG13l/RCdd+7aPY4FfBA8lDAxxxWQeGIisKFl+AZ7FLB7z545VBSg2VyAng2AhkNuBnfgB36nTLq7vtlMRyQ8UN3I4Mo4FvhBBXlFLgXFExOBDVWBCraqQEZm1hXcdnahKgK3cQNQ3gDkRtCMgrq5GdD1dudbM1ni75Ht23d8yQK+q/b93pAIdCQKeOWVV97BisADVF8ANwCVDMCWMejxRa/+bXD1f6qwqCieBX54CF2x7/eWRKC9UUBg0OEfMfHcEbekd2ptG+ANBqDnF736ixelBmzbPt4W+JKKS2vcAognJwLtqQiQ24YifIwnPR/F709z2wBuADpb/clDdYoFfsj6uwsQONPvqYlASVWGWpaegP/xMR5c66bVbQA3AO2v/g3DUfv27fu6LfAl2TvQgycC7VMpY4vw7NlzxmN7cAdZTwA3AG4AVl/0/QjiRKRLl0LXscBfVV3ndkDgWK+zBgBzBrVqAKzbAHJIaxU2oknVAE2dEuQGoN3VX+r6a4tNTP8iF6PksBiAu/b+tGCwhxJRAAwa0aIBQHswiwFERFw96mNsO38Cm8801RTEDUDb4f9d+NA8MWHChGEs8Btq6jQBCIz28uREIKiy2nYegFwtluJjPHvSHSM5TeUBuAFoN/yXGn+gdfnpkJAL61kMAGb6aQEOpRKBWjYAltZgcgsTJAL7ajUPwA1AH+H/C5mks4zFAJQY7aWlRKCWDaCkjC0ROGPGzEnYFQjf5b1UHoAbADcAq7V/CP9hHkHv6mrDP3oJ/5VMBGrZANIyi5gM4NjxExupfoB2WuoH4AagTQO4A/eKsGfsvnDhwrF6Cv+VTARqFX5QXGIOkwHExsWH+BjnVMBR9fsxt3M7NwBuANb2/9A6Ci2kz23btn2hNfClCbbOjPVWQ6GXkzy2D0A6+ZiZnW/TAMix7VQf48QqzSUCuQFoe/8PteMXQ0NDd1oDX5I7+v5tyZk7A5NSCzVvABGR8UxRgI/xIhg6EXiHFhKB3AC0aQCwR7wP9/+90tMzrtqCH+630yokershyJ5/25lzl1kNAGZPwvi5ThjdteAGwA3AWv0f9opwlPSVnJzcFEvgS6qsrtMsKPb2BOgBfskAdu09zmQA0/z8pmixI5AbgMYTgLB3LCsjc3xtXFip9rBPJfIBtrYDsOfXetgvP/UYsCOQyQC+X74cJgTBfRKPaakSwA1AewlAqf8fTv/BANO3mK6rLq/VzaoJNwnT0nKpz9aNyKwGsHTpsnk+TVuCuQFwAzBrAG0wWQRJo36eZACepG07jzEbwBJ/f7ix6hWtlQK5AWi7BAijzd/hBqBNwdgyVgNYvHgJXEX3qk/jiDBuANwAzBqANPcfssXQPtqfG4A2BXkLVgNYtGjxIp/GQ0GSAdzBDYAbgDkDgH7xzmgAA7gBaLe8yWoAC4kDaLEZiBuANpuAJAOAyyUGcgPQnqQ254NBp5kM4KuvJs6kDOABbgDcAFgiADCAAXnk9s9anZcBPU1SSdOORqCPcAvQjecAuAHYlQMgl0yk2TIALTcCeZroWQex8SmsBvABVgGe5FUAbgAsVQAwAGgdfTcpOTnGlgFotRXYk8N/EMthoOtpaRnkexxO1MdHY6PBuAFouw8ALpV4+9Sp4ECWPICWhoF4sn5ctUWEf+XqLUyr/5WICLgmbChRLx/j+Q7N3BHADUC7nYAwCuwZ6ARcs2btKhYDKCqt4YC68FwD6zmAXbv37CXf42AfDQ4F4QagvUpAk7MAg4cMmcJiADwR6NrjzaxHgceMGQtNQAMwqUuPBeOnAbkBNDGAJqcBIYFUVFxisGUAsB/lkLruVCM5o2UT/vKKyv+Q728UbOWws7Ojj4YGg3ID0GYvgHQXoDgPkGgYmS9/hSUK0OvBGq0L7ieQ9v72hP/RMbFJ5Pv7hOhNH+Phrodwi8cnAnEDsGgAsD9sS/QI0UtEg44dP36ExQCOnQrnwKp08o9e/VnLf7/++tsO8v2NoEqAmukB4Aago1LgnLlzl7MYwMGgM5q9TccT6v6gdb/9xQQ/qGvXrt+Q72+IT+MsAE3dEswNQCeVgEGDBn3DtAW4Fi+uVhxcZU/90QbAmvyLio5JJt+dr0/jODD5vQDcALgBWEwEtsZwEVpHoYX0Q5ZE4I3CEnGvyqMAdUab27P6kxkAcB/Ax0RvmNn/85uBuAHYTAS2x84xMRF4hTERuGHTPvHB5QArP8uQdfUvuFFYS76zCdgARE8C0sz+nxuAfhKBL0Ii8M+NGzezbgPgYYW9KwfZ8X0/nfUHbdi0l3n133/g4Gkq/IczHfx6cG4ADiUCpclAb3fv3n0CU0NQRZXYpgp7Vw6z8yU/e/r+QWXlFf95/PHHZ8K2zcd4BPgpKvzXzMWg3AD0kQh8CB8geJA+jo2LS2StBsBDy7cC9sMvT/rZc+wXtG///rPkuxrn09j++5gWw39uAPrpCIRBknCSbNjvf/yxjcUAIBkoPbwwkpvD7Tj89oT+ZPX/P4899vh32Pzzlo9xsGtHjOY0Ff5zA9BfHmDgk08+ORnaS1lM4Mz5y+IDDOEszwc4Bj9spQpuFDMbwKbNm4+R7+kLrP33wuSfdP5fM9l/bgD6yQPQI8JhRRkZFn75mj25AG4CthN+li4tYe34A6VnZJaR7+cbXP37+hiPc3fC2n9Lra3+3AD01Q8AbaRwxfT7ffv2m8diAKDY+NSGhxkecm4CTYd7mkv42VPykzRp8uQNuPeXr/6ttbj6cwPQzzagHW4DxBmBRKNDQ8OircJPHkhJMLhSeqh5JGB6tZela8pYh31KOnrsWAT5XuD+P5j99yZGbJpe/bkBaN8A6G0AtAVDNxl0lX305ltvLWSBH1ROjq1CIos2AW8+NQj7/Y1bDykGf1p6Rvmjjz46H4wZ8jSY+X9cy3t/bgD6qwa0x4eqJ5aXxp08dSrMGviS4CGFGraUD5AEK6C3wQ8VEUshvyPwl5aV/58RI0asJ9/HVz7GuX+voVF30GrmnxuA/rYBd1JNQVIy8GPSbDKroSJgAXxaYALyBx7ut/OGcwNw6zD8W63dTmxPrV/Sih9XBmHi71Mf49CPF3C7dp/WV39uAPpqCpJ6Ap6gooCxCxYu3MYCvyRIbMkffFgRPbVXAMwNTkdaW/UdSfiBzp47n0C+gxlEY/D76IU9Gw/6NHb9aXb15wagvyjgXowCnsFcALSaTo6MjLxuC3xbJgCCfTGslJ50mMdSeY+u87O2+NKKi08oIJ/9bKLxUJmhQv+OVOLvdi3Dzw1An1EA5AIe8zFOCoKKwKhHH31sbjnpQLPnATaXE5C0e1+wbo0AVnwW8KV7/Vjm+jVN+qVXdOnSZSn57Cdh1h+2ZP+yEPpzA+AGoGgUIFUEYGIwjJkaRvTlBx98uNbeBxlMgK4O6NkI4H3CuQdbob4z+33jJR/plQT+78ln/jXu+9/xMXZpPo79GroI/bkB6DMKgJCyFfYFwPHS53H1gVVo8sqffjpo7wMNKyDdJ2BpawCrqlZXe2slPXOrviMhvwR/586dfyCf9bdEn2ME1gubtB6isv636wF+bgD67QuQugMfx61Af6LP4ME8HxIS78jDDS2vlrYEdLIQogJIGLqrcgArPZQvbWX0ze31HUn0yeBfQT7jaVjvh6RfH4zEOsj2/c25AXADcEVZELYC3fBBHIzZ6Onnzp9PcOQhZ4kG5JEBZNihqUgtQ4CuRVjlwXhY9vXmwIdw35G9vhn4/fAzfg+3X5D064QRWSu97Pu5Aeg/CpC2Am3xAXwGs9CQD4CTaLNIiSrR0Qc+JTVTDJXthQ0AlUxBMgZJlgyC/jWwssPvg9Xd3Mk8V4MPIgevsqiVH+Afip/1s7gNo5N+t+kJfm4A+jYBqSpwH5UPgNIgzKCHWXSzz549l+jMw++oEbhTMLRTCfBBhwKDosnnCNd6TcWw/z2E/zn8zNvjdqyFHuHnBqD/rUALzDrfj6VB6ELri/0B0Jo6O+jw4WvOggBJM3u2Bu4Q3NRjz9FdG+29/50xY+Yh8vlBfz90+cHVXnDC71Vc+R/Bz/xuPcPPDcCzSoPQffYElqTexsqAaALLl/9wVAkwYFWFRBrAphXo4f0osdo37Pevp1X26tXrV/K5zcE6/0gf4wGfl3GrJa38d/tovM+fG4D35ANaYlIQSlFdsTLwNkYCsB2YNXTosI1wcEUpUCQzgMgAwm5XAA89C8dOXFBspZdr27btV8hntYRopo+xww9M9F0s9T2F+Zb7MOy/U28Zf24Anm8C91Im8CJuB0ZgYnA6JLPCSVJLDXhgbBaACftvWJmtNRix7OMh9wCwXwy7JuYi1HjPklKvp1UNGTJkK/mMFuB+f6yP8WRfXzTTJ7HU187Mnr+Znh8gbgCelRRsRZnAE5gTeAOrA5DBhgaW+eTCynOwz1UTKnkykUVKhvJse/2y/677Zf0F8plAWy/09U/2MTb4wH4fpjD/Cz/Hh7Dicpfe9/zcADzfBKTtwIOYGHweM9fQJ/AZPuSzO3Xq/BMpcWW7Ejgt6cDBg3GdOnVajas+lPi+xJC/P/ZVSMm+B/DzbKnXUh83AO/cDrTBTHUXTF71wYf7I3zYoall4dix43ZBCOwt4J86FXy9R8+eMLtvMeRGMNEHWX6o77+FIX833O/TyT7d7/e5AXiXCdyJD+99+DB3w4f7LdwSjMJoAGbYL1m6bNnJ3Lz8mx4Nfg8RfH8M97/Bvf4HaIwvY7QE7dUPy0J+j4SfG4Bnm4DUJ3AXPswP48MNDzm0sQ7AKsE4hAHKXv5gBNExsUWeAD0xtFtbAwKuduzYcS2CPwfzIJAU/QS3RW9gwhR6+jtj1HSPT2Nrr0ck+7gBeJ8JSH0CUnLwHtzPdsGHHaKBNxGCTxCKbyUjGDxkSMCp4NOpJaVl/9Ub+CfJau/nN/0w+Xf8gKG+tOJL4A/BSKgnbo8ew0RfO08q8XED4C/5lqA1PuQP40MPia5eWO4aQhnBNwjNYkiU+S9dGhwaFpajVeDBpC6FhuUu8fc/3bFjp7WY1YcuPhjXNQVD/Y/x39gX/83PYYa/I+7126BRSll+j4efG4B3bgla4cPeHh/+JxCG3pQRfIzQTEGIAKalHTt1WgMrK+ynIbx2J/SpqderyBXc8aNHj95H3tuPCP0CzGlAJDMB8xywxx+E0Q4NficM9+/FbZJ81W/mDQ8HNwDv2hLQ0cBd+PDfjzB0RTh6ISyDEB6AaDxGBTPRDKBbbnmPHj3+JKtuMIBI8gbFam0XUlKvV8MKv2VrQKTv6NH7yd+9Ev5+fB/zMZsPDTzQ+jwaDQyy+u9gCfQlDPXl4Evh/h3etOpzA+DRgJQbkLYFtBE8gVuDHgjPOwgTlA990QwgMvDDbYJkCN8TrSAJt19gVZ42bdpRAHbLlq3XAN7o6JjiqOiYEgsqjo6JKd5Mfu2WrVsj165dd8nXd/T+QYMHb0fYYS+/DPfz83GV98P3MR7f18dY3eiPBgYRzb8w3wHbnQ4y8Ft6M/jcALgR0EbQUmYEHRCa7ghRb8yWQ1/8exgZQFPRGAy1p+AKPANNYZ6P8RjtYsy+L8MVG0BeIdMP+HPfYxgPZrIIQZ+Lq/t0DOsnI/Dw947E9/Eevi94f9DrANenPY1G1hmTe/dhEvQub1/xuQHwl62I4C6E5T6EpzPC9BSaAWTOX8V8wQAEcAQmEEchnF9iOA7Afo3wTkOQZ8g0HVfzqbjNADOZiKCPw5D+M1zhh2OOoj/+/a/i+3kBoe+KVY6H0cja+hh7IVpx8LkB8Jd9RtAK4WmLCUPJDKCXoBtuE15AAF/BFfhthHMwbhuG4yoN8H6KqzbA/Dmlz/DnwEA+RDMZhqAPxNUdYIfe/Jdxa/IC/v3d8P1IK70EfRs0spY+jY08Hl3P5wbAX0omC29DaOio4G7cIkBk8ABuE7rgVuFJjBCeQzhfwmRiH1ylX8d9+VsIcz9UX/yxN9FAXkMz6Y2gv+hjbFx6FrcjsMI/isB3wPdxH76vuy1A35yDzw2AvxwzguZmzKAV5gvaUIZwP67AHRDOR9AYnkBz6I4GAWH6Mwi0pGfwx5/CFb0rruqPosF0wpD+Qfx72uHf2wbfBx3ec+i5AfCXymYgGUILBK8lFSFIptAWQW2P0D6ABvEQwtwB9TDqIQT8Afz191Gg34N/dmtqhb9Ttspz6LkB8JcLzcCcIdxBmYJkDK0Q2taou61IAlyCnAb9DtkKLweeQ88NgL/cbAiSKciN4XYKYFu6XQb5bdSf2YwDzw2Av/RpDHKDMKdmHHLPMID/D/r+VOGJMlyYAAAAAElFTkSuQmCC')
+ICON = b'iVBORw0KGgoAAAANSUhEUgAAAQAAAAEACAYAAABccqhmAABGaElEQVR42u2dd3hU1fb3AyqCiILYaDYE6/UqzS6oVEGwooSiIEWFUKSXgIgoTSxICyC9JHRCC5AEQkivpDfS26SA/n73ve/713n3OrNOsudkyp6Zc2bOmdnzPN/neqnDzPl899prrb22jyAIPpbEX/zlQa9mZtQcJf9x3b+scW3CODcA/vJw2CXIb0PdTnSHGd1O/ZrmejcDbgD85a0ruznYWxC1JGpFdBeqNdHdqNb4Y/Dzd+Kvv13PZsANgL+8GfY7KdgB8HuI2hLdN3369CeuXo0cfuVKxIicnNzF8fEJYyMirg4/ffpMX/Lz7fHXtcHf25IyA10ZATcA/vLEUN4S7C3NwU70QFhY+AeZmVlLSkpKD9XW1pXcuvW3YEn19TdvVVRUnk1Nve5Hfu/9+OfcTRkBHRFwA+Av/nIj7K1xpb4XYb//+PETbwPspaVlhwyGmjRrsNsSmEFGRqY/+XMfRCNojX//7XowAW4A/KUn2M0BbxX2EydOvJ2SkupXWFgUUFVVfc0Z2K2putqQfuDAwf64PWiD7+kOfK/NuAHwF385DzudpKNhbwewb9q0qWdMTOwXubl569SEXa6bqDoSDcTGxc8i7+UhfF+ttG4C3AD4Sy+w0/v29lu3bn0pNjbui7y8vLUAO4TirgJeDr5cUdHRs8l7fBjfq2QCmtwOcAPgL1fC3swR2L/9dmpXSNLl5eWvheSbrSSdO+GXdPjwkVHkvXfASKClVnMC3AD4yx2wWyq/wf5Zysj7awV2e8CXVFtX//f7w4e/iNuBe6jEIDcA/vLYUN7ejPwDly9fHiGV35zNyGsFfkk5uXnHyb/xcfh3otG10FoUwA2Av5zdtzOX31yVkXc3+LSmT58xgPzbu2CishW1FeAGwF8emZEXYd+4ETLyMV/oDXaxtl+SKNRmnRJqEjcL1VeXCFXnxwtVF78VDLHrhdq8i3YZQGZW1knyeXTHpGAbNEnNVAW4AfCXMxl5WNXab96ypQdk5KXymzsy8g7DXp4p1BGoa1N3CYaolUJVyHijzjdVJegc+e+IxUJ91Q0mA6iprfuHfEaQC3gUzbGVlnIB3AB4ks6+jPxUkpEPv/xBXn7B2opKkqSrqy/RTShfXSjUFUY2wF4twc4AfeW5L01UdYWYQG2lZfhv3mrQ3r1755DP7ilMCNK5AG4A/KXtjHw4gT1fhL3KCPvf/wgN0gPsGYGCIZrAHvqtCLwz0IMqzjaqOn6TTfhBJDoKIp/lC5gLaIsGq4ltADcAnpGnMvJXRmRlZYs98jU1tWl/07DLpSXYa6uM+3YCe03ceqH68myh+sIEAvsExaE30ZkvTKMAGfiSSDmzkny+fYi6+hgPD92llW0ANwCvzciffBtOsxUVFQdIsMulVfAB9jqE3SDBLskF0IPKUTUFV63CL2n+/PlfkM/9GSoZqIltADcAL8jIQ4+8BDs5tHLNHOw2wXcT/CLs2aeE2qTNQk3kElPY3QR9g05/IVTFbbQJP4jMEdhAvot/a20bwA3AwzLyW0hGPi4OeuTz1wHs5OG7ZQt4raz69RUkI59PMvLXd4mwGwjcBnPAuxl6WhUXZzEZAGl0yiPfT2+iJ7S0DeAGoOOM/FSSkZeSdJUkI28v7O5c9cUknQj7bqEm5ifBcHGCUTqAvkzUOKOCxwm1pelMJtCrV+9BsmrAHe7eBnAD0ElG3hT2qrN1JCPvKOyuXvUB9nqSka/LCDLCHja1EXidQk+rKnEHkwEEBgb9RL7LfxF1xi2a25uCuAHoKCOvtNQAX8zIl5J9e2aQUJvwq1ATDrB/hfIc6EGloFPjhPLQhUwGQM48XCXfbS8f4/kATTQFcQNwP+wNGfmysnLVYFcr3DeBPWKOUHPpKwp4z4W+UWNF1VUWMJkA+b5f8zG2Bj+Iz8Id3AA8K0nHXH5jychradUXYc8hGfnkLULNNX8Rdkmugf5LTUEv6uRYoYSoOu04kwFs3759IXkOnifq5NN4TNhtJwS5AahTfsMRVZt7GqfWOJaRd+eqf5Nk5OvzLwl1KQT2KFPYOfRG6GlVRK5hMoDk5JRz5Nno4dN4NsCt5UBuAApm5KWpNe6G3d5VvwH2tN1CbezPQk3oV2aB59Cb0Qmjik+MEeprKmwaAHYFvkL0pI9xTkBrd+YBvNEANJ2RVxv8m4Yiob7omlBP9u11BPbay9OMwHPoHYKeliHvClMUMHfu3PHkOXrWxzgyzK1dgd5gAE5fGgGwq52RVwP+m3XVws2yJKE+67BQF2eEvTZ0oigOvTLQFx9vVEX0BiYDIJOLD/sYjwg/gttFt20DPM0AFMjIn3gbYC8r0w/sIvA07Im/CbWRcxtg1wL0lR4KPagIVXxqEpMBFBeXQFfgyz4aOBykZwPQfUbeKeAJ7Ddzg4X61K1CXfRSoTZsolEuhL6KQy8UHQONblDNjTgmE/D19f2EPINP+7j5cJBeDEDxjLyuYK/MEm7mnW4KO4deE9BLKiSqiNvOZABnzpz9w6dxRoDbugK1aACKZOTxQIzmMvJMsN8IFerT9wj18auEOgJ4nRx4Dr2moC882qjiM35MBkDuE4SuwN7YFdjeXV2BWjAAr8jIm4WdZORvFl8TbmYfNsIePoloIodeZ9A3ylcoPOIr1FWwdQX26dNnIHYF0oeDvMIA5MA7lJHXFewkSXeLhj3CD4H3dOi/8Arob1CqTD3G2hW4yN1dga42ADn4d1Cre5Mk3ZUrESP0mpEXk3QAe/LvQv21eRTsHHpPhL5Bh32F4vPz7O0KfMxdXYGuNAAafGkP3xqd776AgICXrl9P029GniTpbl7fKtRHzRPqm8CufegNCZuE2oIIMv/+Gw69A9BLKhA1SqgzWO4KrEcZamr+hzz7rxJ1c1dXoKsMoJlsxYd/aFs/P7+upAw3vbZWR6t7WXIj7LHLhPrLk4zSIvQhqLAZlld6AjyAT2b5i4LhFpUXvuHQOwC9qCCjqjLOWYVf0tq166a5sytQbQNoRsHfAkN9WPEfIOHPdK3v4W9VZQm3CkOFmxl7hfqEVY2w24I+TAPQI+jVkd8LNemHBEPiJjLLfr5JeF997UdxpZLgNzWBrzn0dkJPqyR8lVXwJUUbuwJfcldXoJoGIA/5YdVvN2HCV93LyyvOaw72miLhVkmUcDNzr3AzcTUBfHJT4HUCfYMI8DVph0xkSN5JrrsippB5ogn4chOoCPmaQ28H9PmgQKMKjk6wCT+o3Hg4yG1dgWobwG0Y8kM2v/2YMWOeITfApmsF9ls5R0TYb0ZOF+qvTPYM6KXwPnS6YEjd28QAarLPCHVVxVbhl5sAM/TB3g29UZ83qCrnslX4JY0aJXYFumVkuFoGQIf9AP/9o0aNetZgMGS4HPZ6kpEvTzbCnvK7cDN6vnCTwA7yGOjlh21CJpGQP6AJ/LVF8Uzgy02g/PzXHHpG6PMONaok4ncmAzAzMtxlXYFqGIAU+kthP3Q5dSHnoKNdAjzAnn+6CeweDz1VsoOMvgn8JNyHkVX2wm9iAue+1jb0R9WDPt8O6GkVnJjKZADFpiPD27tyG6CGATTHN98KkxqdSXnvdzVhv5UWINyM+164GTG5CfDeAr2Ura+O+cV01ScZ/rpag8PwN5pAmlB2bkpT6E9x6E100Kjcg5+JMhSnMZlAr97uGRmutAHQ+37I9neYP39BP/IA/a1URv4WSdLdgn07wC7Jy6Gnb6wVE33XidKPCLXl2U6Db2ICJcQEzk7h0NuAnlZZ3F4mA3DXyHClDaA5OldrzGg+Tu6MP+5Qkg5gzyKwJ60WbhHIb9HAc+ibKvQ7I/hENTkhiqz65lRDTKD0zBQT6Es49KY60KiC4NlMBpBhHBne08fFI8OVNAB69QcH6zRgwMCX7Vn9xcx8zAIC+xQOvT1tuBf9hOqUvSL8tcXJqoDf1AQmuwf6I9qHPofW/s+EmvJ8mwZQbRC7Al0+MlxpA7gdExiw+j9x7tx5f2b407dx6B3pvT83UahOCBAMWezlPaVMoOT0ZA69Behz9o9sUEXaWaYoYPv2HTAy/DmijriFVr0cqKQBSJn/NtjW+Aw58xzMBD9k7Zmgn8Shl3XkVcdvJFNoolwGftNI4FsOvRnoQdmgfSOFwos/MRlAVHSM1BX4qKu6ApUyACn8b4l1TKhn/pt0/OWw1OmhEUdv0Fe7EXqpI68q5jenynuKJAZJ1FF+bb1QHDzJM6E/4Bj0ctVCyzVbVyA9Mlz1cqCSBiCV/tpjPbM30+oPvfYagd6gA+jLafhVSvQ5YgJVKUFGIzg7XRnoD+sfelF7PxWyiCqywpmigHnz5n/pysNBShqAlP1/EBMZrzMZAOnQ49DbceCGdOXV5EdoAny5CVQSE6hM2i+UR/1BjMDPg6Af6RD0tArDf7VtAORzDAsL24kjw6WuQFW3AUoZgFT+uxv7maGvuS+LAYhDMzj0TAduKiNWCLUVBZqD39QEAkUTEI3g2h/ijDxvhV7UHqOyD46zCr4kMg8DugL7uOpwkJIG0AIzlx1xzNE7dhkAh97qgRtD+gnNgm/RBBKNKiNGUHR6mrah36889KDMBn0iVBddtwq/JF/f0R9TI8PvVnMboKQBSN1/nbCj6V3S/19tcwtA5uRx6C2dshsnVIQtFHvx9QC/iQkkBwoVBH5a5THbxHFZ3gR95u5GFV3dYhV8SYcOBf6MI8NV7wpUywDgzfcnXYBpLOO0OPSm0EsHbqoSd+gKfBMTqCwWKsyYQEXiPqGMGEHRubleAT0oA5UdNIXps8OR4b1cMTJc1QiAXMQRxjIam0NvOkCj/MJMoaYwTrfwNzWBfUYlmKosOkAoOjvXo6HP2GUqQ1ke02fXu7drRoarmgM4c+ZMIEsegEPfqMpra8mYrnLdw29iAkmHGqAvN6NSYgSFYASHx3gk9Bm7PhaVvvNjoSQ+iOlz27bNNSPDla4CSF2AUMfsR044/cVkAIy31noq9KLIKTu4XtpTwDc1gSLRBMotGEB5vFFlsTuFopClQl7QGJdBn2UD+kwFoKeVe2oR02eWlJTskpHhapQBH8IM5luLFi1mOgsAV1d7I/TSAI2KKz+Q8l6+R8JPm0A5bQLxllUWs1MoDPEX8gLHeAT0JvrrY6G22naEZzC4ZmS4qo1AS5b4L2aKABJ+9TroJVWnHfdo8JuYQOIhy+DH7zVRacxfQuF5fyH30GjdQ58m6iNRpSmnmT6vOXPmjle7K1DpVmDpJOCT2NP8AYsB1GcGeRX0cIa+PHSheJjGW+C3ZAJy6GGAhlyl0cQILiwXcoO+tAP6TzUFfYN2fCQUXFzH9FlFGw8HvajmyHA1zwJAN9P7TFsAMAAvgF5SZcJ2rwPfnAlYg96ciq/+qVvoJV0nSt8zmulzwq5AVUeGq3EasB0mLmC6yXvZ2Tk2JwHfLE1SFvpz2oMeVBYywyPKe0qZQFnCQWb4S4lyD0/ULfQN2g76UChPD2X6nHx91R0ZrrQB3IkHGB7Bc82DcnJy01kMwFOhlyblVESu8ajynitMAKAvjTWq4OwS3UNP60b4JqbPCEeGv4CHgxTvClR6IIg0DqwzvukBYWHhZ1i2AVqCvkwh6EWRqTmG3CsceGvbgZSTZqGXVBTxp0dAnwraZlT6/olMn09eXn4yjgxXpStQjYlADjUDqQ19uZrQWxiKWX55uceX95RQXY1BNAE5+KWxe0TlBH3lEdDLVXUjlbErsPdAtUaGK20A9JFgKF/0Xbdu3SomA7i6xH7oz2oPemlGXpUXlfcUM4Hkkw3QSyo4u9ijoE8J+KBBRbGBtj8XItJQtxLb6+muQEW2AUoPBZV6AR5Cx3pj8eIlS1gMwBC1UvfQl5CZeGUXF3hleU85EzjRAH/RlQ0eBz2tjEA/q+BLSjR2BfakugIV2waoNRX4Aexgem3o0KGTWAygJmWXbqGXBmJWxG/nICtlAjEk9A/8yuOgT9lqVDLKUJpnFX5QVbVBGhneTemR4WqOBe+KNcwRTN2A6YHah/5EU+hBJefITbw3eHlPSRMoIQbgqdAbNUJUSVKwRfBpkZHhC9QYGa7GxSAtMUx5HM80DyPTgQ02m4HyLuoKemkEdvnV1by8p5IKw9Z7JPTJWxqVfWq5TfhB16KiVRkZrpYBtMM3CqeZhpBmIJu9APUlibqBXhQZg13Ny3uqqyhis8dBn0Rr8wib8IPKyMxwNUaGK303IH01WBfsYx6Ymno91qYBlGdqH3pUWdj3vLznQpWRwzOZ+8Z6FPS0Sq9fYjKBufPmfYldgYodDlLjctAW8slApJspiCUPoGXopcsuqq4f41C6QfnnVigOfaoboU/aPFxIBG0aLuScW8NkAMHBp6Er8N9KjgxX63ZgaTAIJC3eZh0MAjPvtQg9XGxRcmE+L++5SQWXfmGG/rpmoR9uAj2t1N0TmAygqLhhZPgTSh0OUssAZINBFjENBqm6ukJT0NOCiy54ss/FbcJkcEb20ZkeCX2DNg4XEogqClKYTKBXr16DlOwKVNoAnBoMUgkGoCHo5ddalV5ZzcF0kaoLU4WMvWM8Gnqj3heVe3EDkwEcCgz8CbfWiowMV8MAHB4MAvfbaw16uSpTeQ5AbcHEHG+AXtSfRl3fP5XJANJNR4Y73RWolgE4NBgEDECL0NNXWhWeIGPLinkuQL39/jqvgT5epqqSXCYTwK7A7kp0BaphAGYHgxQWFhXabAYqTtQk9PK77IrJpRZ11TwfoPh+/8gMr4M+foOkYcKNqINMBhCwbftCpUaGq2UADg0GqStOUB36QgehN73Hzlcojfydg6uQ4FgsjMlyKfRbtAE9KA6VcXwpkwEkNo4Mf9TZkeFKG4DDg0FuwWSguipNQy+/x64y/SwH2Nn9fvJpr4Y+7g9TGarKHOkKdHhkuFoGYNdgkFuUtA49fZddwTEyx7D4OgfZoQtEy4V8Mh2XQ9+oWKLC+JNMUYBSI8PVMoAmg0G2b9++wRr4ksouLdA09Kb32I0SCs/M4UDbKTgCm3V4BoceoY/9fWiDMoNXMRlAlEIjw9UwAPlgEGgGenMxmQxiC/5bt/4WysgYLWWg91UNevkFljDimoPNpsqcaCFtt6/roN/sDPTvuwR6WvGbPmUygEKFRoaraQDywSCTrYEvqSJ6gy6gl5R/bLJ4wUVNaRYH3OZ+P5hDb06/DRViKJVmRjGZwCgFRoarZQDywSCQsBhhC35QVfIBzUNvInJ/XdHFH8QooJaXBi0O+AD4r+/y5dBbgN6o94SYX98Tss//wXY4SIGR4WoZwG3YDCQNBoGxxu8bamr/1xL4kuCuPM1Db+bW2vwT34pjrTnwpqqpKBJKEo4JWUdnewf0vzsGvaRoooSAcYxdgRlXnR0ZrqYB0INBxGagLDIYxBr8oJrCeN1AL7+1Fi6uLOUmYFLfL4reJ+RfWMehtwF9g9YbxdQVWFfv9MhwNQ1AagaSBoMMSklNjbMGP6i2NF130Mtvra3Ki/F6+CsyI4TCyF3CjSvbhOs7fV0OfYIOoZcUtX6IkB95wCr4kgICti1yZmS4GgZANwNJg0Fgn9I/ODg4yJYBgPQIPa3cwC+8Nh8gDvQkIT/AD8o8Mlsx6BO1Cv1vykAv6hejEnd+bRN+UGJiklMjw9U0gBaYmewoDQYhk4ECWQxAj9DLb6yFu+y8sb5fGLWvAf68kHUcejugl8tQWWYRfElVVdVOjQxX0wDoZiAoVby1cOFCfxYDKLm0TJfQm4jcZAOjrb2mvp+X0AC+FPqn/uXLobcT+mvrGnUj9oRV+CWtWbPGz9GR4WoZgHwwiHRL0GJWA9Ar9PI77Dw9HyCW+FLPm8Avhv6Hv+PQOwD9tXWDG5QatMQm/KBr16IcHhmupgHQtwTBoYVXn3322dEsBlCRuF/X0NN32WUfHOex+QAo8RXHH6PA3ykUXt0p5J1fy6F3EPpra42KJIr+/SMmAygrK3d4ZLjaBiAfDDLcHgPQK/RZsnvsCkJ+9MgSn3G/b4Re0o3LAULKjlEuhn6Yx0BvojWDhaKkC0wmMGrUqE8cGRmupgHQtwQ9hmOMht64UVhoywDgwg29Qy+/1qo04bDHwF8OJb6rMvBRGUHfceidhN6oQaLSjq9kMgBSYXNoZLgrDIAeDDI4Ozs73ZYB1NyIZ4Y+V8PQy6+1gkGXet/viyG/DHpJuST059A7D/1VSjGbRtuEv5YIDwf1sfdwkFoGYG4wCLjTgOjomHBbBlBfU+kx0NNXWmUHTtFtPkAs8V3b1wR6SQWXtwrJ2z/n0CsA/dXVpirPTbIKvyQcGf60PV2BahuAmVuCTjM1A3kK9OI9dtRddnDDjR5LfJbAl5QeOItDryD0oAjQqoFC1oUAq+BLOnjw0M/YdNcZI2+bXYFqGwB9SxAMBum3bdu2DSwGUHBiqnug36M89HLBXXe6KfGlnLcMfoRRcLUVh15Z6GnFBUyyCT8oLb3hcBB9c5DVKEBNA2hm5pagNxctWryEqR04xN+joKdvt0knF15UaTwfUFNuLPFZgl5SfjgJ/bd9zqFXGPoG/TxQuEJUWZRjEXxaa9f9MpUaFWbzbIArDEDqBYA55q9NmjR5JosBFIX+7FHQyy+6gBHYMBdPkyW+glTT/X6EeRUQpR+axaFXCXpa+VHHmQygqtrwz8RJk96jjgjTUUAzVxuA+cEgDAZQRqbseBr08ssuYCim5kp8GRE2oTfqLyH77BoOvULQX/nZnAYIV34yKunAQiYDABWXlGZjFNCJKgne7g4DMD8YxFDzv7YMoDz5qLrQ73YP9PLx1zApRzMlvrhjNqGXlBe+RUgK+IxDryL0l2WqrihlNgFyhdgJ7Ax8iGoMarIVcIUBNB0MkmW7F8BQEOex0NPTcGFAJpTY3F7ii9xnE3pRV4xKOzjTSeiHcugZoL+0/B3h7OK+wom5bwiZoXuYDQB0PuTCIuTO4lbAFQbQZDBINkwGYjAAT4VePhgzM2i6+0p8uQnM0EvKPrNacehjbEAf7QXQh/34rnB+aT8R9qAZrwj7vukt7JrUU9iJOjL3XaE0J4nZAKoNNX8PGDiwN54SvNfcVkBNA3B6MIhHQb/N+jTcgrCNbhjUeZ4Zekl5YVuExK2fceidhL4B9nkE9pmNsEuSoN850VSnlo2waysQFh6+BvNvD2BFrgUdBbjCABweDOLp0MtVlhbqmpCflPgKowOZoad1/eAMDr0D0IfQsH9LYJ/c0wR4a9DLFfbH1/YmBJ+nmoNMzgi4wgCaDAZZt27dKqZmIDJVx9Ohp8dlpf41SvV8QGVBinAjcq9d0IPyibJI6M+htw19yNK3heAFbwpHv3tNODCtjxF2SQ5C36geohJP/MlsAph8N3tGQG0DcGowSMGZJR4NfbKZcVnph/zUu5jj+iW7oRd1+S8hN3SLkLB5JId+lTnY3xJhP0hg303DriD08PsOTO0jHJv9mnCamAtEFAXx55kMYJ2xOcjsUWFXGIDDg0GKI7fqEPoP7IZePjUH6vBKgl9NRkwXxR61G3paqQdmeD30F0lG/syivgj7yyLskpSFvocI+5FZrwqn5r8hXCCwh/7wbhPFbPdjMoDNW7YskR0VbugOdJUBODQYpJTM1PMW6OWTcyqyo5VZ9VMviUm7pO1jhJzz6+2CXlLW6dVeB70IOym/HZ/zuhA4/RUCeS+U8tAfmPoygf01Avubwnn/fkLYineFMDPAi1ou6R2xRMhiACEXLuzBeRyPU5ODXWYAZgeDkDFGBlsGUJkV7lXQ00M04GhtDbkr3hn4AWp5nf46qd9DJt8W9PmXd4iC0B8urLQJ/a/6hb4B9rkE9hk07MpDf2CaGdglMULfoO/ZDODsufP7LI0Mc6UBtMWmhB5EQ1gGg1Tnx3oV9PKz9BlH5jl2kIcYR1rQXIt1+oQtI4XMUz9ahJ5W6v7pHgV96I/9hXMEvJMEQBH2Kb3MAK8M9Pu/7SMcnvmqmP2HZp6wFf1NgXcQelosBnD6zNkDkHvD8zgmo8PVNgAfqhnoXtyDwF5kIMtgkNqKAq+DXn6lFYTo9mb5k/8az1SnT941Sci5sMEs+PnhO4Qsclc9czeeBqEPI7CfJ0k6Cfa9pNYuAq8C9BLsJwns55b0Ff9uI/DKQw+6CFrGZgDkEtGDcBLX3LAQVxiA2cEgwcGWB4PcpOSN0MuP1pZnRTHBXxR/0u7mnLgNHwhphxc2QJ+Hyr20WYjb+Kl2obcA+ymSkQ+c8aop7ApDv/fr3mJeQII9nPzdIFdBf3HZ26KurBvJaACnwQDeoq4Sd7kB0INBxGagQ4cC/7IFPygrcLJXQk+fsEvZOd5qPgB+TqzRO9Gck7DVV8g6+0uDAaTsm87Ud+8O6C+T5poLBAaA/QjJyO+HjLwcdoWgByOB6AGSgQB76A/vNADvDuhp5cedYzKA+QsW+KMBuC0CkA8GIbcELfK3Br6k3FOLvBJ6+Sm7jBPLzIf8+SlCyt5vFWjOMcIO4GecWKEZ6KGT7sLyRtghibaHrMC7v+6tOPTQjgs9+JAMhDwBwErD3gD9CvWgv2gD+gskyonbPV8oTI1gbgR66qmnx7lzCyBvBoJExOuTJk2aZQt+UB6Zoeet0MsP3NyIOmgCfwkp8TnXnMN+ws5V0ENG/tRCU9gl7Z6iHPR7yO855PeyePAGEnShBN7wlf3NAu8s9JecgD46YJqQcnydkHP1qFCSnWjXaUBQTm5eEeHtI7w/sDtWAVyaBJQPBnkSSxIf3LQBP6g4ardXQy/f08OKD/BD8k7v0Evlt2MkvD5E9tQ07EpCv+drAvv0RtgBwssrBxiB1xD0kRvGC4mHlguZl/Y4BLs5/bVz137ouyF62Vw7sCsNQN4M9D6LARQRA/B26Gkl7fhSDPn1Bv1FAoexseYNi7ArAX0D7FB6W9IIuyT1oH/HLugj/5xAYP9BhN2ecN4elVdU/qfrk09+DfdxYPm9yd2BrjIAejDIY9JgkMys7AxbBlCZF+v10OttpRdr7VL5bfqrYtbcKvBOQB9IYD82h/THL3qLJAbfNp6tXzlAGeh/UAb6BthDAfarqsBufkDout2Es88h6Y4nAjvJB4W60gDulN0SNCiLDAZhMQAOvXahD6NgP0w63PZ+3ccm8I5CD6U3yMafoWGXpBHoI34hsxL2zBfSz24RigjsVXac3VdSFy5eiiWMTcTw/1UzTUAuOQxk6ZYgGAwyIDQs7AzLNoBDrw3ow1Y2NtaIsH/TB4FXHno4bGOEva+4ipobl+Vu6CPWm8Je7SbY5UpITMonfE0jGgUDeHAS16PUOQCXHQc21wzUEcORd0iHUiC7AXDoHYN+iEPQX8by22kCIMC+nxxYEYFXAXqAHU7YwbFaOF5rbUaeu6AP/3mYJmGX6/CRI9cIW98RfUE0DBPu3bEBqI2rJwJZGgwCI4v7rl27bpVNA7h5S5yZpzfo42xAH6sh6C+To64i7CRJd/g7GewKQ3+QlN6OzqZhtz0Y09XQh//8vnjUNv3cFvHMfUVhtiZhp5VfUHDziy++3IHwT4AqGzb/PI8t+E1Wf1caAN0L8JA0GGQRmQxiDXxJWccXcOgVgh5q7RfIw94A+zQzsCsE/X5ypv0wOdMeTOr6Icvetmsarqugv7zqfSGWwJ6hI9hNZ/5dzpkxY+YhwtNiohlE44k+hGv4MPR/XDYP8DZ3GQA9GKQbNCa8N3ToJGvgSyoI28ShdwB6gB0y8gD7UbKfPkiSaHvJoRVRCkMvwQ75AYAdYLV3BLYroAfYr5/4RbhBYK8ksNfpCPbU62nVJ08Fp5Hs/qXRY8bsJQz9gODPJoJy3xhM+vVF+LvignuPpctB3GEA0i1B0Jgwwhb8oMLIXRx6G9BLsJ8hte9jc2WwKww9RA2QF6Bhd3TuvZrQS7DnRR4Vykhjja3rtTUJ+9p1l3xHj4Zmnp+IVhAtI4J5/3NxxZ9CBK2+H0NlDTv+XsB+m4dk48Cbu9MA6MEgj+NgkGGlZDCIJfAllSYFc+hl0Btr7f1E2A/NMAO7QtDvI39GEDnmCr34UAEIJ9A6e9mFGtCzwK5V8HPz8m+RiliuBdhhnNd8ojkI/LdEkzDJ9zmG+4Nxv98TT/w9ipG2tPK75W5AW7cEiYNB4JYgWwZQkRPt1dCHrjTCfoKsuEEkzN5Hwm2Q0tDLYYcav1I33CgJfdSmr4TkoBVCdtheJti1BL8E+9atAZEAe8eOHX+xAvtUXOEhqTcWgf8Yw/zB2ODzGoL/LK76HbHjto0t+F1pAOYGg8AeZWByckqsLQMwlOV5DfRhK42NNScWmMKuBvRNYBen5gzSFPRRmwnshwns4XuF4utX7YbdneCLsIeG5W4xwn6AwL7eTtg/gW0ydM1C3wwm9t7A7fNLmOHvjt21HXF7fS9utVtYCvvdZQBmB4OcOhUcZMsAQJ4IvVh+Iw0lwaSzzRzsSkIfJI2mWtJPuERWUdNRWdqAPmrzRAL7j0bY0yKFOrjBCOQE9K6Cn2xl/xsdE1tMYL82bZrfUQL7r+T5/pFoORGcx1+IsM9kgH0gru5vYB2/J07Seg4raF0xiu6E+/z2CH5ratWXsv3NrEHpagMwMxjk0F8sBpC87XNdQ395lbHWHgxjpWe/bhF2JaCXRlOdJWfaL61418J8PPdCH/n7KCFh30Ih4/xWEXZDZVkj8LQ0CL4c9h49emySwS4l6WZhRx5k6L/CZN0oO2F/Elf4LsjNQ7jSt8PF9G6s799Jgd/cFviKGgCjOVgYDLLQn8UAYECmXqA3gZ2U36CxZr8N4B2FHg7bwAk7cYAFwG51KKZ7oAfYE/cT2ENswK5B8O2AHRpw/Ii+wR58SNKNJvoUm3KG2gl7Rwr2+3CFb4Or/F240kvQ306D7yirahuA2cEgcEsQkwEcnscG/QbXQg/AXSIPOay2Yq3d7xUEXnnoYdbdcXKm/czifuQs/buMk3BdB33g0g+FK2uGC3F/TRcy7YFdQ/AD7PsPHIxf4u9/ZtDgwTvshH0kZuWHYZLuXczOv4pVrxdx3/60g7C3kAFPr/Z2N/e4wwDMDwZhMAC40srd0F9da6y1A+zHsLGmEXZloW+AnezZ4Sy9NERDC9CfXj5U2Ov/qbBhwRfCitnfCAtmzhC+nrZIVFl5pf3Auwl8AnvJ/gMHEpYsIbAPEmFfqQDsr+FdfC9hnusZbHx7XGHYmzmb2XeXATQdDMJiAPQlFy6A/hpda8eJNdAAI0ph6CFqgLwAbBlE2GWTc9wF/YUVg4WgpR8JWxeNEVbPnSz4fzetAXRLik9MdTn4dXY01hhhH/SXrNa+GDPyAPt0J2Hvjs/2I5ikexhr8vfhcXhp364I7HozAHODQYZmZmZl2OwFIFdlqQU9NNaEEyjE8hvU2kkS7YAEu8LQQ9QAWwU4ZQfZeADU3Lgsd0C/c8nnwvr5E4SlBHQ/v3k2YTenoKOn3b7q2+iis9RYM56C/SMnYW9vBvZWasCuRwOQDwYZzNQMJBoAw7FaG9BDY81lGvZZxuGTkpSEvgF2mENHEnQRqwdanZHnrpU+fucMIe3Ur8LMOcsdgp7W73/+5dJV307YrTXWDMGz830R9j4Owt4aYW/pCtj1agAmzUCXLoWesWUAtdXlDkEPGfkQzMiLsJNw+4Dfy4pDL/bHk9N1ADtUAOA8PctgTFdDH7+LwB78q5AfdVwoy002gXL1us1OGwCYiFrw55HGmjDsohvtGOzWGmt6YA/9sxTsjyoAe3M1YdezAXTGEsgAFgMA2YKehv0I2VMbYX9FcejhzzoyW4L9XTGioCfnRKoJ/c/s0MdsnSikHP1RyLm8TyhOj7QJJoTvzhoAKL+gyGnwCex/k+cib8uWrVG+vr4Hqcaa7xH2BSo01nTGWrtuYNd7BPBv8vrAYKj5XxYDoKfhWoddWegBdphoCwm6K6sGmo7K0gj0sQT2VDtgN6er1+IUMQD4c+yBPycn95+QkAuFf/75Z/zIkSOPP/zww1vIswE98qvwyKs/Aj8bk3RqNdbQGXldwK7nJKCYAyC90rtY4IctQMiPQ4VjpMPNPOzKQA+ww8UUId8bT76ZnY/nZuijNviKsOcS2EschN2cYOVWwgBMEoE2Vvrz50OK//jjj6R58+aFf/rpyOMdOnSARpvV1Fn3uQj9FEzU+SLww6kk3ZsK1tp1Bbuey4BQF+1dU1P7D4sBpJGJLUpDL4ddPGpraSimm6CP2jBaSD64SMi6ECDCXlNpvCOwTiUpkQiEXIIze/3y8or/xscn3Nizd28ImRq1tWvXrlNxpf8QV/l3cYXvg8A/ZyZJZw52R8pvuntp1QCayzsBT5w4uZx19T+5eJBT0IsDLMgJOxPYJTkM/SBFobcEO606laVYIlDh0l5efsGNy1cijs+cOWsirvY9EPxuVLLuQepgDB3KeyzsejEAev8vnQZ8vrCwKIHFALIijtoFvRH2t8RSH5ylNzsjz83QR67/QEjYPdMq7K6GX9FEYH6hat18VdWGfxKTkvetWbP2Q0zgdaFOxd1DnYprQR2Q8Vjg9WQA0kQgcSAIC/ygk8tGWIQeSm8npTPtpKZtbSimu6AH2BMJ7NkXA4SipAtCVXGOTdhdDb7iicDIWJf071dWVZfGxSf88Nnnnz+LJtAOV/9W1Jl4sz3z3ABcawD0UNAn/f39RzPt/UODGoAPJB16x/GYK8BuMjlHI9A7C7s74Vc0EXjktEtP7hlqav8mu4SgVavX9MFnrK2Z8/HNuQG4xwDk9wI8/csv66eyGEDk1mlCGNmzRxJgm4zL0gD0AHvG6d+EgujjTsPuTvBVSQS6aUgHGMHqNaIR0BNy7pRNyOFbABcbgMnNQC+99BLTIaC8sB2agT5xzywh4wzAfkIoJ110SsHuCvDJufb/p6VEoNoTeiAiSEvPWD9u3BdPUTPyWlGz8T02GtCqAcjvBuzP0gBUmZ/iFujjt002wh5DYM9TB3a14Cez6P65cOFi4R8b/kycOHHiJXJHfKZWEoGunssHOYJLoWFfUfmB1maiAW4AKhqAuRZg8XLQ7OycNGvw16Pit45VFfr47ZOFtOM/CXkRB4TS9GsugV0p8El5DAZP5m3esiWaJMKOYBfdBqKN8+bNDycr//+198+EI71KGEBoeKxQWl7bRBVVtUJldZ0oQ22dS4ygsKg4ZNQo32dxW3APRgPMs/O4ASgTAdADQfsfOHBwlzXwJeWGblcMehPYM641/j0uht4R+MtIg0xoWHgeOQxzzdd3NPTH/0Y+x5/xUIykVWR7FUCGXZQ6aiow1MP5LcAK4UBQiJBbYGBSQZFBKCypEQ1CLWOAbcHFi5cmYjTQ1p7pudwAlMkBtMEcADRw9Bs/fvxcW/CDaqrKheg/PrYb+phNY4SUwMVNYaelUfAB9pjYuOKtAWQWnV/DLLqV2CIrnX5biD3y8/F/F/322+/nyisq/uvsNmLBklVOGcCipeuFjVsPMRuAJVMoLqsRDUFJI8jKztmBC1F7TEx71JZA61UAaSAotHJ+UlJSarAEPq3ilItWoY8lsKcGLhFyLm0TYQfTsPVnagV+C7DLZ9HNoybWTMWpNVNQXz/22GNzkpKT85TKI8C5fkfh/27ej8KyFRtEOWMAtPJuGISiUuXMoKS0LHrkyM+ew5Ih0yUa3ACU6QOg7wZ8f/fu3fvrGQwAVJoZJaQGLRGS9n6HsG8nsEexwa4h8AH2AwcPxVuBXT6LDibWfOljvPwReuI/w8k1oM9nzpq1sqKy6j9KgF9ZVSeG4ocOhwjfTvd3KPSX4AfFJOQoZgKS8gsNQllFrdPbBGK8GR9+9NG/sIX4XjN5AW4AKnQCtqOmAQ18slu3ySRT+x+7AHZGLoY+lsB+kMDu77/0zGDHpszCeKr38RDMIBxk0R+Pvb53KDBou7PQ19TWi3tvAEuC7GpUuuC//HdxNWcB/xu/xcKcBatM4AeduxiruAHQUQG8b2eMoNpQ8/fmzVvew/6Utp5gAlo1ALoXoANOXoFZa58GBR0+5QngE9hLSGIzgXQ5SrA7MmX2feqYK4yneh2jpd543LU3/v83ExKTzisBPoAkhys9q6wBYjACgHvG7OXCtJlLG6CH/4Yfm7dotfhr5PCD7EkEOmsEzpjAnxs3DcXnkjYBXW4HtH4vgNQO3BWPcw6D456qRgEqwJ6Wll4dHByctm7dL5cUnjIrzaKTxlM9hUddu+N/P//6G2/0JXMUr6gBPq0163eYhdoeOZsItHdr4GiOAExg/oIFb3mCCehhIEhbPMEFD/k7sI8lFzFs0Sr4NOyjXTNlVhpP1REfyI74eXV9993+L5eWlWU7s8enQ31r2rbzmNMGoGQikFWQw3BkW0B6JjKHDRv2Em4H7sVnVXfVAS0bgLQNuBsTL3CW+xUMeyeQ6a7h7gbfTtjVmjLbDk2yLZ6ehM+qy5D33utJEldZjoBvqKkXbhTX2AXSkRNhihiAGolAlmigymCHCYBhEBUVFcdidPogVgekEiE3ACcNgK4GSMnALghEPx/jHWrfkEaNOFfBn0+66MLCwnMDAraJU2YduKtdiSmz9CWP0ngqSXfjz3cYPnzEiwT+TIcaeypsh/vmBIlAJQxAzUSgLZVX1jKBTys19fpuH+MosQfwO2ihp6Sg1g1AHgV0xeTWIAyZ/Y4dP35VafAVhl3pKbP0xJo78P+3wl8Ln9FjBTcKLzqy14dw2FF46ESgM3JFItCaoH+AFf4a1NFjx6ZhdHYfmrFu8gFaNgB5FNAW97fQGARjnoYicNPHT5gQcKOwqN4R+GGmHIE9L4A01hDYD1gZKa0E7EpMmaV1OxrA3fjnPJKTm3fUXvirDfXMe31r+m3DXl0lAplMwAz4NPwgMnXo7wEDB/bGiE1KCkr5AG4AThpAc6oicB/C8xyWvIZhwwuAuWDWd98duHIlIruiovK/5sAH2KHWDrD7mW+sWehjelc7DbszI6WVnDLbjEqS0p9L5+iYmB8dSfQ5EvKb0+59wbpMBFo0ARvg0yLGG4rf+UNUPkDzWwGtGwBdEWhBrXQQMj+PCbMhuBJDNn0mrtjLevbq9cfYseP2jBkzdt+YsWP39uzZ808LsJurtftinkFN2B0dPCmZojQ1WYyM9u0/MNpe+Msr6xSF5tSZq4oYAOQTNGECJTVM8EsKDAqajs9Be/y+Nb8V0IMB0FuBOxGm+3HP9SxmzKFc9gGCOxEjgpkYus9FzcYfs3V98yAsN76JsEvz490BuzVDlE5MPjRs2Psvwek1d8KvZCIQjEQLBgAqK6+xCb4kkngtx2dS2gq01HpVQE8G0Fy2522PibPuCOjrWEp7H0N1Xwzdx6Gk3niW65vpyyJcdlc7I/xSYrQ1JgwfJ2OtLrkbfklKGABsJbRiACCYScBqAlFR0ZvxuXmQqgpoNgrQiwGYM4HWmDx7GFfkpzEsfxlX73ew3DYQ1R/DeEuNNd18ml4W8YAbYbcV+oul0WtR0SvtuV4bSl1qwqJEIhD+DC0ZQB5RdQ2bCZAu1X/69ev3Gi4a7aiEIDcAJw2AhkDKCbRCMNujETyCZbWncRX/N0YHL2Kd/Tn8uW4+Gryr3c7Qv8PgwUN6MYX+OGKrsqpWdVg8KRFo0jFYbGCOAi5cvLgOI1MpIajZKEBvBmApGrgLP+h2GKI/jCF7Z3TiLlS7rGbvarcz9H8iMyv7OCv81Qblsv3elAiUNwqx5QLKy3HxeUTrUYBeDUAeDdyOcLSkuuLuwdCdVhvZyq6XG13l/RCdd+7aPY4FfBA8lDAxxxWQeGIisKFl+AZ7FLB7z545VBSg2VyAng2AhkNuBnfgB36nTLq7vtlMRyQ8UN3I4Mo4FvhBBXlFLgXFExOBDVWBCraqQEZm1hXcdnahKgK3cQNQ3gDkRtCMgrq5GdD1dudbM1ni75Ht23d8yQK+q/b93pAIdCQKeOWVV97BisADVF8ANwCVDMCWMejxRa/+bXD1f6qwqCieBX54CF2x7/eWRKC9UUBg0OEfMfHcEbekd2ptG+ANBqDnF736ixelBmzbPt4W+JKKS2vcAognJwLtqQiQ24YifIwnPR/F709z2wBuADpb/clDdYoFfsj6uwsQONPvqYlASVWGWpaegP/xMR5c66bVbQA3AO2v/g3DUfv27fu6LfAl2TvQgycC7VMpY4vw7NlzxmN7cAdZTwA3AG4AVl/0/QjiRKRLl0LXscBfVV3ndkDgWK+zBgBzBrVqAKzbAHJIaxU2oknVAE2dEuQGoN3VX+r6a4tNTP8iF6PksBiAu/b+tGCwhxJRAAwa0aIBQHswiwFERFw96mNsO38Cm8801RTEDUDb4f9d+NA8MWHChGEs8Btq6jQBCIz28uREIKiy2nYegFwtluJjPHvSHSM5TeUBuAFoN/yXGn+gdfnpkJAL61kMAGb6aQEOpRKBWjYAltZgcgsTJAL7ajUPwA1AH+H/C5mks4zFAJQY7aWlRKCWDaCkjC0ROGPGzEnYFQjf5b1UHoAbADcAq7V/CP9hHkHv6mrDP3oJ/5VMBGrZANIyi5gM4NjxExupfoB2WuoH4AagTQO4A/eKsGfsvnDhwrF6Cv+VTARqFX5QXGIOkwHExsWH+BjnVMBR9fsxt3M7NwBuANb2/9A6Ci2kz23btn2hNfClCbbOjPVWQ6GXkzy2D0A6+ZiZnW/TAMix7VQf48QqzSUCuQFoe/8PteMXQ0NDd1oDX5I7+v5tyZk7A5NSCzVvABGR8UxRgI/xIhg6EXiHFhKB3AC0aQCwR7wP9/+90tMzrtqCH+630yokershyJ5/25lzl1kNAGZPwvi5ThjdteAGwA3AWv0f9opwlPSVnJzcFEvgS6qsrtMsKPb2BOgBfskAdu09zmQA0/z8pmixI5AbgMYTgLB3LCsjc3xtXFip9rBPJfIBtrYDsOfXetgvP/UYsCOQyQC+X74cJgTBfRKPaakSwA1AewlAqf8fTv/BANO3mK6rLq/VzaoJNwnT0nKpz9aNyKwGsHTpsnk+TVuCuQFwAzBrAG0wWQRJo36eZACepG07jzEbwBJ/f7ix6hWtlQK5AWi7BAijzd/hBqBNwdgyVgNYvHgJXEX3qk/jiDBuANwAzBqANPcfssXQPtqfG4A2BXkLVgNYtGjxIp/GQ0GSAdzBDYAbgDkDgH7xzmgAA7gBaLe8yWoAC4kDaLEZiBuANpuAJAOAyyUGcgPQnqQ254NBp5kM4KuvJs6kDOABbgDcAFgiADCAAXnk9s9anZcBPU1SSdOORqCPcAvQjecAuAHYlQMgl0yk2TIALTcCeZroWQex8SmsBvABVgGe5FUAbgAsVQAwAGgdfTcpOTnGlgFotRXYk8N/EMthoOtpaRnkexxO1MdHY6PBuAFouw8ALpV4+9Sp4ECWPICWhoF4sn5ctUWEf+XqLUyr/5WICLgmbChRLx/j+Q7N3BHADUC7nYAwCuwZ6ARcs2btKhYDKCqt4YC68FwD6zmAXbv37CXf42AfDQ4F4QagvUpAk7MAg4cMmcJiADwR6NrjzaxHgceMGQtNQAMwqUuPBeOnAbkBNDGAJqcBIYFUVFxisGUAsB/lkLruVCM5o2UT/vKKyv+Q728UbOWws7Ojj4YGg3ID0GYvgHQXoDgPkGgYmS9/hSUK0OvBGq0L7ieQ9v72hP/RMbFJ5Pv7hOhNH+Phrodwi8cnAnEDsGgAsD9sS/QI0UtEg44dP36ExQCOnQrnwKp08o9e/VnLf7/++tsO8v2NoEqAmukB4Aago1LgnLlzl7MYwMGgM5q9TccT6v6gdb/9xQQ/qGvXrt+Q72+IT+MsAE3dEswNQCeVgEGDBn3DtAW4Fi+uVhxcZU/90QbAmvyLio5JJt+dr0/jODD5vQDcALgBWEwEtsZwEVpHoYX0Q5ZE4I3CEnGvyqMAdUab27P6kxkAcB/Ax0RvmNn/85uBuAHYTAS2x84xMRF4hTERuGHTPvHB5QArP8uQdfUvuFFYS76zCdgARE8C0sz+nxuAfhKBL0Ii8M+NGzezbgPgYYW9KwfZ8X0/nfUHbdi0l3n133/g4Gkq/IczHfx6cG4ADiUCpclAb3fv3n0CU0NQRZXYpgp7Vw6z8yU/e/r+QWXlFf95/PHHZ8K2zcd4BPgpKvzXzMWg3AD0kQh8CB8geJA+jo2LS2StBsBDy7cC9sMvT/rZc+wXtG///rPkuxrn09j++5gWw39uAPrpCIRBknCSbNjvf/yxjcUAIBkoPbwwkpvD7Tj89oT+ZPX/P4899vh32Pzzlo9xsGtHjOY0Ff5zA9BfHmDgk08+ORnaS1lM4Mz5y+IDDOEszwc4Bj9spQpuFDMbwKbNm4+R7+kLrP33wuSfdP5fM9l/bgD6yQPQI8JhRRkZFn75mj25AG4CthN+li4tYe34A6VnZJaR7+cbXP37+hiPc3fC2n9Lra3+3AD01Q8AbaRwxfT7ffv2m8diAKDY+NSGhxkecm4CTYd7mkv42VPykzRp8uQNuPeXr/6ttbj6cwPQzzagHW4DxBmBRKNDQ8OircJPHkhJMLhSeqh5JGB6tZela8pYh31KOnrsWAT5XuD+P5j99yZGbJpe/bkBaN8A6G0AtAVDNxl0lX305ltvLWSBH1ROjq1CIos2AW8+NQj7/Y1bDykGf1p6Rvmjjz46H4wZ8jSY+X9cy3t/bgD6qwa0x4eqJ5aXxp08dSrMGviS4CGFGraUD5AEK6C3wQ8VEUshvyPwl5aV/58RI0asJ9/HVz7GuX+voVF30GrmnxuA/rYBd1JNQVIy8GPSbDKroSJgAXxaYALyBx7ut/OGcwNw6zD8W63dTmxPrV/Sih9XBmHi71Mf49CPF3C7dp/WV39uAPpqCpJ6Ap6gooCxCxYu3MYCvyRIbMkffFgRPbVXAMwNTkdaW/UdSfiBzp47n0C+gxlEY/D76IU9Gw/6NHb9aXb15wagvyjgXowCnsFcALSaTo6MjLxuC3xbJgCCfTGslJ50mMdSeY+u87O2+NKKi08oIJ/9bKLxUJmhQv+OVOLvdi3Dzw1An1EA5AIe8zFOCoKKwKhHH31sbjnpQLPnATaXE5C0e1+wbo0AVnwW8KV7/Vjm+jVN+qVXdOnSZSn57Cdh1h+2ZP+yEPpzA+AGoGgUIFUEYGIwjJkaRvTlBx98uNbeBxlMgK4O6NkI4H3CuQdbob4z+33jJR/plQT+78ln/jXu+9/xMXZpPo79GroI/bkB6DMKgJCyFfYFwPHS53H1gVVo8sqffjpo7wMNKyDdJ2BpawCrqlZXe2slPXOrviMhvwR/586dfyCf9bdEn2ME1gubtB6isv636wF+bgD67QuQugMfx61Af6LP4ME8HxIS78jDDS2vlrYEdLIQogJIGLqrcgArPZQvbWX0ze31HUn0yeBfQT7jaVjvh6RfH4zEOsj2/c25AXADcEVZELYC3fBBHIzZ6Onnzp9PcOQhZ4kG5JEBZNihqUgtQ4CuRVjlwXhY9vXmwIdw35G9vhn4/fAzfg+3X5D064QRWSu97Pu5Aeg/CpC2Am3xAXwGs9CQD4CTaLNIiSrR0Qc+JTVTDJXthQ0AlUxBMgZJlgyC/jWwssPvg9Xd3Mk8V4MPIgevsqiVH+Afip/1s7gNo5N+t+kJfm4A+jYBqSpwH5UPgNIgzKCHWXSzz549l+jMw++oEbhTMLRTCfBBhwKDosnnCNd6TcWw/z2E/zn8zNvjdqyFHuHnBqD/rUALzDrfj6VB6ELri/0B0Jo6O+jw4WvOggBJM3u2Bu4Q3NRjz9FdG+29/50xY+Yh8vlBfz90+cHVXnDC71Vc+R/Bz/xuPcPPDcCzSoPQffYElqTexsqAaALLl/9wVAkwYFWFRBrAphXo4f0osdo37Pevp1X26tXrV/K5zcE6/0gf4wGfl3GrJa38d/tovM+fG4D35ANaYlIQSlFdsTLwNkYCsB2YNXTosI1wcEUpUCQzgMgAwm5XAA89C8dOXFBspZdr27btV8hntYRopo+xww9M9F0s9T2F+Zb7MOy/U28Zf24Anm8C91Im8CJuB0ZgYnA6JLPCSVJLDXhgbBaACftvWJmtNRix7OMh9wCwXwy7JuYi1HjPklKvp1UNGTJkK/mMFuB+f6yP8WRfXzTTJ7HU187Mnr+Znh8gbgCelRRsRZnAE5gTeAOrA5DBhgaW+eTCynOwz1UTKnkykUVKhvJse/2y/677Zf0F8plAWy/09U/2MTb4wH4fpjD/Cz/Hh7Dicpfe9/zcADzfBKTtwIOYGHweM9fQJ/AZPuSzO3Xq/BMpcWW7Ejgt6cDBg3GdOnVajas+lPi+xJC/P/ZVSMm+B/DzbKnXUh83AO/cDrTBTHUXTF71wYf7I3zYoall4dix43ZBCOwt4J86FXy9R8+eMLtvMeRGMNEHWX6o77+FIX833O/TyT7d7/e5AXiXCdyJD+99+DB3w4f7LdwSjMJoAGbYL1m6bNnJ3Lz8mx4Nfg8RfH8M97/Bvf4HaIwvY7QE7dUPy0J+j4SfG4Bnm4DUJ3AXPswP48MNDzm0sQ7AKsE4hAHKXv5gBNExsUWeAD0xtFtbAwKuduzYcS2CPwfzIJAU/QS3RW9gwhR6+jtj1HSPT2Nrr0ck+7gBeJ8JSH0CUnLwHtzPdsGHHaKBNxGCTxCKbyUjGDxkSMCp4NOpJaVl/9Ub+CfJau/nN/0w+Xf8gKG+tOJL4A/BSKgnbo8ew0RfO08q8XED4C/5lqA1PuQP40MPia5eWO4aQhnBNwjNYkiU+S9dGhwaFpajVeDBpC6FhuUu8fc/3bFjp7WY1YcuPhjXNQVD/Y/x39gX/83PYYa/I+7126BRSll+j4efG4B3bgla4cPeHh/+JxCG3pQRfIzQTEGIAKalHTt1WgMrK+ynIbx2J/SpqderyBXc8aNHj95H3tuPCP0CzGlAJDMB8xywxx+E0Q4NficM9+/FbZJ81W/mDQ8HNwDv2hLQ0cBd+PDfjzB0RTh6ISyDEB6AaDxGBTPRDKBbbnmPHj3+JKtuMIBI8gbFam0XUlKvV8MKv2VrQKTv6NH7yd+9Ev5+fB/zMZsPDTzQ+jwaDQyy+u9gCfQlDPXl4Evh/h3etOpzA+DRgJQbkLYFtBE8gVuDHgjPOwgTlA990QwgMvDDbYJkCN8TrSAJt19gVZ42bdpRAHbLlq3XAN7o6JjiqOiYEgsqjo6JKd5Mfu2WrVsj165dd8nXd/T+QYMHb0fYYS+/DPfz83GV98P3MR7f18dY3eiPBgYRzb8w3wHbnQ4y8Ft6M/jcALgR0EbQUmYEHRCa7ghRb8yWQ1/8exgZQFPRGAy1p+AKPANNYZ6P8RjtYsy+L8MVG0BeIdMP+HPfYxgPZrIIQZ+Lq/t0DOsnI/Dw947E9/Eevi94f9DrANenPY1G1hmTe/dhEvQub1/xuQHwl62I4C6E5T6EpzPC9BSaAWTOX8V8wQAEcAQmEEchnF9iOA7Afo3wTkOQZ8g0HVfzqbjNADOZiKCPw5D+M1zhh2OOoj/+/a/i+3kBoe+KVY6H0cja+hh7IVpx8LkB8Jd9RtAK4WmLCUPJDKCXoBtuE15AAF/BFfhthHMwbhuG4yoN8H6KqzbA/Dmlz/DnwEA+RDMZhqAPxNUdYIfe/Jdxa/IC/v3d8P1IK70EfRs0spY+jY08Hl3P5wbAX0omC29DaOio4G7cIkBk8ABuE7rgVuFJjBCeQzhfwmRiH1ylX8d9+VsIcz9UX/yxN9FAXkMz6Y2gv+hjbFx6FrcjsMI/isB3wPdxH76vuy1A35yDzw2AvxwzguZmzKAV5gvaUIZwP67AHRDOR9AYnkBz6I4GAWH6Mwi0pGfwx5/CFb0rruqPosF0wpD+Qfx72uHf2wbfBx3ec+i5AfCXymYgGUILBK8lFSFIptAWQW2P0D6ABvEQwtwB9TDqIQT8Afz191Gg34N/dmtqhb9Ttspz6LkB8JcLzcCcIdxBmYJkDK0Q2taou61IAlyCnAb9DtkKLweeQ88NgL/cbAiSKciN4XYKYFu6XQb5bdSf2YwDzw2Av/RpDHKDMKdmHHLPMID/D/r+VOGJMlyYAAAAAElFTkSuQmCC' # base64 encoded png, decoded when needed
 
 PRESENTER_FRAME   = ((100., 100.), (1024., 768.))
 FEED_HEIGHT = 40
+FEED_QUEUE_SIZE = 100 # messages queued at most
+FEED_RATE, FEED_BURST = 2., 10 # messages per second allowed for each source
+FEED_DEDUP_DELAY = 60. # seconds during which repeated messages are ignored
+FEED_SPEEDUP_DEPTH, FEED_MAX_SPEEDUP = 10., 4. # scrolling speed adaptation
 MINIATURE_WIDTH, MINIATURE_MARGIN = 120, 5
 MIN_POSTER_HEIGHT = 20.
+MOVIE_PROBES = 4 # number of movies probed concurrently
+PLAYER_POOL_SIZE = 3 # number of movie players kept ready
+PROGRESS_MIN_INTERVAL = 1./30 # seconds between updates of the movie progress
+PREFETCH_PAGES = 2 # number of pages rendered in advance around the current one
+MAX_SLIDE_PIXELS = 16 * 2**20 # larger slides are not cached but drawn directly
+DISK_CACHE_SIZE, DISK_CACHE_AGE = 512 * 2**20, 30 * 24 * 3600. # bytes, seconds
+INK_TOLERANCE = .5 # pixels strokes may move by when simplified
+VERSION_URL = HOME + "releases/version.txt?v=%s" % VERSION
+VERSION_TTL, VERSION_TIMEOUT = 24 * 3600., 2. # seconds
+WATCH_SETTLE, WATCH_INTERVAL = .5, 1. # seconds files must stay unchanged, between polls
+INK_CACHE_SIZE = 64 * 2**20 # bytes of ink layers kept in memory
 
 CR, ESC, DEL = (chr(k) for k in [13, 27, 127])
 
 HELP = [
 	("?",         "show/hide this help"),
+	("i",         "show/hide drawing timings"),
 	("h",         "hide"),
 	("q",         "quit"),
-	("r",         "relaunch"),
+	("r",         "reload"),
 	(".|b",       "toggle black view"),
 	("w",         "toggle web view"),
 	("m",         "toggle movie view"),
@@ -86,9 +129,1771 @@ HELP = [
 
 def nop(): pass
 
+def background(function, *args):
+	"""run function(*args) in a daemon thread"""
+	thread = threading.Thread(target=function, args=args)
+	thread.daemon = True
+	thread.start()
+	return thread
+
+def consume(tasks, function, count=1):
+	"""process the items of the tasks queue with function in count threads"""
+	def worker():
+		while True:
+			task = tasks.get()
+			try:
+				function(task)
+			except Exception:
+				traceback.print_exc()
+	for _ in range(count):
+		background(worker)
+
+
+# caches #####################################################################
+
+class LRUCache(object):
+	"""a mapping evicting its least recently used items above a budget
+	
+	the cost of each item is given by size (default to 1, so that the budget
+	is then a number of items).
+	"""
+	def __init__(self, budget, size=lambda value: 1):
+		self.budget = budget
+		self.size = size
+		self.used = 0
+		self.items = OrderedDict()
+	
+	def __len__(self):
+		return len(self.items)
+	
+	def __contains__(self, key):
+		return key in self.items
+	
+	def __getitem__(self, key):
+		value, size = self.items.pop(key)
+		self.items[key] = value, size # most recently used is last
+		return value
+	
+	def __setitem__(self, key, value):
+		self.put(key, value, self.size(value))
+	
+	def put(self, key, value, size):
+		self.pop(key)
+		self.items[key] = value, size
+		self.used += size
+		while self.used > self.budget and len(self.items) > 1:
+			_, (_, size) = self.items.popitem(last=False)
+			self.used -= size
+	
+	def get(self, key, default=None):
+		try:
+			return self[key]
+		except KeyError:
+			return default
+	
+	def pop(self, key, default=None):
+		try:
+			value, size = self.items.pop(key)
+		except KeyError:
+			return default
+		self.used -= size
+		return value
+	
+	def clear(self):
+		self.items.clear()
+		self.used = 0
+	
+	def rekey(self, function):
+		"""replace each key by function(key), dropping the items it maps to None"""
+		items, self.items, self.used = self.items, OrderedDict(), 0
+		for key, (value, size) in items.items():
+			key = function(key)
+			if key is not None:
+				self.items[key] = value, size
+				self.used += size
+
+
+def cache_directory():
+	"""per user cache directory of the application"""
+	if sys.platform == "darwin":
+		root = os.path.expanduser("~/Library/Caches")
+	else:
+		root = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+	return os.path.join(root, ID)
+
+def data_directory():
+	"""per user data directory of the application"""
+	if sys.platform == "darwin":
+		root = os.path.expanduser("~/Library/Application Support")
+	else:
+		root = os.environ.get("XDG_DATA_HOME") or os.path.expanduser("~/.local/share")
+	return os.path.join(root, ID)
+
+def file_digest(path, chunk_size=2**20):
+	"""hash of the content of a file"""
+	digest = hashlib.sha1()
+	with open(path, "rb") as f:
+		for chunk in iter(lambda: f.read(chunk_size), b""):
+			digest.update(chunk)
+	return digest.hexdigest()
+
+
+class DiskCache(object):
+	"""bitmaps stored on disk, grouped by document
+	
+	each entry is a file holding raw premultiplied RGBA rows (4 bytes per pixel,
+	no padding) followed by a small trailer giving the width and height, so
+	that the file can be memory-mapped and used as is as bitmap data.
+	"""
+	TRAILER = struct.Struct("<4sII")
+	MAGIC = b"OSXP"
+	
+	def __init__(self, root, max_size=DISK_CACHE_SIZE, max_age=DISK_CACHE_AGE):
+		self.root = root
+		self.max_size = max_size
+		self.max_age = max_age
+	
+	def path(self, digest, name):
+		return os.path.join(self.root, digest, "%s.rgba" % name)
+	
+	def load(self, digest, name):
+		"""return (path, width, height) of an entry or None if missing"""
+		path = self.path(digest, name)
+		try:
+			with open(path, "rb") as f:
+				f.seek(-self.TRAILER.size, os.SEEK_END)
+				magic, width, height = self.TRAILER.unpack(f.read(self.TRAILER.size))
+				size = f.tell()
+			os.utime(path, None) # entries are evicted least recently used first
+		except (IOError, OSError, struct.error):
+			return
+		if magic != self.MAGIC or size != 4*width*height + self.TRAILER.size:
+			return
+		return path, width, height
+	
+	def store(self, digest, name, width, height, pixels):
+		path = self.path(digest, name)
+		temp = "%s.%s.tmp" % (path, os.getpid())
+		try:
+			if not os.path.isdir(os.path.dirname(path)):
+				os.makedirs(os.path.dirname(path))
+			with open(temp, "wb") as f:
+				f.write(pixels)
+				f.write(self.TRAILER.pack(self.MAGIC, width, height))
+			os.rename(temp, path) # so that readers never see partial entries
+		except (IOError, OSError):
+			pass
+	
+	def move(self, digest, new_digest):
+		"""file the entries of digest under new_digest, unless it has some"""
+		try:
+			os.rename(os.path.join(self.root, digest), os.path.join(self.root, new_digest))
+		except OSError:
+			pass
+	
+	def evict(self):
+		"""remove entries older than max_age, then oldest ones above max_size
+		
+		only the bitmaps (and their leftover temporary files) in the directories
+		of the documents are considered, other files under root are kept.
+		"""
+		entries = []
+		directories = []
+		for digest in os.listdir(self.root) if os.path.isdir(self.root) else []:
+			directory = os.path.join(self.root, digest)
+			try:
+				names = os.listdir(directory)
+			except OSError: # not a directory
+				continue
+			directories.append(directory)
+			for name in names:
+				if not (name.endswith(".rgba") or ".rgba." in name):
+					continue
+				path = os.path.join(directory, name)
+				try:
+					stat = os.stat(path)
+				except OSError:
+					continue
+				entries.append((stat.st_mtime, stat.st_size, path))
+		entries.sort(reverse=True)
+		
+		deadline = time.time() - self.max_age
+		size = 0
+		for mtime, entry_size, path in entries:
+			size += entry_size
+			if mtime < deadline or size > self.max_size:
+				try:
+					os.remove(path)
+				except OSError:
+					pass
+		
+		for directory in directories:
+			try:
+				os.rmdir(directory) # only succeeds for empty directories
+			except OSError:
+				pass
+
+
+# navigation index ###########################################################
+
+def following(starts, page):
+	"""first of the sorted starts after page, or page itself"""
+	i = bisect_right(starts, page)
+	return starts[i] if i < len(starts) else page
+
+def preceding(starts, page):
+	"""last of the sorted starts before page, or page itself"""
+	i = bisect_left(starts, page)
+	return starts[i-1] if i > 0 else page
+
+
+class MiniaturesLayout(object):
+	"""miniatures stacked from top to bottom
+	
+	their origins (and ends) are stored as prefix sums of their heights so
+	that the visible ones and the one at a given position are found by
+	bisection.
+	"""
+	def __init__(self, width, heights, margin):
+		self.width = width
+		self.heights = array('d', heights)
+		self.origins = array('d', [0.]) * len(heights)
+		self.ends = array('d', [0.]) * len(heights)
+		origin = 0.
+		for i, height in enumerate(heights):
+			self.origins[i] = origin
+			origin += height
+			self.ends[i] = origin
+			origin += margin
+		self.height = origin
+	
+	def __len__(self):
+		return len(self.heights)
+	
+	def __getitem__(self, i):
+		return self.width, self.heights[i], self.origins[i]
+	
+	def visible(self, top, height):
+		"""range of miniatures overlapping [top, top+height]"""
+		return range(bisect_left(self.ends, top), bisect_right(self.origins, top+height))
+	
+	def index_at(self, y):
+		"""miniature at y, margins belonging to the miniature above them"""
+		return min(max(bisect_right(self.origins, y)-1, 0), len(self)-1)
+
+
+# document index #############################################################
+
+def lines(selection):
+	return [line.string() for line in selection.selectionsByLine() or []]
+
+
+# entries of the pdf data of a page that change each time it is written
+VOLATILE_PDF_ENTRIES = re.compile(br"/(CreationDate|ModDate)\s*\([^)]*\)|/ID\s*\[[^\]]*\]")
+
+def page_fingerprint(data):
+	"""digest of the pdf data of a page"""
+	return hashlib.sha1(VOLATILE_PDF_ENTRIES.sub(b"", bytes(data))).hexdigest()
+
+def match_pages(old, new):
+	"""map the pages of a new version of a document to the identical pages of
+	the old one given their fingerprints (None when unknown), pages staying
+	in place are preferred"""
+	pages = defaultdict(list)
+	for page_number, fingerprint in enumerate(old):
+		if fingerprint is not None:
+			pages[fingerprint].append(page_number)
+	matches = {}
+	for page_number, fingerprint in enumerate(new):
+		candidates = pages.get(fingerprint)
+		if fingerprint is None or not candidates:
+			continue
+		match = page_number if page_number in candidates else candidates[0]
+		candidates.remove(match)
+		matches[page_number] = match
+	return matches
+
+
+class DocumentIndex(object):
+	"""what the presenter needs to know about each page of a document
+	
+	the page table is array backed (crop boxes as x, y, w, h quadruples,
+	start of the frame, section and link flags of each page), labels are kept
+	in a list and notes in dicts of the pages that have some.
+	
+	pages are prepared (cropped for two screens pdfs, note annotations hidden,
+	link annotations gathered) on first access. the notes of two screens pdfs
+	are extracted apart, from another instance of the document, so are the
+	fingerprints of the pages telling which ones a new version has changed.
+	"""
+	HAS_LINK, HAS_MOVIE = 1, 2
+	
+	def __init__(self, pdf, note_type, link_type, media_box, crop_box):
+		self.pdf = pdf
+		self.note_type, self.link_type = note_type, link_type
+		self.media_box, self.crop_box_type = media_box, crop_box
+		
+		self.page_count = page_count = pdf.pageCount()
+		self.boxes = array('d', [0.]) * (4*page_count)
+		self.labels = [None] * page_count
+		self.frame_starts = array('i', [0]) * page_count # frame of each page
+		self.page_sections = array('i', [-1]) * page_count # section of each page
+		self.flags = array('B', [0]) * page_count
+		self.frames = [] # first page of each frame
+		self.sections = [] # first page of each section
+		self.pdf_notes = defaultdict(list)
+		self.beamer_notes = {}
+		self.two_screens = False
+		self.header = False # notes slides have a navigation header
+		self.layout = {} # miniatures layouts
+		self.fingerprints = [None] * page_count
+		self._prepared = set() # cropped pages with hidden notes
+		self._links = {} # link annotations of visited pages
+	
+	def rebind(self, pdf):
+		"""copy of the index for another instance of the same document"""
+		index = copy.copy(self)
+		index.pdf = pdf
+		index._prepared = set()
+		index._links = {}
+		return index
+	
+	def crop_box(self, page_number):
+		x, y, w, h = self.boxes[4*page_number:4*page_number+4]
+		return (x, y), (w, h)
+	
+	def page(self, page_number):
+		"""the pdf page, prepared for presentation"""
+		page = self.pdf.pageAtIndex_(page_number)
+		if page_number not in self._prepared:
+			self.prepare(page_number, page)
+		return page
+	
+	def prepare(self, page_number, page):
+		"""crop page and hide its notes"""
+		self._prepared.add(page_number)
+		if self.two_screens:
+			page.setBounds_forBox_(self.crop_box(page_number), self.crop_box_type)
+		if page_number not in self._links:
+			self.annotations(page_number, page)
+	
+	def annotations(self, page_number, page):
+		"""hide the notes of page and gather its links, return its annotations"""
+		annotations = page.annotations() or []
+		links = self._links[page_number] = []
+		for i, annotation in enumerate(annotations):
+			annotation_type = type(annotation)
+			if annotation_type == self.note_type:
+				annotation.setShouldDisplay_(False)
+			elif annotation_type == self.link_type:
+				links.append((i, annotation))
+		return annotations
+	
+	def links(self, page_number):
+		"""link annotations of a page"""
+		if not self.flags[page_number] & DocumentIndex.HAS_LINK:
+			return []
+		if page_number not in self._links:
+			self.annotations(page_number, self.pdf.pageAtIndex_(page_number))
+		return [annotation for _, annotation in self._links[page_number]]
+	
+	def notes(self, page_number):
+		beamer_notes = self.beamer_notes.get(page_number)
+		if beamer_notes is None and self.two_screens:
+			beamer_notes = [u"\u2026"] # not extracted yet
+		return "".join(
+			"\n\n".join(notes or [])
+			for notes in [self.pdf_notes.get(page_number), beamer_notes]
+		)
+	
+	def notes_rect(self, page_number):
+		"""area of the notes on the right half of a two screens page"""
+		(x, y), (w, h) = self.crop_box(page_number)
+		return (x+w, y), (w, 3*h/4 if self.header else h)
+	
+	def extract_notes(self, pdf, current):
+		"""generate (page number, notes) of the pages of pdf with no notes yet,
+		the first page after current() next"""
+		missing = [p for p in range(self.page_count) if p not in self.beamer_notes]
+		while missing:
+			i = bisect_left(missing, current())
+			page_number = missing.pop(i if i < len(missing) else 0)
+			selection = pdf.pageAtIndex_(page_number).selectionForRect_(self.notes_rect(page_number))
+			yield page_number, ['\n'.join(lines(selection))]
+	
+	def fingerprint(self, pdf, page_numbers=None):
+		"""generate (page number, fingerprint) of the pages of pdf (all or
+		page_numbers) with no fingerprint yet, pdf must not have been prepared"""
+		for page_number in range(self.page_count) if page_numbers is None else page_numbers:
+			if self.fingerprints[page_number] is None:
+				page = pdf.pageAtIndex_(page_number)
+				yield page_number, page_fingerprint(page.dataRepresentation())
+	
+	def miniatures_layout(self, width, margin):
+		"""layout of the miniatures of the pages"""
+		key = width, margin
+		if key not in self.layout:
+			heights = []
+			for page_number in range(self.page_count):
+				_, _, w, h = self.boxes[4*page_number:4*page_number+4]
+				heights.append(h*width/w)
+			self.layout[key] = heights
+		return MiniaturesLayout(width, self.layout[key], margin)
+	
+	def build(self, on_link):
+		"""fill the index visiting each page once
+		
+		note annotations are hidden and their content gathered, on_link is
+		called for each link annotation and returns whether it is a movie.
+		two screens pdfs (slides on the left, notes on the right) get crop
+		boxes, their notes are left to extract_notes.
+		"""
+		pdf = self.pdf
+		page_count = self.page_count
+		
+		outline = pdf.outlineRoot()
+		if outline:
+			for i in range(outline.numberOfChildren()):
+				destination = outline.childAtIndex_(i).destination()
+				self.sections.append(pdf.indexForPage_(destination.page()))
+		
+		if page_count:
+			title_page = pdf.pageAtIndex_(0)
+			(x, y), (w, h) = title_page.boundsForBox_(self.media_box)
+			self.two_screens = w/h > 7./3 # likely to be a two screens pdf
+		if self.two_screens:
+			# heuristic to guess template of note slide
+			w /= 2
+			title = lines(title_page.selectionForRect_(((x, y), (w, h))))
+			miniature = lines(title_page.selectionForRect_(((x+w+3*w/4, y+3*h/4), (w/4, h/4))))
+			self.header = bool(miniature) and all( # miniature do not have navigation
+				line in title
+				for line in miniature
+			)
+		
+		section_starts = sorted(set(self.sections))
+		section = -1
+		frame_start = 0
+		current_label = None
+		for page_number in range(page_count):
+			page = pdf.pageAtIndex_(page_number)
+			
+			# frames
+			label = page.label()
+			if label != current_label:
+				# a new frame just started
+				self.frames.append(page_number)
+				frame_start = page_number
+				current_label = label
+			self.labels[page_number] = label
+			self.frame_starts[page_number] = frame_start
+			
+			# sections
+			while section+1 < len(section_starts) and section_starts[section+1] <= page_number:
+				section += 1
+			self.page_sections[page_number] = section
+			
+			# crop box
+			(x, y), (w, h) = page.boundsForBox_(self.media_box)
+			if self.two_screens:
+				w /= 2
+			else:
+				(x, y), (w, h) = page.boundsForBox_(self.crop_box_type)
+			self.boxes[4*page_number:4*page_number+4] = array('d', [x, y, w, h])
+			
+			# annotations
+			for annotation in self.annotations(page_number, page):
+				if type(annotation) == self.note_type:
+					self.pdf_notes[page_number].append(annotation.contents().replace('\r', '\n'))
+			for i, annotation in self._links[page_number]:
+				self.flags[page_number] |= DocumentIndex.HAS_LINK
+				if on_link(page_number, i, annotation):
+					self.flags[page_number] |= DocumentIndex.HAS_MOVIE
+	
+	def restore(self, state, on_link):
+		"""fill the index from a state saved by dump, pages with movies are
+		prepared so that on_link is called for their links"""
+		self.boxes = array('d', state["boxes"])
+		self.labels = state["labels"]
+		self.frame_starts = array('i', state["frame_starts"])
+		self.page_sections = array('i', state["page_sections"])
+		self.flags = array('B', state["flags"])
+		self.frames = state["frames"]
+		self.sections = state["sections"]
+		self.pdf_notes.update(state["pdf_notes"])
+		self.beamer_notes = state["beamer_notes"]
+		self.two_screens = state["two_screens"]
+		self.header = state["header"]
+		self.layout = state["layout"]
+		self.fingerprints = state["fingerprints"]
+		
+		for page_number in range(self.page_count):
+			if self.flags[page_number] & DocumentIndex.HAS_MOVIE:
+				self.annotations(page_number, self.pdf.pageAtIndex_(page_number))
+				for i, annotation in self._links[page_number]:
+					on_link(page_number, i, annotation)
+	
+	def dump(self):
+		"""state of the index made of plain python objects"""
+		text = type(u"")
+		def texts(strings):
+			return [None if s is None else text(s) for s in strings]
+		return {
+			"boxes":         list(self.boxes),
+			"labels":        texts(self.labels),
+			"frame_starts":  list(self.frame_starts),
+			"page_sections": list(self.page_sections),
+			"flags":         list(self.flags),
+			"frames":        list(self.frames),
+			"sections":      list(self.sections),
+			"pdf_notes":     dict((k, texts(v)) for k, v in self.pdf_notes.items()),
+			"beamer_notes":  dict((k, texts(v)) for k, v in self.beamer_notes.items()),
+			"two_screens":   self.two_screens,
+			"header":        self.header,
+			"layout":        self.layout,
+			"fingerprints":  list(self.fingerprints),
+		}
+
+
+class Sidecar(object):
+	"""data about a document persisted across launches
+	
+	data is keyed by the size, modification time and content digest of the
+	document, so that it is reused without hashing the document when neither
+	its size nor mtime have changed. the digest may be saved unknown, then
+	set once computed in the background.
+	"""
+	VERSION = (3,) + tuple(sys.version_info[:2]) # marshal format may change
+	
+	def __init__(self, document_path, root):
+		self.document_path = document_path
+		name = hashlib.sha1(document_path.encode("utf-8")).hexdigest()
+		self.path = os.path.join(root, "index", "%s.index" % name)
+		stat = os.stat(document_path)
+		self.key = stat.st_size, stat.st_mtime
+		self._digest = None
+		self.data = None
+		
+		try:
+			with open(self.path, "rb") as f:
+				version, key, digest, data = marshal.load(f)
+		except (IOError, OSError, EOFError, ValueError, TypeError):
+			return
+		if version != self.VERSION:
+			return
+		if tuple(key) != self.key:
+			if digest is None or digest != self.digest: # document has changed
+				return
+			self.save(data) # document has only been touched
+		self._digest, self.data = digest, data
+	
+	@property
+	def digest(self):
+		"""content digest of the document (blocking)"""
+		if self._digest is None:
+			self._digest = file_digest(self.document_path)
+		return self._digest
+	
+	@property
+	def known_digest(self):
+		"""content digest of the document, None if not computed yet"""
+		return self._digest
+	
+	@property
+	def provisional_digest(self):
+		"""content digest when known, otherwise a digest of the path, size and
+		mtime of the document standing for it"""
+		if self._digest is not None:
+			return self._digest
+		key = "%s:%s:%r" % ((self.document_path,) + self.key)
+		return hashlib.sha1(key.encode("utf-8")).hexdigest()
+	
+	def digested(self, digest):
+		"""set the digest computed in the background"""
+		self._digest = digest
+		if self.data is not None:
+			self.save(self.data)
+	
+	def save(self, data):
+		self.data = data
+		temp = "%s.%s.tmp" % (self.path, os.getpid())
+		try:
+			if not os.path.isdir(os.path.dirname(self.path)):
+				os.makedirs(os.path.dirname(self.path))
+			with open(temp, "wb") as f:
+				f.write(marshal.dumps((self.VERSION, self.key, self._digest, data)))
+			os.rename(temp, self.path)
+		except (IOError, OSError):
+			pass
+
+
+# strokes ####################################################################
+
+def simplify(points, tolerance):
+	"""Ramer-Douglas-Peucker simplification of a polyline given as a flat
+	array of x, y coordinates, the points kept are at most tolerance away"""
+	n = len(points)//2
+	if n < 3:
+		return array('d', points)
+	keep = array('B', [0]) * n
+	keep[0] = keep[n-1] = 1
+	spans = [(0, n-1)]
+	while spans:
+		first, last = spans.pop()
+		x0, y0 = points[2*first], points[2*first+1]
+		dx, dy = points[2*last]-x0, points[2*last+1]-y0
+		length = hypot(dx, dy)
+		farthest, distance = None, tolerance
+		for i in range(first+1, last):
+			x, y = points[2*i]-x0, points[2*i+1]-y0
+			d = abs(dx*y - dy*x)/length if length else hypot(x, y)
+			if d > distance:
+				farthest, distance = i, d
+		if farthest is not None:
+			keep[farthest] = 1
+			spans.append((first, farthest))
+			spans.append((farthest, last))
+	simplified = array('d')
+	for i in range(n):
+		if keep[i]:
+			simplified.extend(points[2*i:2*i+2])
+	return simplified
+
+def strokes_bounds(strokes, rect):
+	"""rect extended to enclose strokes given as (points, color, size)"""
+	(x0, y0), (w, h) = rect
+	x1, y1 = x0+w, y0+h
+	for points, _, size in strokes:
+		r = size/2.+1 # outline included
+		xs, ys = points[0::2], points[1::2]
+		x0, y0 = min(x0, min(xs)-r), min(y0, min(ys)-r)
+		x1, y1 = max(x1, max(xs)+r), max(y1, max(ys)+r)
+	return (x0, y0), (x1-x0, y1-y0)
+
+
+class StrokeLog(object):
+	"""append-only log of the strokes drawn on the pages of a document
+	
+	strokes are (points, color, size) where points is an array of single
+	precision x, y pairs (native byte order) and color a (r, g, b, a) tuple of
+	bytes. erasing the strokes of a page is logged too, so that the log is
+	never rewritten. the log is indexed when opened, strokes of a page are
+	only read when asked for.
+	
+	the digest of the document and the fingerprints of the pages strokes
+	are drawn on are logged as well, so that strokes drawn on another version
+	of the document can be moved to the identical pages of the current one.
+	"""
+	STROKE, ERASE, DOCUMENT, PAGE = 1, 2, 3, 4
+	RECORD = struct.Struct("<BI") # kind, page number
+	STROKE_RECORD = struct.Struct("<4BfI") # color, size, number of points
+	DIGEST_RECORD = struct.Struct("<40s") # hex digest of the document or a page
+	
+	def __init__(self, path):
+		self.path = path
+		self.offsets = defaultdict(list) # of the strokes records of each page
+		self.fingerprints = {} # of the pages with strokes
+		self.digest = None # of the document the strokes are drawn on
+		self.current = None # digest of the document strokes are now drawn on
+		self.end = 0 # of the last complete record
+		self.file = None
+		try:
+			with open(path, "rb") as f:
+				self.index(f)
+		except (IOError, OSError):
+			pass
+	
+	def index(self, f):
+		while True:
+			offset = f.tell()
+			record = f.read(self.RECORD.size)
+			if len(record) < self.RECORD.size:
+				break
+			kind, page_number = self.RECORD.unpack(record)
+			if kind == self.STROKE:
+				record = f.read(self.STROKE_RECORD.size)
+				if len(record) < self.STROKE_RECORD.size:
+					break
+				_, _, _, _, _, count = self.STROKE_RECORD.unpack(record)
+				f.seek(2*count*array('f').itemsize, os.SEEK_CUR)
+				if f.tell() > os.fstat(f.fileno()).st_size:
+					break
+				self.offsets[page_number].append(offset)
+			elif kind == self.ERASE:
+				self.offsets.pop(page_number, None)
+				self.fingerprints.pop(page_number, None)
+			elif kind in [self.DOCUMENT, self.PAGE]:
+				record = f.read(self.DIGEST_RECORD.size)
+				if len(record) < self.DIGEST_RECORD.size:
+					break
+				self.logged(kind, page_number, record)
+			else:
+				break
+			self.end = f.tell()
+	
+	def strokes(self, page_number):
+		"""strokes of a page, oldest first"""
+		strokes = []
+		if not self.offsets.get(page_number):
+			return strokes
+		with open(self.path, "rb") as f:
+			for offset in self.offsets[page_number]:
+				f.seek(offset + self.RECORD.size)
+				r, g, b, a, size, count = self.STROKE_RECORD.unpack(f.read(self.STROKE_RECORD.size))
+				points = array('f')
+				points.fromfile(f, 2*count)
+				strokes.append((points, (r, g, b, a), size))
+		return strokes
+	
+	def logged(self, kind, page_number, record):
+		digest, = self.DIGEST_RECORD.unpack(record)
+		if kind == self.DOCUMENT:
+			self.digest = digest.decode("ascii")
+		else:
+			self.fingerprints[page_number] = digest.decode("ascii")
+	
+	def log_digest(self, kind, page_number, digest):
+		self.write(kind, page_number, self.DIGEST_RECORD.pack(digest.encode("ascii")))
+	
+	def document(self, digest):
+		"""log that strokes are now drawn on the document of digest"""
+		self.current = digest
+		if self.offsets and digest != self.digest:
+			self.log_digest(self.DOCUMENT, 0, digest)
+	
+	def stale(self, digest):
+		"""whether the strokes were drawn on another version of the document"""
+		return bool(self.offsets) and self.digest not in [None, digest]
+	
+	def remap(self, digest, fingerprints):
+		"""move the strokes drawn on another version of the document to the
+		identical pages of the one of digest, given the fingerprints of its
+		pages, the strokes of the pages that changed are dropped"""
+		if self.stale(digest):
+			old = [None] * (max(self.offsets) + 1)
+			for page_number in self.offsets:
+				old[page_number] = self.fingerprints.get(page_number)
+			moves = dict((o, n) for n, o in match_pages(old, fingerprints).items())
+			self.renumber(dict((p, moves.get(p)) for p in self.offsets), fingerprints)
+		self.document(digest)
+	
+	def fingerprint(self, fingerprints):
+		"""log the fingerprints of the pages with strokes not known yet"""
+		for page_number in list(self.offsets):
+			fingerprint = fingerprints[page_number] if page_number < len(fingerprints) else None
+			if fingerprint is not None and self.fingerprints.get(page_number) != fingerprint:
+				self.log_digest(self.PAGE, page_number, fingerprint)
+	
+	def append(self, page_number, points, color, size, fingerprint=None):
+		"""log a stroke, points are converted to single precision"""
+		if self.current is not None and self.current != self.digest:
+			self.log_digest(self.DOCUMENT, 0, self.current)
+		if fingerprint is not None and self.fingerprints.get(page_number) != fingerprint:
+			self.log_digest(self.PAGE, page_number, fingerprint)
+		points = array('f', points)
+		r, g, b, a = color
+		self.write(self.STROKE, page_number,
+		           self.STROKE_RECORD.pack(r, g, b, a, size, len(points)//2), points)
+	
+	def erase(self, page_number):
+		"""log the erasing of the strokes of a page"""
+		self.write(self.ERASE, page_number)
+	
+	def write(self, kind, page_number, record=b"", points=None):
+		points = points or array('f')
+		try:
+			if self.file is None:
+				if not os.path.isdir(os.path.dirname(self.path)):
+					os.makedirs(os.path.dirname(self.path))
+				self.file = open(self.path, "ab")
+				self.file.truncate(self.end) # drops a partly written record
+			self.file.write(self.RECORD.pack(kind, page_number) + record)
+			points.tofile(self.file)
+			self.file.flush()
+		except (IOError, OSError):
+			return
+		if kind == self.STROKE:
+			self.offsets[page_number].append(self.end)
+		elif kind == self.ERASE:
+			self.offsets.pop(page_number, None)
+			self.fingerprints.pop(page_number, None)
+		else:
+			self.logged(kind, page_number, record)
+		self.end += self.RECORD.size + len(record) + len(points)*points.itemsize
+	
+	def renumber(self, pages, fingerprints=None):
+		"""log the moving of strokes to other pages, pages maps page numbers
+		to new ones (None to drop their strokes, unmapped pages stay), and
+		fingerprints gives those of the new pages"""
+		moved = dict(
+			(page_number, self.strokes(page_number))
+			for page_number in list(self.offsets)
+			if pages.get(page_number, page_number) != page_number
+		)
+		for page_number in moved:
+			self.erase(page_number)
+		for page_number, strokes in moved.items():
+			if pages[page_number] is not None:
+				new_page = pages[page_number]
+				fingerprint = fingerprints[new_page] if fingerprints else None
+				for points, color, size in strokes:
+					self.append(new_page, points, color, size, fingerprint)
+	
+	def close(self):
+		if self.file is not None:
+			self.file.close()
+			self.file = None
+
+
+# movies #####################################################################
+
+class PlayerPool(object):
+	"""players of movies kept ready to play, at most size of them
+	
+	players are created by create(key) and have preroll() and release()
+	methods. when the pool is full the least recently used player is
+	released, but the one in use (last got through use) and the one just got.
+	"""
+	def __init__(self, create, size=PLAYER_POOL_SIZE):
+		self.create = create
+		self.size = size
+		self.players = OrderedDict() # key: player, most recently used last
+		self.current = None # key of the player in use
+	
+	def __len__(self):
+		return len(self.players)
+	
+	def __contains__(self, key):
+		return key in self.players
+	
+	def get(self, key):
+		"""player of key, created if needed"""
+		player = self.players.pop(key, None)
+		if player is None:
+			player = self.create(key)
+		self.players[key] = player
+		for other in list(self.players):
+			if len(self.players) <= self.size:
+				break
+			if other not in [key, self.current]:
+				self.players.pop(other).release()
+		return player
+	
+	def use(self, key):
+		"""player of key, kept while in use"""
+		self.current = key
+		return self.get(key)
+	
+	def prepare(self, keys):
+		"""preroll the players of keys, the first ones being the most wanted
+		when there is no room for all of them"""
+		room = self.size - (self.current is not None and self.current not in keys)
+		for key in reversed(keys[:room]): # the most wanted used last
+			self.get(key).preroll()
+
+
+def cmtime_seconds(cmtime):
+	"""seconds of a (value, timescale, flags, epoch) time, None if not numeric"""
+	value, timescale, flags, _ = cmtime
+	if not flags & 0x1 or flags & 0x1c or not timescale: # invalid, infinite or indefinite
+		return
+	return 1. * value / timescale
+
+
+class PlaybackProgress(object):
+	"""progress of a movie as shown by a slider width pixels wide
+	
+	update is called with the playing time, and notify(position) only when
+	the slider would show something else: the position moved by a pixel or
+	the movie started or stopped playing.
+	"""
+	def __init__(self, notify, width=1):
+		self.notify = notify
+		self.width = width
+		self.position = 0.
+		self.shown = None # pixel and playing state last notified
+	
+	def interval(self, duration):
+		"""seconds between updates that may be shown, duration may be None"""
+		if not duration:
+			return PROGRESS_MIN_INTERVAL
+		return max(PROGRESS_MIN_INTERVAL, duration / max(1, self.width))
+	
+	def update(self, time, duration, playing):
+		"""return whether the progress has been notified"""
+		position = 0.
+		if time is not None and duration:
+			position = min(1., max(0., time / duration))
+		shown = int(position * max(1, self.width)), playing
+		if shown == self.shown:
+			return False
+		self.position, self.shown = position, shown
+		self.notify(position)
+		return True
+	
+	def reset(self):
+		"""notify the next update, whatever it is"""
+		self.shown = None
+
+
+# feed #######################################################################
+
+class Feed(object):
+	"""messages from several sources, queued for the scrolling banner
+	
+	sources (streams, named pipes and sockets) are read in background
+	threads. each source is rate limited, and messages repeated within
+	dedup_delay seconds are ignored. the queue is bounded, when it is full
+	the policy decides what to do:
+	- "drop" drops the oldest message,
+	- "coalesce" merges the two oldest messages,
+	- "priority" drops the oldest normal message, urgent messages (starting
+	  with "!") being displayed before normal ones.
+	notify is called (from the reading threads) each time a message is queued.
+	"""
+	POLICIES = ["drop", "coalesce", "priority"]
+	
+	def __init__(self, size=FEED_QUEUE_SIZE, policy="drop",
+	             rate=FEED_RATE, burst=FEED_BURST, dedup_delay=FEED_DEDUP_DELAY,
+	             notify=nop, clock=time.time):
+		assert policy in self.POLICIES
+		self.size, self.policy = size, policy
+		self.rate, self.burst = rate, burst
+		self.dedup_delay = dedup_delay
+		self.notify = notify
+		self.clock = clock
+		
+		self.lock = threading.Lock()
+		self.urgent, self.normal = deque(), deque()
+		self.buckets = {} # source: (tokens, time)
+		self.seen = OrderedDict() # message: time, oldest first
+		self.dropped = 0
+	
+	def __len__(self):
+		return len(self.urgent) + len(self.normal)
+	
+	def allow(self, source, now):
+		"""token bucket rate limiting of source"""
+		tokens, last = self.buckets.get(source, (self.burst, now))
+		tokens = min(self.burst, tokens + (now-last)*self.rate)
+		allowed = tokens >= 1
+		self.buckets[source] = (tokens-1 if allowed else tokens), now
+		return allowed
+	
+	def repeated(self, message, now):
+		seen = self.seen
+		while seen:
+			oldest, then = next(iter(seen.items()))
+			if now - then <= self.dedup_delay:
+				break
+			del seen[oldest]
+		if message in seen:
+			return True
+		seen[message] = now
+		return False
+	
+	def push(self, message, source=None):
+		"""queue a message, return whether it has been accepted"""
+		urgent = self.policy == "priority" and message.startswith("!")
+		if urgent:
+			message = message[1:].lstrip()
+		if not message:
+			return False
+		
+		now = self.clock()
+		with self.lock:
+			if not self.allow(source, now) or self.repeated(message, now):
+				self.dropped += 1
+				return False
+			(self.urgent if urgent else self.normal).append(message)
+			if len(self) > self.size:
+				if self.policy == "coalesce":
+					oldest = self.normal.popleft()
+					self.normal[0] = u"%s · %s" % (oldest, self.normal[0])
+				else:
+					self.dropped += 1
+					(self.normal or self.urgent).popleft()
+		self.notify()
+		return True
+	
+	def pop(self):
+		"""next message to display, or None"""
+		with self.lock:
+			for messages in [self.urgent, self.normal]:
+				if messages:
+					return messages.popleft()
+	
+	def speed(self, pps):
+		"""scrolling speed adapted to the number of queued messages"""
+		return pps * min(FEED_MAX_SPEEDUP, 1. + len(self)/FEED_SPEEDUP_DEPTH)
+	
+	# sources (blocking, run them in threads through run)
+	
+	def run(self, source, name):
+		"""run a source, reporting why it stopped if it failed"""
+		try:
+			source(name)
+		except Exception as e:
+			sys.stderr.write("could not read feed from '%s': %s\n" % (name, e))
+	
+	def read(self, stream, source="stdin"):
+		"""queue the lines of a binary stream"""
+		for line in iter(stream.readline, b""):
+			self.push(line.decode("utf-8", "replace").rstrip(), source)
+	
+	def read_pipe(self, path):
+		"""queue the lines written to a named pipe (created if needed)"""
+		if not os.path.exists(path):
+			os.mkfifo(path)
+		if not S_ISFIFO(os.stat(path).st_mode): # would be read again and again
+			raise ValueError("not a named pipe")
+		while True:
+			with open(path, "rb") as pipe: # waits for a writer
+				self.read(pipe, path)
+	
+	def serve(self, address):
+		"""queue the lines sent to a socket
+		
+		address is either [host:]port for tcp (host defaulting to localhost)
+		or the path of a unix socket.
+		"""
+		host, _, port = address.rpartition(":")
+		if port.isdigit():
+			server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+			server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+			server.bind((host or "127.0.0.1", int(port)))
+		else:
+			if os.path.exists(address):
+				if not S_ISSOCK(os.stat(address).st_mode):
+					raise ValueError("not a socket")
+				os.remove(address) # stale socket
+			server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+			server.bind(address)
+		server.listen(5)
+		while True:
+			connection, peer = server.accept()
+			source = peer[0] if isinstance(peer, tuple) else address
+			background(self.read_connection, connection, source)
+	
+	def read_connection(self, connection, source):
+		try:
+			self.read(connection.makefile("rb"), source)
+		finally:
+			connection.close()
+
+
+# watching ###################################################################
+
+class FileWatcher(object):
+	"""calls on_change each time a file has been rewritten completely
+	
+	changes are noticed through inotify on linux, FSEvents on macos, or by
+	polling every interval seconds when neither is available. as a file is
+	usually noticed several times while it is written, it is only deemed
+	complete when its size and mtime have not changed for settle seconds and
+	it ends with a pdf trailer (or has not changed for patience times
+	longer). on_change is called from the watching thread.
+	"""
+	IN_MODIFY, IN_CLOSE_WRITE, IN_MOVED_TO, IN_CREATE = 0x2, 0x8, 0x80, 0x100
+	EVENT = struct.Struct("iIII") # inotify event: wd, mask, cookie, name length
+	
+	def __init__(self, path, on_change, settle=WATCH_SETTLE, interval=WATCH_INTERVAL,
+	             patience=10, sleep=time.sleep):
+		self.path = os.path.abspath(path)
+		self.on_change = on_change
+		self.settle, self.interval, self.patience = settle, interval, patience
+		self.sleep = sleep
+		self.changed = threading.Event()
+		self.polling = True # until notifications are received
+		self.signature = self.stat()
+	
+	def stat(self):
+		try:
+			stat = os.stat(self.path)
+		except OSError:
+			return
+		return stat.st_size, stat.st_mtime
+	
+	def complete(self):
+		"""whether the file ends with a pdf trailer"""
+		try:
+			with open(self.path, "rb") as f:
+				f.seek(0, os.SEEK_END)
+				f.seek(max(0, f.tell()-1024))
+				return b"%%EOF" in f.read()
+		except (IOError, OSError):
+			return False
+	
+	def notify(self):
+		"""tell that the file may have changed"""
+		self.changed.set()
+	
+	def check(self):
+		"""wait for a changed file to be complete, return whether it changed"""
+		signature = self.stat()
+		if signature is None or signature == self.signature:
+			return False
+		waited = 0
+		while True:
+			self.sleep(self.settle)
+			settled = self.stat()
+			if settled is None: # removed, wait for it to be written again
+				return False
+			if settled != signature:
+				signature, waited = settled, 0
+			elif self.complete() or waited >= self.patience:
+				break
+			else:
+				waited += 1
+		self.signature = signature
+		return True
+	
+	def run(self):
+		"""call on_change after each rewrite of the file (blocking)"""
+		while True:
+			self.changed.wait(self.interval if self.polling else None)
+			self.changed.clear()
+			if self.check():
+				self.on_change()
+	
+	def watch(self):
+		"""start watching the file in background threads"""
+		if sys.platform.startswith("linux"):
+			background(self.notifications, self.inotify)
+		elif sys.platform == "darwin":
+			background(self.notifications, self.fsevents)
+		background(self.run)
+	
+	def notifications(self, source):
+		"""run a source of notifications, falling back to polling"""
+		try:
+			source()
+		except Exception:
+			traceback.print_exc()
+		finally:
+			self.polling = True
+			self.changed.set()
+	
+	# sources (blocking, run them in threads through notifications)
+	
+	def inotify(self):
+		"""notify the changes of the file reported by inotify (linux)"""
+		import ctypes
+		libc = ctypes.CDLL(None, use_errno=True)
+		directory, name = os.path.split(self.path)
+		encoding = sys.getfilesystemencoding()
+		fd = libc.inotify_init()
+		if fd < 0:
+			raise OSError(ctypes.get_errno(), "inotify_init")
+		try:
+			if libc.inotify_add_watch(fd, directory.encode(encoding), self.IN_MODIFY |
+			                          self.IN_CLOSE_WRITE | self.IN_MOVED_TO | self.IN_CREATE) < 0:
+				raise OSError(ctypes.get_errno(), "inotify_add_watch")
+			self.polling = False
+			name = name.encode(encoding)
+			while True:
+				events = os.read(fd, 4096)
+				offset = 0
+				while offset < len(events):
+					_, _, _, length = self.EVENT.unpack_from(events, offset)
+					offset += self.EVENT.size
+					if events[offset:offset+length].rstrip(b"\0") == name:
+						self.notify()
+					offset += length
+		finally:
+			os.close(fd)
+	
+	def fsevents(self):
+		"""notify the changes of the file reported by FSEvents (macos)"""
+		import FSEvents
+		from CoreFoundation import CFRunLoopGetCurrent, CFRunLoopRun, kCFRunLoopDefaultMode
+		directory, name = os.path.split(self.path)
+		encoding = sys.getfilesystemencoding()
+		def changed(stream, info, count, paths, flags, ids):
+			# paths are strings with UseCFTypes, decoded anyway in case of bytes
+			paths = (p.decode(encoding) if isinstance(p, bytes) else p for p in paths)
+			if any(os.path.basename(path) == name for path in paths):
+				self.notify()
+		stream = FSEvents.FSEventStreamCreate(
+			None, changed, None, [directory],
+			FSEvents.kFSEventStreamEventIdSinceNow, self.settle/5.,
+			FSEvents.kFSEventStreamCreateFlagFileEvents | FSEvents.kFSEventStreamCreateFlagNoDefer |
+			FSEvents.kFSEventStreamCreateFlagUseCFTypes,
+		)
+		FSEvents.FSEventStreamScheduleWithRunLoop(stream, CFRunLoopGetCurrent(), kCFRunLoopDefaultMode)
+		if not FSEvents.FSEventStreamStart(stream):
+			raise OSError("FSEventStreamStart")
+		self.polling = False
+		CFRunLoopRun()
+
+
+# updates ####################################################################
+
+def get_version(url=VERSION_URL, timeout=VERSION_TIMEOUT):
+	"""latest released version, None if it can not be fetched (blocking)"""
+	try:
+		response = urlopen(url, timeout=timeout)
+		try:
+			return response.read().decode("utf-8").strip() or None
+		finally:
+			response.close()
+	except Exception:
+		return None
+
+
+class VersionCheck(object):
+	"""latest released version, fetched at most once every ttl seconds
+	
+	the version is cached in a json file at path, fetch(url) returns the
+	version or None when it could not be fetched (and is then not cached).
+	"""
+	def __init__(self, path, url=VERSION_URL, ttl=VERSION_TTL,
+	             fetch=get_version, clock=time.time):
+		self.path, self.url, self.ttl = path, url, ttl
+		self.fetch = fetch
+		self.clock = clock
+	
+	def cached(self):
+		"""cached version, None if missing or stale"""
+		try:
+			with open(self.path) as f:
+				cache = json.load(f)
+			if cache["url"] == self.url and 0 <= self.clock() - cache["time"] < self.ttl:
+				return cache["version"]
+		except (IOError, OSError, ValueError, TypeError, KeyError):
+			pass
+	
+	def latest(self, refresh=False):
+		"""latest version, fetched if not cached or refresh (blocking)"""
+		version = None if refresh else self.cached()
+		if version is None:
+			version = self.fetch(self.url)
+			if version is not None:
+				self.store(version)
+		return version
+	
+	def store(self, version):
+		temp = "%s.%s.tmp" % (self.path, os.getpid())
+		try:
+			if not os.path.isdir(os.path.dirname(self.path)):
+				os.makedirs(os.path.dirname(self.path))
+			with open(temp, "w") as f:
+				json.dump({"url": self.url, "time": self.clock(), "version": version}, f)
+			os.rename(temp, self.path)
+		except (IOError, OSError):
+			pass
+
+
+# profiling ##################################################################
+
+def percentile(values, p):
+	"""p-th percentile (0 to 1) of sorted values"""
+	return values[int(round(p*(len(values)-1)))]
+
+class FrameProfiler(object):
+	"""durations of the stages of drawing frames
+	
+	a frame starts with begin(view), each of its stages ends with mark(stage)
+	and the frame with end(). the last samples of each stage are kept for
+	statistics and frames are written as json lines to a log while enabled.
+	when disabled each call returns immediately.
+	"""
+	def __init__(self, samples=120, clock=time.time):
+		self.enabled = False
+		self.samples = samples
+		self.clock = clock
+		self.durations = {} # (view, stage) -> deque of durations
+		self.frame = None
+		self.last = None
+		self.log = None
+	
+	def toggle(self, log_path=None):
+		self.enabled = not self.enabled
+		self.durations.clear()
+		self.frame = None
+		self.close()
+		if self.enabled and log_path:
+			try:
+				if not os.path.isdir(os.path.dirname(log_path)):
+					os.makedirs(os.path.dirname(log_path))
+				self.log = open(log_path, "a")
+			except (IOError, OSError):
+				pass
+	
+	def begin(self, view):
+		if not self.enabled:
+			return
+		self.last = self.clock()
+		self.frame = {"view": view, "time": self.last, "stages": OrderedDict()}
+	
+	def mark(self, stage):
+		if self.frame is None:
+			return
+		now = self.clock()
+		self.frame["stages"][stage] = now - self.last
+		self.last = now
+	
+	def end(self):
+		if self.frame is None:
+			return
+		frame, self.frame = self.frame, None
+		stages = frame["stages"]
+		stages["total"] = self.last - frame["time"]
+		for stage, duration in stages.items():
+			key = frame["view"], stage
+			if key not in self.durations:
+				self.durations[key] = deque(maxlen=self.samples)
+			self.durations[key].append(duration)
+		if self.log is not None:
+			self.log.write(json.dumps(frame) + "\n")
+			self.log.flush()
+	
+	def statistics(self):
+		"""(view, stage, p50, p95, max) of the durations of each stage"""
+		statistics = []
+		for (view, stage), durations in sorted(self.durations.items()):
+			durations = sorted(durations)
+			statistics.append((view, stage, percentile(durations, .5),
+			                   percentile(durations, .95), durations[-1]))
+		return statistics
+	
+	def summary(self):
+		"""statistics as text, durations in milliseconds"""
+		return "\n".join(
+			"%s %s: %.1f / %.1f / %.1f ms" % (view, stage, p50*1e3, p95*1e3, maximum*1e3)
+			for view, stage, p50, p95, maximum in self.statistics()
+		)
+	
+	def close(self):
+		if self.log is not None:
+			self.log.close()
+			self.log = None
+
+
+class StartupProfile(object):
+	"""durations of the phases of startup, reported with the first frame
+	
+	phases run one after the other, each ends with mark(phase). tasks running
+	in the background end with done(task) and are reported with their time
+	since start, once the report has been written if they end later.
+	"""
+	def __init__(self, start, clock=time.time, output=sys.stderr):
+		self.enabled = False
+		self.start = self.last = start
+		self.clock = clock
+		self.output = output
+		self.phases = []
+		self.tasks = OrderedDict() # background task -> time since start
+		self.reported = False
+	
+	def mark(self, phase):
+		now = self.clock()
+		self.phases.append((phase, now - self.last))
+		self.last = now
+	
+	def done(self, task):
+		if task in self.tasks:
+			return
+		self.tasks[task] = self.clock() - self.start
+		if self.reported:
+			self.write_task(task)
+	
+	def report(self, phase):
+		"""end the last phase and write the durations of all of them"""
+		self.mark(phase)
+		self.reported = True
+		if not self.enabled:
+			return
+		for phase, duration in self.phases:
+			self.output.write("%-20s %8.1f ms\n" % (phase, duration*1e3))
+		self.output.write("%-20s %8.1f ms\n" % ("total", (self.last-self.start)*1e3))
+		for task in self.tasks:
+			self.write_task(task)
+	
+	def write_task(self, task):
+		if self.enabled:
+			self.output.write("%-20s %8.1f ms after start (background)\n" % (
+				task, self.tasks[task]*1e3))
+
+
+# benchmarks #################################################################
+
+def timed(function, *args):
+	"""return the duration of function(*args) in seconds"""
+	start = time.time()
+	function(*args)
+	return time.time() - start
+
+def benchmark_navigation(page_counts=(10, 100, 1000, 10000, 100000), steps=20000):
+	"""time frame and section navigation over synthetic indexes
+	
+	return the mean duration of a step for each page count.
+	"""
+	results = []
+	for page_count in page_counts:
+		frames = list(range(0, page_count, 3))
+		sections = list(range(0, page_count, 25))
+		positions = [(7919*i) % page_count for i in range(steps)]
+		def navigate():
+			for page in positions:
+				following(frames, page)
+				preceding(frames, page)
+				following(sections, page)
+				preceding(sections, page)
+		results.append((page_count, min(timed(navigate) for _ in range(3)) / steps))
+	return results
+
+def check_logarithmic(results, slack=2.):
+	"""is the growth of durations at most logarithmic in page counts"""
+	(n0, t0), (n1, t1) = results[0], results[-1]
+	return t1/t0 <= slack * log(n1)/log(n0)
+
+
+# synthetic documents, implementing the part of the pdfkit api the index uses
+
+class FakeSelection(object):
+	def __init__(self, text):
+		self.text = text
+	
+	def string(self):
+		return self.text
+	
+	def selectionsByLine(self):
+		return [FakeSelection(line) for line in self.text.split("\n")]
+
+class FakeNote(object):
+	def __init__(self, text):
+		self.text = text
+	
+	def contents(self):
+		return self.text
+	
+	def setShouldDisplay_(self, flag):
+		pass
+
+class FakeLink(object):
+	def __init__(self, movie):
+		self.movie = movie
+
+class FakeOutlineItem(object):
+	def __init__(self, page):
+		self._page = page
+	
+	def destination(self):
+		return self
+	
+	def page(self):
+		return self._page
+
+class FakeOutline(object):
+	def __init__(self, pages):
+		self.children = [FakeOutlineItem(page) for page in pages]
+	
+	def numberOfChildren(self):
+		return len(self.children)
+	
+	def childAtIndex_(self, i):
+		return self.children[i]
+
+class FakePage(object):
+	def __init__(self, page_number, label, size, annotations):
+		self.page_number = page_number
+		self._label = label
+		self.bounds = {0: ((0., 0.), size)}
+		self._annotations = annotations
+	
+	def label(self):
+		return self._label
+	
+	def boundsForBox_(self, box):
+		return self.bounds.get(box, self.bounds[0])
+	
+	def setBounds_forBox_(self, bounds, box):
+		self.bounds[box] = bounds
+	
+	def annotations(self):
+		return self._annotations
+	
+	def selectionForRect_(self, rect):
+		return FakeSelection("notes of page %s\nsecond line" % self.page_number)
+
+class FakeDocument(object):
+	"""deck with overlays (frames of 1 to 4 pages), a section every 20
+	pages, notes, links and movies, boxes 0 and 1 are media and crop boxes"""
+	def __init__(self, page_count, two_screens=False):
+		size = (800., 300.) if two_screens else (400., 300.)
+		overlays = [1, 3, 1, 2, 4]
+		self.pages = []
+		frame = 0
+		while len(self.pages) < page_count:
+			for _ in range(overlays[frame % len(overlays)]):
+				page_number = len(self.pages)
+				annotations = []
+				if page_number % 5 == 0:
+					annotations.append(FakeNote("note\rof page %s" % page_number))
+				if page_number % 7 == 0:
+					annotations.append(FakeLink(movie=page_number % 50 == 0))
+				self.pages.append(FakePage(page_number, str(frame+1), size, annotations))
+			frame += 1
+		del self.pages[page_count:]
+		self.outline = FakeOutline(self.pages[::20])
+	
+	def pageCount(self):
+		return len(self.pages)
+	
+	def pageAtIndex_(self, i):
+		return self.pages[i]
+	
+	def indexForPage_(self, page):
+		return page.page_number
+	
+	def outlineRoot(self):
+		return self.outline
+
+
+# suite of the presenter core phases on synthetic decks
+
+def fake_index(pdf):
+	return DocumentIndex(pdf, FakeNote, FakeLink, 0, 1)
+
+def on_fake_link(page_number, i, annotation):
+	return annotation.movie
+
+def measure(function, repeat=3):
+	"""return the best duration and the peak memory allocated by function()"""
+	duration = min(timed(function) for _ in range(repeat))
+	peak = None
+	if tracemalloc is not None:
+		tracemalloc.start()
+		function()
+		_, peak = tracemalloc.get_traced_memory()
+		tracemalloc.stop()
+	return duration, peak
+
+def benchmark_phases(page_count, steps=2000):
+	"""yield (phase, function) for the startup, navigation, miniatures
+	layout and culling, hit testing and notes handling of a deck of
+	page_count pages"""
+	pdf = FakeDocument(page_count)
+	yield "index", lambda: fake_index(pdf).build(on_fake_link)
+	
+	index = fake_index(pdf)
+	index.build(on_fake_link)
+	data = marshal.dumps(index.dump())
+	yield "restore", lambda: fake_index(pdf).restore(marshal.loads(data), on_fake_link)
+	
+	positions = [(7919*i) % page_count for i in range(steps)]
+	frames, sections = index.frames, sorted(set(index.sections))
+	def navigate():
+		for page in positions:
+			min(page+1, page_count-1) # next page
+			max(page-1, 0)            # previous page
+			following(frames, page)
+			preceding(frames, page)
+			following(sections, page)
+			preceding(sections, page)
+	yield "navigation", navigate
+	
+	width, margin, height = MINIATURE_WIDTH-MINIATURE_MARGIN, MINIATURE_MARGIN, 768.
+	def layout():
+		index.layout.clear()
+		index.miniatures_layout(width, margin)
+	yield "layout", layout
+	
+	layout = index.miniatures_layout(width, margin)
+	def miniatures(): # culling only, the layout being built once
+		for page in positions:
+			for i in layout.visible(layout.origins[page], height):
+				layout[i]
+	yield "miniatures", miniatures
+	
+	ys = [(7919.*i) % layout.height for i in range(steps)]
+	def hit_test():
+		for y in ys:
+			layout.index_at(y)
+	yield "hit testing", hit_test
+	
+	notes_pdf = FakeDocument(page_count, two_screens=True)
+	notes_index = fake_index(notes_pdf)
+	notes_index.build(on_fake_link)
+	def notes():
+		notes_index.beamer_notes = {}
+		for page_number, page_notes in notes_index.extract_notes(notes_pdf, lambda: 0):
+			notes_index.beamer_notes[page_number] = page_notes
+		for page_number in range(page_count):
+			notes_index.notes(page_number)
+	yield "notes", notes
+
+def calibration():
+	"""duration of a fixed python workload, the unit of the suite durations
+	so that they may be compared across machines"""
+	def work():
+		counts = {}
+		for i in range(100000):
+			counts[i % 1000] = counts.get(i % 1000, 0) + i
+	return min(timed(work) for _ in range(5))
+
+def benchmark_suite(page_counts=(10, 100, 1000, 10000)):
+	"""return {"phase pages": (duration, peak memory)} of each phase for each
+	page count, durations in calibration units and memory in bytes"""
+	unit = calibration()
+	results = OrderedDict()
+	for page_count in page_counts:
+		for phase, function in benchmark_phases(page_count):
+			duration, peak = measure(function)
+			results["%s %s" % (phase, page_count)] = (duration/unit, peak)
+	return results
+
+def regressions(results, baseline, time_slack=2., memory_slack=1.25, noise=.1):
+	"""describe the results worse than their baseline beyond slack factors
+	(and noise calibration units for durations)"""
+	worse = []
+	for key, (duration, peak) in sorted(results.items()):
+		if key not in baseline:
+			continue
+		base_duration, base_peak = baseline[key]
+		if duration > time_slack*base_duration + noise:
+			worse.append("%s: %.2f units, baseline %.2f" % (key, duration, base_duration))
+		if None not in [peak, base_peak] and peak > memory_slack*base_peak + 2**16:
+			worse.append("%s: %d KiB, baseline %d KiB" % (key, peak//1024, base_peak//1024))
+	return worse
+
+
+# self tests #################################################################
+
+def self_test_updates():
+	"""yield (description, passed) for the version check against a local http
+	server answering on the path of VERSION_URL"""
+	import tempfile, shutil
+	try:
+		from http.server import HTTPServer, BaseHTTPRequestHandler
+	except ImportError: # python 2
+		from BaseHTTPServer import HTTPServer, BaseHTTPRequestHandler
+	
+	path = "/" + VERSION_URL.split("://", 1)[1].split("/", 1)[1]
+	served = {"version": b"1.2.3\n", "requests": 0}
+	class Handler(BaseHTTPRequestHandler):
+		def do_GET(self):
+			served["requests"] += 1
+			if self.path != path:
+				self.send_error(404)
+				return
+			self.send_response(200)
+			self.send_header("Content-Length", str(len(served["version"])))
+			self.end_headers()
+			self.wfile.write(served["version"])
+		def log_message(self, *args):
+			pass
+	
+	server = HTTPServer(("127.0.0.1", 0), Handler)
+	background(server.serve_forever)
+	host = "http://127.0.0.1:%s" % server.server_address[1]
+	url = host + path
+	
+	closed = socket.socket()
+	closed.bind(("127.0.0.1", 0))
+	unreachable = "http://127.0.0.1:%s%s" % (closed.getsockname()[1], path)
+	closed.close()
+	
+	directory = tempfile.mkdtemp()
+	try:
+		yield "get_version fetches the version", get_version(url) == "1.2.3"
+		yield "get_version of a missing path is None", get_version(host + "/missing") is None
+		yield "get_version of an unreachable host is None", get_version(unreachable, .5) is None
+		
+		now = [1000.]
+		check = VersionCheck(os.path.join(directory, "version.json"), url, ttl=60.,
+		                     clock=lambda: now[0])
+		yield "latest fetches when not cached", check.latest() == "1.2.3"
+		served["version"], requests = b"1.2.4\n", served["requests"]
+		yield "latest is cached", check.latest() == "1.2.3" and served["requests"] == requests
+		now[0] += 30.
+		yield "cache is fresh within ttl", check.cached() == "1.2.3"
+		now[0] += 31.
+		yield "cache is stale after ttl", check.cached() is None
+		yield "latest fetches after ttl", check.latest() == "1.2.4"
+		served["version"] = b"1.2.5\n"
+		yield "refresh fetches despite cache", check.latest(refresh=True) == "1.2.5"
+		
+		offline = VersionCheck(os.path.join(directory, "offline.json"), unreachable,
+		                       fetch=lambda url: get_version(url, .5))
+		yield "unreachable host is None", offline.latest() is None
+		yield "unreachable host is not cached", not os.path.exists(offline.path)
+	finally:
+		server.shutdown()
+		server.server_close()
+		shutil.rmtree(directory)
+
+def self_test_players():
+	"""yield (description, passed) for the pool of players, with fake ones"""
+	events = []
+	class FakePlayer(object):
+		def __init__(self, key):
+			self.key = key
+			events.append(("create", key))
+		def preroll(self):
+			events.append(("preroll", self.key))
+		def release(self):
+			events.append(("release", self.key))
+	
+	pool = PlayerPool(FakePlayer, size=2)
+	pool.get("a"); pool.get("b"); pool.get("a"); pool.get("c")
+	yield "least recently used player is released", (
+		events[-1] == ("release", "b") and list(pool.players) == ["a", "c"])
+	yield "players are created once", events.count(("create", "a")) == 1
+	
+	del events[:]
+	pool = PlayerPool(FakePlayer, size=2)
+	pool.use("a")
+	for key in "bcd":
+		pool.get(key)
+	yield "player in use is never released", (
+		("release", "a") not in events and list(pool.players) == ["a", "d"])
+	
+	del events[:]
+	pool = PlayerPool(FakePlayer, size=3)
+	pool.use("x")
+	pool.prepare(list("abcd"))
+	yield "prepare leaves room for the player in use", (
+		[e for e in events if e[0] == "preroll"] == [("preroll", "b"), ("preroll", "a")] and
+		list(pool.players) == ["x", "b", "a"] and not any(e[0] == "release" for e in events))
+	
+	del events[:]
+	pool.use("a")
+	pool.prepare(list("abcd"))
+	yield "prepare counts the player in use among keys", (
+		[e for e in events if e[0] == "preroll"] == [("preroll", k) for k in "cba"] and
+		list(pool.players) == ["c", "b", "a"] and events.count(("release", "x")) == 1)
+	
+	del events[:]
+	pool = PlayerPool(FakePlayer, size=2)
+	pool.prepare(list("abc"))
+	yield "prepare keeps the most wanted players", (
+		list(pool.players) == ["b", "a"] and ("create", "c") not in events)
+	
+	del events[:]
+	pool = PlayerPool(FakePlayer, size=1)
+	pool.use("a")
+	player = pool.get("b")
+	yield "player got is never released", (
+		player.key == "b" and ("release", "b") not in events and
+		("release", "a") not in events and list(pool.players) == ["a", "b"])
+	pool.use("b")
+	yield "pool shrinks back once the player in use changes", (
+		events[-1] == ("release", "a") and list(pool.players) == ["b"])
+
+def self_tests():
+	"""yield (description, passed) of all the self tests"""
+	for test in [self_test_players, self_test_updates]:
+		for result in test():
+			yield result
+
 
 # handling args ##############################################################
 
+startup = StartupProfile(start_time)
+startup.mark("imports")
+
 name, args = sys.argv[0], sys.argv[1:]
 
 # ignore "-psn" arg if we have been launched by the finder
@@ -99,13 +1904,22 @@ if launched_from_finder:
 
 def exit_usage(message=None, code=0):
 	usage = textwrap.dedent("""\
-	Usage: %s [-hvip:d:f] <doc.pdf>
+	Usage: %s [-hvibp:d:wf] <doc.pdf>
 		-h --help          print this help message then exit
 		-v --version       print version then exit
 		-i --icon          print icon then exit
+		-b --benchmark     run benchmarks then exit
+		--self-test        run self tests then exit
+		--profile-startup  print the duration of startup phases
+		--baseline <f>     compare benchmarks to file f (benchmarks.json)
+		--save-baseline    save benchmark results as baseline
 		-p --page <p>      start on page int(p)
 		-d --duration <t>  duration of the talk in minutes
+		-w --watch         reload the document when it is rewritten
 		-f --feed          enable reading feed on stdin
+		--feed-pipe <p>    read feed from named pipe p
+		--feed-socket <a>  read feed from socket a ([host:]port or path)
+		--feed-policy <p>  when feed is crowded: drop, coalesce or priority
 		<doc.pdf>          file to present
 	""" % name)
 	if message:
@@ -122,30 +1936,74 @@ def exit_popup(message):
 	""" % { "msg": message }
 	os.execv("/usr/bin/osascript", ["/usr/bin/osascript", "-e", command])
 
-def exit_relaunch(path, page):
-	os.execv(__file__, [__file__, '--page', str(page), path])
-
 def exit_version():
 	sys.stdout.write(("%s %s %s\n" % (os.path.basename(name), ID, VERSION)).encode())
 	sys.exit()
 
 def exit_icon():
-	sys.stdout.write(ICON)
+	sys.stdout.write(base64.b64decode(ICON))
 	sys.exit()
 
+def exit_benchmark(baseline_path, save_baseline):
+	failed = False
+	
+	results = benchmark_navigation()
+	for page_count, duration in results:
+		sys.stdout.write(("navigation %8d pages %8.3f us/step\n" % (
+			page_count, duration*1e6)).encode())
+	if not check_logarithmic(results):
+		sys.stderr.write("navigation is slower than logarithmic in page count\n")
+		failed = True
+	
+	results = benchmark_suite()
+	for key, (duration, peak) in results.items():
+		phase, page_count = key.rsplit(" ", 1)
+		sys.stdout.write(("%-12s %8s pages %8.2f units %10s KiB\n" % (
+			phase, page_count, duration, "-" if peak is None else peak//1024)).encode())
+	
+	if save_baseline:
+		with open(baseline_path, "w") as f:
+			json.dump(results, f, indent=1, sort_keys=True)
+	elif os.path.exists(baseline_path):
+		with open(baseline_path) as f:
+			worse = regressions(results, json.load(f))
+		for regression in worse:
+			sys.stderr.write("regression %s\n" % regression)
+		failed = failed or bool(worse)
+	
+	sys.exit(1 if failed else 0)
+
+def exit_self_test():
+	failed = False
+	for description, passed in self_tests():
+		sys.stdout.write(("%s %s\n" % ("ok  " if passed else "FAIL", description)).encode())
+		failed = failed or not passed
+	sys.exit(1 if failed else 0)
+
 
 # options
 
 try:
-	options, args = getopt.getopt(args, "hvip:d:f", ["help", "version", "icon",
-	                                                 "page=", "duration=",
-	                                                 "feed"])
+	options, args = getopt.getopt(args, "hvibp:d:wf", ["help", "version", "icon",
+	                                                  "benchmark", "baseline=", "save-baseline",
+	                                                  "self-test",
+	                                                  "profile-startup",
+	                                                  "page=", "duration=", "watch",
+	                                                  "feed", "feed-pipe=", "feed-socket=",
+	                                                  "feed-policy="])
 except getopt.GetoptError as message:
 	exit_usage(message, 1)
 
 start_page = None
 presentation_duration = 0
+watch_document = False
+benchmark = save_baseline = False
+baseline_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmarks.json")
 show_feed = False
+feed_stdin = False
+feed_pipes = []
+feed_sockets = []
+feed_policy = "drop"
 
 for opt, value in options:
 	if opt in ["-h", "--help"]:
@@ -154,16 +2012,43 @@ for opt, value in options:
 		exit_version()
 	elif opt in ["-i", "--icon"]:
 		exit_icon()
+	elif opt in ["-b", "--benchmark"]:
+		benchmark = True
+	elif opt == "--self-test":
+		exit_self_test()
+	elif opt == "--baseline":
+		baseline_path = value
+	elif opt == "--save-baseline":
+		save_baseline = True
+	elif opt == "--profile-startup":
+		startup.enabled = True
 	elif opt in ['-p', '--page']:
 		start_page = int(value)
 	elif opt in ["-d", "--duration"]:
 		presentation_duration = int(value)
+	elif opt in ["-w", "--watch"]:
+		watch_document = True
 	elif opt in ["-f", "--feed"]:
+		show_feed = feed_stdin = True
+	elif opt == "--feed-pipe":
 		show_feed = True
+		feed_pipes.append(value)
+	elif opt == "--feed-socket":
+		show_feed = True
+		feed_sockets.append(value)
+	elif opt == "--feed-policy":
+		if value not in Feed.POLICIES:
+			exit_usage("feed policy should be one of %s" % ", ".join(Feed.POLICIES), 1)
+		feed_policy = value
+
+if benchmark:
+	exit_benchmark(baseline_path, save_baseline)
 
 if len(args) > 1:
 	exit_usage("no more than one argument is expected", 1)
 
+startup.mark("arguments")
+
 
 # application init ###########################################################
 
@@ -182,14 +2067,13 @@ except ImportError:
 	
 setVerbose(1)
 
-from objc import nil, NO, YES
+from objc import nil, NO, YES, autorelease_pool
+from PyObjCTools.AppHelper import callAfter
 from Foundation import (
 	NSLog, NSNotificationCenter, NSUserDefaults, NSAffineTransform,
 	NSObject, NSTimer, NSError, NSString, NSData, NSArray,
 	NSAttributedString, NSUnicodeStringEncoding,
-	NSURL, NSURLRequest, NSURLConnection,
-	NSURLRequestReloadIgnoringLocalCacheData,
-	NSKeyValueObservingOptionOld, NSKeyValueObservingOptionNew,
+	NSURL, NSURLRequest, NSDataReadingMappedIfSafe,
 )
 
 from AppKit import (
@@ -199,16 +2083,17 @@ from AppKit import (
 	NSColorPanel,
 	NSAlert, NSAlertDefaultReturn, NSAlertAlternateReturn,
 	NSWindow, NSView, NSSlider, NSMenu, NSMenuItem, NSCursor,
-	NSViewWidthSizable, NSViewHeightSizable, NSViewNotSizable,
+	NSViewWidthSizable, NSViewHeightSizable, NSViewNotSizable, NSWindowBelow,
 	NSMiniaturizableWindowMask, NSResizableWindowMask, NSTitledWindowMask,
 	NSBackingStoreBuffered,
 	NSCommandKeyMask, NSAlternateKeyMask, NSControlKeyMask,
 	NSGraphicsContext,
-	NSCompositeClear, NSCompositeSourceAtop, NSCompositeCopy,
+	NSCompositeClear, NSCompositeSourceAtop, NSCompositeCopy, NSCompositeSourceOver,
 	NSRectFillUsingOperation, NSFrameRectWithWidth, NSFrameRect, NSEraseRect,
-	NSRect, NSZeroRect, NSColor,
+	NSRect, NSZeroRect, NSColor, NSCalibratedRGBColorSpace,
 	NSFont, NSFontAttributeName, NSForegroundColorAttributeName,
 	NSStrokeColorAttributeName, NSStrokeWidthAttributeName,
+	NSStringDrawingUsesLineFragmentOrigin,
 	NSUpArrowFunctionKey, NSLeftArrowFunctionKey,
 	NSDownArrowFunctionKey, NSRightArrowFunctionKey,
 	NSHomeFunctionKey, NSEndFunctionKey,
@@ -219,11 +2104,6 @@ from AppKit import (
 	NSLayoutConstraint,
 )
 
-try:
-	from AppKit import NSEventTypeApplicationDefined
-except:
-	from AppKit import NSApplicationDefined as NSEventTypeApplicationDefined
-
 try:
 	from AppKit import NSColorPanelModeCrayon
 except:
@@ -235,29 +2115,16 @@ from Quartz import (
 	kPDFActionNamedFirstPage, kPDFActionNamedLastPage,
 	kPDFActionNamedGoBack, kPDFActionNamedGoForward,
 	kPDFDisplayBoxMediaBox, kPDFDisplayBoxCropBox,
+	CGBitmapContextCreate, CGBitmapContextCreateImage, CGColorSpaceCreateDeviceRGB,
+	CGImageCreate, CGImageGetDataProvider, CGImageGetWidth, CGImageGetHeight,
+	CGDataProviderCreateWithCFData, CGDataProviderCopyData,
+	CGContextScaleCTM, kCGImageAlphaPremultipliedLast, kCGRenderingIntentDefault,
 )
 
-from WebKit import (
-	WebView,
-)
-
-from AVFoundation import (
-	AVAsset, AVPlayerItem, AVPlayer, AVPlayerLayer, AVAssetImageGenerator,
-	AVCaptureSession, AVCaptureDevice, AVCaptureDeviceInput, AVCaptureVideoPreviewLayer,
-)
-
-try: # missing constants for some bindings
-	from AVFoundation import (
-		AVPlayerItemStatusReadyToPlay,
-		AVMediaTypeVideo,
-		AVLayerVideoGravityResizeAspectFill,
-		AVCaptureSessionPreset320x240,
-	)
-except:
-	AVPlayerItemStatusReadyToPlay = 1
-	AVMediaTypeVideo = "vide"
-	AVLayerVideoGravityResizeAspectFill = "AVLayerVideoGravityResizeAspectFill"
-	AVCaptureSessionPreset320x240 = "AVCaptureSessionPreset320x240"
+# WebKit and AVFoundation are imported where first needed (web, movie and
+# video views are created on demand, movies are probed in the background)
+
+startup.mark("frameworks")
 
 
 if sys.version_info[0] == 3:
@@ -283,11 +2150,20 @@ info = bundle.localizedInfoDictionary() or bundle.infoDictionary()
 info['CFBundleName'] = _s(NAME)
 info['NSAppTransportSecurity'] = {'NSAllowsArbitraryLoads': YES}
 
-NO_NOTIFY    = '.'.join([ID, 'no_notify'])
-RECENT_FILES = '.'.join([ID, 'recent_files'])
+NO_NOTIFY         = '.'.join([ID, 'no_notify'])
+RECENT_FILES      = '.'.join([ID, 'recent_files'])
+MINIATURES_BUDGET = '.'.join([ID, 'miniatures_budget']) # in MiB
+SLIDES_BUDGET     = '.'.join([ID, 'slides_budget'])     # in MiB
 user_defaults = NSUserDefaults.standardUserDefaults()
 
-ICON = NSImage.alloc().initWithData_(NSData.dataWithBytes_length_(ICON, len(ICON)))
+icon_images = [] # application icon, decoded on first use
+
+def icon_image():
+	if not icon_images:
+		data = base64.b64decode(ICON)
+		icon_images.append(NSImage.alloc().initWithData_(NSData.dataWithBytes_length_(data, len(data))))
+	return icon_images[0]
+
 arrow = NSCursor.arrowCursor()
 CURSOR = arrow.image()
 X_hot, Y_hot = arrow.hotSpot()
@@ -334,6 +2210,59 @@ file_name = url.lastPathComponent()
 pdf = PDFDocument.alloc().initWithURL_(url)
 if not pdf:
 	exit_usage("'%s' does not seem to be a pdf." % url.path(), 1)
+startup.mark("pdf open")
+
+
+# disk cache
+
+disk_cache = DiskCache(cache_directory())
+background(disk_cache.evict)
+sidecar = Sidecar(url.path(), disk_cache.root)
+document_digest = sidecar.provisional_digest # until digested in the background
+startup.mark("sidecar")
+
+color_space = CGColorSpaceCreateDeviceRGB()
+
+def render_bitmap(size, pixel_size, draw):
+	"""return a CGImage of pixel_size where draw() paints a size points area"""
+	(w, h), (pw, ph) = size, pixel_size
+	context = CGBitmapContextCreate(None, pw, ph, 8, 4*pw, color_space,
+	                                kCGImageAlphaPremultipliedLast)
+	CGContextScaleCTM(context, 1.*pw/w, 1.*ph/h)
+	NSGraphicsContext.saveGraphicsState()
+	NSGraphicsContext.setCurrentContext_(
+		NSGraphicsContext.graphicsContextWithGraphicsPort_flipped_(context, False))
+	draw()
+	NSGraphicsContext.restoreGraphicsState()
+	return CGBitmapContextCreateImage(context)
+
+def cached_image(name, draw=None, size=None, pixel_size=None):
+	"""return an image from the disk cache, rendering and storing it if needed
+	
+	draw may also be a CGImage (then copied at its own size).
+	"""
+	entry = disk_cache.load(document_digest, name)
+	if entry is not None:
+		path, pw, ph = entry
+		data = _e(NSData.dataWithContentsOfFile_options_error_(
+			path, NSDataReadingMappedIfSafe, None))
+		image = CGImageCreate(pw, ph, 8, 32, 4*pw, color_space,
+		                      kCGImageAlphaPremultipliedLast,
+		                      CGDataProviderCreateWithCFData(data),
+		                      None, False, kCGRenderingIntentDefault)
+	elif draw is None:
+		return
+	else:
+		if not callable(draw): # CGImage
+			source = NSImage.alloc().initWithCGImage_size_(draw, (0, 0))
+			size = pixel_size = CGImageGetWidth(draw), CGImageGetHeight(draw)
+			draw = lambda: source.drawInRect_fromRect_operation_fraction_(
+				((0, 0), size), NSZeroRect, NSCompositeCopy, 1.)
+		pw, ph = pixel_size = [int(round(l)) for l in pixel_size]
+		image = render_bitmap(size, pixel_size, draw)
+		data = CGDataProviderCopyData(CGImageGetDataProvider(image))
+		disk_cache.store(document_digest, name, pw, ph, data.bytes())
+	return NSImage.alloc().initWithCGImage_size_(image, size or (pw, ph))
 
 
 # navigation
@@ -357,6 +2286,8 @@ def _goto(page):
 	global current_page
 	current_page = page
 	presentation_show(slide_view)
+	prefetch_slides()
+	prepare_movies()
 
 def _pop_push_page(pop_pages, push_pages):
 	def action():
@@ -387,42 +2318,13 @@ def goto_page(page):
 		_goto(page)
 
 
-pages = list(range(page_count)) # pages index
-
-frames = [] # frames index
-current_label = None
-for page_number in range(page_count):
-	page = pdf.pageAtIndex_(page_number)
-	label = page.label()
-	if label != current_label:
-		# a new frame just started
-		frames.append(page_number)
-		current_label = label
-
-sections = [] # sections index
-outline = pdf.outlineRoot()
-if outline:
-	for i in range(outline.numberOfChildren()):
-		section = outline.childAtIndex_(i)
-		destination = section.destination()
-		sections.append(pdf.indexForPage_(destination.page()))
-
-def _next(index):
-	for page in index:
-		if page > current_page:
-			return page
-	return current_page
-
-def _prev(index):
-	for page in reversed(index):
-		if page < current_page:
-			return page
-	return current_page
+def _next(index): return following(index, current_page)
+def _prev(index): return preceding(index, current_page)
 
 def home_page():    goto_page(first_page)
 def end_page():     goto_page(last_page)
-def next_page():    goto_page(_next(pages))
-def prev_page():    goto_page(_prev(pages))
+def next_page():    goto_page(current_page+1)
+def prev_page():    goto_page(current_page-1)
 def next_frame():   goto_page(_next(frames))
 def prev_frame():   goto_page(_prev(frames))
 def next_section(): goto_page(_next(sections))
@@ -431,117 +2333,232 @@ def prev_section(): goto_page(_prev(sections))
 
 # annotations
 
-player = AVPlayer.playerWithURL_(None)
-nop_event = NSEvent.otherEventWithType_location_modifierFlags_timestamp_windowNumber_context_subtype_data1_data2_(
-	NSEventTypeApplicationDefined, (0, 0), 0, 0., 0, None, 0, 0, 0
-)
+class Movie(object):
+	"""a movie link, its player item and poster are filled when probed"""
+	player_item = None
+	poster = None
+	pending = True
+	
+	def __init__(self, url, key, pixel_size):
+		self.url = url
+		self.key = key # poster name in the disk cache
+		self.pixel_size = pixel_size # of the poster, fitting the link at its largest
 
-class PlayerItemObserver(NSObject):
-	def observeValueForKeyPath_ofObject_change_context_(self, keyPath, item, change, context):
-		assert type(item) == AVPlayerItem
-		assert change["new"] != change["old"]
-		assert change["new"] == item.status()
-		item.removeObserver_forKeyPath_(self, "status")
-		
-		self.playable = item.status() == AVPlayerItemStatusReadyToPlay
-		app.stop_(self)
-		app.postEvent_atStart_(nop_event, True) # we are not in event thread
-item_observer = PlayerItemObserver.alloc().init()
 
+# largest pixels per point of the screens, posters are sized accordingly
+screen_scales = [(screen.frame().size, screen.backingScaleFactor()) for screen in NSScreen.screens()]
+
+def full_screen_scale(size):
+	"""pixels per point of an area of size filling the largest screen"""
+	w, h = size
+	return max([min(sw/w, sh/h)*scale for (sw, sh), scale in screen_scales] or [1.])
 
-def get_movie(url):
-	"""return a AVPlayerItem object from an url if possible/desirable"""
+
+def is_movie(url):
+	"""is the url a local file that may be played"""
 	if not (url and url.scheme() == "file"):
-		return
+		return False
 	mimetype, _ = mimetypes.guess_type(url.absoluteString())
-	if not (mimetype and any(mimetype.startswith(t) for t in ["video", "audio", "image/gif"])):
-		return
-	
-	global restarted
-	asset = AVAsset.assetWithURL_(url)
-	player_item = AVPlayerItem.playerItemWithAsset_automaticallyLoadedAssetKeys_(
-		asset,
-		["playable",],
-	)
-	player_item.addObserver_forKeyPath_options_context_(
-		item_observer, "status",
-		NSKeyValueObservingOptionOld | NSKeyValueObservingOptionNew,
-		None,
-	)
-	player.replaceCurrentItemWithPlayerItem_(player_item)
-	app.run()
-	restarted = True
-	player.replaceCurrentItemWithPlayerItem_(None)
+	return bool(mimetype and any(mimetype.startswith(t) for t in ["video", "audio", "image/gif"]))
+
+
+def probe_movie(movie):
+	"""load a movie asset and its poster (in a background thread)"""
+	from AVFoundation import AVAsset, AVPlayerItem, AVAssetImageGenerator
+	with autorelease_pool():
+		asset = AVAsset.assetWithURL_(movie.url)
+		loaded = threading.Event()
+		asset.loadValuesAsynchronouslyForKeys_completionHandler_(["playable"], loaded.set)
+		loaded.wait()
+		
+		player_item = poster = None
+		if asset.isPlayable():
+			player_item = AVPlayerItem.playerItemWithAsset_(asset)
+			poster = cached_image(movie.key)
+			if poster is None:
+				image_generator = AVAssetImageGenerator.assetImageGeneratorWithAsset_(asset)
+				image_generator.setMaximumSize_(movie.pixel_size) # decoded downscaled
+				image_ref = _e(image_generator.copyCGImageAtTime_actualTime_error_(
+					(0, 1, 1, 0), None, None,
+				))
+				poster = cached_image(movie.key, image_ref)
+		callAfter(movie_probed, movie, player_item, poster)
+
+def movie_probed(movie, player_item, poster):
+	"""fill the probe results in (in the main thread)"""
+	movie.pending = False
+	if player_item is None: # not playable, handle as a plain link
+		for annotation, m in list(movies.items()):
+			if m is movie:
+				del movies[annotation]
+	else:
+		movie.player_item = player_item
+		movie.poster = poster
+	if not any(m.pending for m in movies.values()):
+		startup.done("movie probing")
+	prepare_movies()
+	refresher.refresh_all()
+
+movie_probes = queue.Queue()
+consume(movie_probes, probe_movie, MOVIE_PROBES)
+
+
+class PlayerStatusObserver(NSObject):
+	def observeValueForKeyPath_ofObject_change_context_(self, path, player, change, context):
+		callAfter(prepare_movies) # prerolls the players getting ready still wanted
+
+player_status_observer = PlayerStatusObserver.alloc().init()
+
+class MoviePlayer(object):
+	"""player of a movie for the pool, prerolled once ready to play"""
+	def __init__(self, movie):
+		from AVFoundation import AVPlayer, AVPlayerItem
+		player_item = movie.player_item
+		if player_item is None: # still probing, let the player load it
+			player_item = AVPlayerItem.playerItemWithURL_(movie.url)
+		self.player = AVPlayer.playerWithPlayerItem_(player_item)
+		self.player.addObserver_forKeyPath_options_context_(player_status_observer,
+		                                                    "status", 0, None)
+		self.prerolled = False
 	
-	if not item_observer.playable:
-		return
+	def preroll(self):
+		"""load media data so that playing starts instantly, once ready"""
+		from AVFoundation import AVPlayerStatusReadyToPlay
+		player = self.player
+		if self.prerolled or player.status() != AVPlayerStatusReadyToPlay or player.rate() != 0.:
+			return
+		self.prerolled = True
+		player.prerollAtRate_completionHandler_(1., None)
 	
-	image_generator = AVAssetImageGenerator.assetImageGeneratorWithAsset_(asset)
-	image_ref = _e(image_generator.copyCGImageAtTime_actualTime_error_(
-		(0, 1, 1, 0), None, None,
-	))
-	poster = NSImage.alloc().initWithCGImage_size_(image_ref, (0, 0))
-	return player_item, poster
+	def release(self):
+		"""detach the item, so that another player may use it"""
+		self.player.removeObserver_forKeyPath_(player_status_observer, "status")
+		self.player.pause()
+		self.player.replaceCurrentItemWithPlayerItem_(None)
+
+players = PlayerPool(MoviePlayer)
+
+def prepare_movies():
+	"""preroll the players of the movies of the current and next pages"""
+	wanted = []
+	for page_number in range(current_page, min(current_page+1, last_page)+1):
+		if not document.flags[page_number] & DocumentIndex.HAS_MOVIE:
+			continue
+		for annotation in document.links(page_number):
+			movie = movies.get(annotation)
+			if movie is not None and movie.player_item is not None and movie not in wanted:
+				wanted.append(movie)
+	if wanted:
+		players.prepare(wanted)
+
+
+# document index
+
+def register_link(page_number, i, annotation, probed=None):
+	"""queue movie links to be probed (unless probed maps their url to a
+	movie already probed), return whether the link is a movie"""
+	link_url = annotation.URL()
+	if not is_movie(link_url):
+		return False
+	movie = probed and probed.get(link_url.absoluteString())
+	if movie is None:
+		_, (w, h) = annotation.bounds()
+		_, page_size = document.crop_box(page_number)
+		scale = full_screen_scale(page_size)
+		pw, ph = max(1, int(ceil(w*scale))), max(1, int(ceil(h*scale)))
+		movie = Movie(link_url, "poster-%s-%s-%sx%s" % (page_number, i, pw, ph), (pw, ph))
+		movie_probes.put(movie)
+	movies[annotation] = movie
+	return True
 
+movies = {}
+document = DocumentIndex(pdf, PDFAnnotationText, PDFAnnotationLink,
+                         kPDFDisplayBoxMediaBox, kPDFDisplayBoxCropBox)
+if sidecar.data is None:
+	document.build(register_link)
+	startup.mark("index build")
+else:
+	document.restore(sidecar.data, register_link)
+	startup.mark("index restore")
 
-def annotations(page):
-	return page.annotations() or []
+frames   = document.frames                 # frames index
+sections = sorted(set(document.sections)) # sections index
 
-pdf_notes  = defaultdict(list)
-movies = {}
-for page_number in range(page_count):
-	page = pdf.pageAtIndex_(page_number)
-	for annotation in annotations(page):
-		annotation_type = type(annotation)
-		if annotation_type == PDFAnnotationText:
-			annotation.setShouldDisplay_(False)
-			pdf_notes[page_number].append(annotation.contents().replace('\r', '\n'))
-		elif annotation_type == PDFAnnotationLink:
-			movie = get_movie(annotation.URL())
-			if movie:
-				movies[annotation] = movie
 
+# thumbnails
 
-# beamer notes
+# miniatures layout, images are rendered on demand
+thumbnails = document.miniatures_layout(MINIATURE_WIDTH-MINIATURE_MARGIN, MINIATURE_MARGIN)
+MINIATURES_HEIGHT = thumbnails.height
 
-def lines(selection):
-	return [line.string() for line in selection.selectionsByLine() or []]
+if sidecar.data is None: # persists index and layout for next launches
+	sidecar.save(document.dump())
+startup.mark("miniatures layout")
 
-beamer_notes = defaultdict(list)
-title_page = pdf.pageAtIndex_(0)
-(x, y), (w, h) = title_page.boundsForBox_(kPDFDisplayBoxMediaBox)
-
-if w/h > 7/3: # likely to be a two screens pdf
-	# heuristic to guess template of note slide
-	w /= 2
-	title = lines(title_page.selectionForRect_(((x, y), (w, h))))
-	miniature = lines(title_page.selectionForRect_(((x+w+3*w/4, y+3*h/4), (w/4, h/4))))
-	header = miniature and all( # miniature do not have navigation
-		line in title
-		for line in miniature
-	)
-	for page_number in range(page_count):
-		page = pdf.pageAtIndex_(page_number)
-		(x, y), (w, h) = page.boundsForBox_(kPDFDisplayBoxMediaBox)
-		w /= 2
-		page.setBounds_forBox_(((x, y), (w, h)), kPDFDisplayBoxCropBox)
-		selection = page.selectionForRect_(((x+w, y), (w, 3*h/4 if header else h)))
-		beamer_notes[page_number].append('\n'.join(lines(selection)))
 
+# beamer notes
 
-# thumbnails
+def extract_beamer_notes():
+	"""extract the notes of two screens pdfs (in a background thread)"""
+	index = document
+	with autorelease_pool():
+		notes_pdf = PDFDocument.alloc().initWithURL_(url)
+	notes = index.extract_notes(notes_pdf, lambda: current_page)
+	while index is document: # until reloaded
+		with autorelease_pool():
+			try:
+				page_number, page_notes = next(notes)
+			except StopIteration:
+				break
+		callAfter(beamer_notes_extracted, index, page_number, page_notes)
+
+def beamer_notes_extracted(index, page_number, page_notes):
+	"""fill notes in (in the main thread), persists them once complete"""
+	if index is not document:
+		return
+	document.beamer_notes[page_number] = page_notes
+	if page_number == current_page:
+		refresher.refresh([presenter_view])
+	if len(document.beamer_notes) == document.page_count:
+		sidecar.save(document.dump())
+		startup.done("notes extraction")
+
+if document.two_screens and len(document.beamer_notes) < document.page_count:
+	background(extract_beamer_notes)
+
+main_screen = NSScreen.mainScreen()
+backing_scale = main_screen.backingScaleFactor() if main_screen else 1.
+
+def image_size(image):
+	"""estimated memory footprint of an image drawn on screen"""
+	w, h = image.size()
+	return 4 * w * h * backing_scale**2
+
+miniatures = LRUCache(
+	(user_defaults.integerForKey_(MINIATURES_BUDGET) or 64) * 2**20,
+	image_size,
+)
 
-origin = 0
-thumbnails = {}
-for page_number in range(page_count):
-	page = pdf.pageAtIndex_(page_number)
-	_, (w, h) = page.boundsForBox_(kPDFDisplayBoxCropBox)
-	width = MINIATURE_WIDTH-MINIATURE_MARGIN
-	height = h*width/w
-	thumbnail = page.thumbnailOfSize_forBox_((width, height), kPDFDisplayBoxCropBox)
-	thumbnails[page_number] = (width, height, origin), thumbnail
-	origin += height + MINIATURE_MARGIN
-MINIATURES_HEIGHT = origin
+def thumbnail(page_number):
+	"""return the miniature of a page, rendering it if not cached"""
+	image = miniatures.get(page_number)
+	if image is None:
+		width, height, _ = thumbnails[page_number]
+		pw, ph = int(round(width*backing_scale)), int(round(height*backing_scale))
+		page = document.page(page_number)
+		def draw():
+			bounds = document.crop_box(page_number)
+			(x, y), (w, _) = bounds
+			transform = NSAffineTransform.transform()
+			transform.scaleBy_(width/w)
+			transform.translateXBy_yBy_(-x, -y) # crop box at the origin of the bitmap
+			transform.concat()
+			NSEraseRect(bounds)
+			page.drawWithBox_(kPDFDisplayBoxCropBox)
+		image = cached_image("thumbnail-%s-%sx%s" % (page_number, pw, ph), draw,
+		                     (width, height), (pw, ph))
+		miniatures[page_number] = image
+	return image
 
 
 # interaction state
@@ -549,7 +2566,239 @@ MINIATURES_HEIGHT = origin
 IDLE, BBOX, CLIC, DRAW = range(4)
 state = IDLE
 
-drawings = defaultdict(list)
+# finished strokes of each page as (points, color, size), read from the log
+# of the document when the page is first shown
+stroke_log = StrokeLog(os.path.join(data_directory(), "strokes", "%s.log" %
+                       hashlib.sha1(url.path().encode("utf-8")).hexdigest()))
+drawings = {}
+current_stroke = None # (page_number, points, path, color, size) being drawn
+
+def page_strokes(page_number):
+	if page_number not in drawings:
+		drawings[page_number] = stroke_log.strokes(page_number)
+	return drawings[page_number]
+
+
+# reloading
+
+def unchanged_since(key):
+	"""whether the document file still has the (size, mtime) key"""
+	try:
+		stat = os.stat(url.path())
+	except OSError:
+		return False
+	return (stat.st_size, stat.st_mtime) == tuple(key)
+
+def fingerprint_pages():
+	"""fingerprint the pages of the document (in a background thread)"""
+	index = document
+	with autorelease_pool():
+		fingerprints_pdf = PDFDocument.alloc().initWithURL_(url)
+	if not fingerprints_pdf:
+		return
+	pages = index.fingerprint(fingerprints_pdf)
+	fingerprints = {}
+	while index is document: # until reloaded
+		with autorelease_pool():
+			try:
+				page_number, fingerprint = next(pages)
+			except StopIteration:
+				break
+		fingerprints[page_number] = fingerprint
+	if unchanged_since(sidecar.key): # fingerprints are those of the indexed file
+		callAfter(pages_fingerprinted, index, fingerprints)
+
+def pages_fingerprinted(index, fingerprints):
+	"""fill fingerprints in (in the main thread) and persist them"""
+	if index is not document:
+		return
+	for page_number, fingerprint in fingerprints.items():
+		document.fingerprints[page_number] = fingerprint
+	sidecar.save(document.dump())
+	stroke_log.fingerprint(document.fingerprints)
+
+def fingerprint_document(index, fingerprints_pdf):
+	"""fingerprint the missing pages of index from an unprepared pdf"""
+	pages = index.fingerprint(fingerprints_pdf)
+	while True:
+		with autorelease_pool():
+			try:
+				page_number, fingerprint = next(pages)
+			except StopIteration:
+				break
+		index.fingerprints[page_number] = fingerprint
+
+def digest_document(digested_sidecar):
+	"""digest the document (in a background thread)"""
+	try:
+		digest = file_digest(digested_sidecar.document_path)
+	except (IOError, OSError):
+		return
+	callAfter(document_digested, digested_sidecar, digest)
+
+def document_digested(digested_sidecar, digest):
+	"""key caches and strokes on the digest (in the main thread)"""
+	global document_digest
+	if digested_sidecar is not sidecar or not unchanged_since(sidecar.key):
+		return
+	disk_cache.move(document_digest, digest)
+	sidecar.digested(digest)
+	document_digest = digest
+	stroke_log.fingerprint(document.fingerprints)
+	stroke_log.document(document_digest)
+
+def stroke_fingerprint(page_number):
+	"""fingerprint of a page strokes are drawn on, computed now if the
+	background fingerprinting has not reached it yet"""
+	if document.fingerprints[page_number] is None and unchanged_since(sidecar.key):
+		with autorelease_pool():
+			fingerprints_pdf = PDFDocument.alloc().initWithURL_(url)
+			if fingerprints_pdf:
+				for _, fingerprint in document.fingerprint(fingerprints_pdf, [page_number]):
+					document.fingerprints[page_number] = fingerprint
+	return document.fingerprints[page_number]
+
+if sidecar.known_digest is None and stroke_log.offsets and stroke_log.digest is not None:
+	# telling whether strokes were drawn on another version needs the digest
+	disk_cache.move(document_digest, sidecar.digest)
+	document_digest = sidecar.digest
+	sidecar.save(document.dump())
+
+if sidecar.known_digest is None:
+	background(digest_document, sidecar)
+else:
+	if stroke_log.stale(document_digest): # strokes drawn on another version
+		if None in document.fingerprints:
+			with autorelease_pool():
+				fingerprint_document(document, PDFDocument.alloc().initWithURL_(url))
+			sidecar.save(document.dump())
+		stroke_log.remap(document_digest, document.fingerprints)
+	stroke_log.fingerprint(document.fingerprints)
+	stroke_log.document(document_digest)
+
+if None in document.fingerprints:
+	background(fingerprint_pages)
+
+reloads = 0 # requested since the one in progress started, this one included
+
+def reload_document():
+	"""reload the document in the background, pages left unchanged keep
+	their notes, renderings and strokes"""
+	global reloads
+	reloads += 1
+	if reloads == 1:
+		background(load_document)
+
+def load_document():
+	"""open, fingerprint and index the document (in a background thread)"""
+	with autorelease_pool():
+		try:
+			new_sidecar = Sidecar(url.path(), disk_cache.root)
+		except (IOError, OSError):
+			callAfter(document_loaded, None)
+			return
+		new_pdf = PDFDocument.alloc().initWithURL_(url)
+		if not new_pdf:
+			callAfter(document_loaded, None)
+			return
+	index = DocumentIndex(new_pdf, PDFAnnotationText, PDFAnnotationLink,
+	                      kPDFDisplayBoxMediaBox, kPDFDisplayBoxCropBox)
+	
+	links = [] # registered once swapped in
+	def on_link(page_number, i, annotation):
+		links.append((page_number, i, annotation))
+		return is_movie(annotation.URL())
+	
+	if new_sidecar.data is None:
+		fingerprint_document(index, new_pdf) # before build prepares the pages
+		with autorelease_pool():
+			index.build(on_link)
+	else:
+		with autorelease_pool():
+			index.restore(new_sidecar.data, on_link)
+	
+	if not unchanged_since(new_sidecar.key): # written to meanwhile
+		index = None
+	callAfter(document_loaded, index, new_sidecar, links)
+
+def document_loaded(index, new_sidecar=None, links=()):
+	"""swap the reloaded document in (in the main thread)"""
+	global reloads, pdf, document, sidecar, document_digest, frames, sections
+	global thumbnails, MINIATURES_HEIGHT, page_count, last_page, current_page
+	global current_stroke
+	requested, reloads = reloads, 0
+	if requested > 1:
+		reload_document()
+	if index is None:
+		sys.stderr.write("could not reload '%s'\n" % url.path())
+		return
+	
+	matches = match_pages(document.fingerprints, index.fingerprints) # new: old
+	moved = dict((old, new) for new, old in matches.items())
+	
+	# notes and caches of unchanged pages
+	for new, old in matches.items():
+		if old in document.beamer_notes:
+			index.beamer_notes.setdefault(new, document.beamer_notes[old])
+	def remap(key):
+		if key[0] in moved:
+			return (moved[key[0]],) + key[1:]
+	slides.rekey(remap)
+	inks.rekey(remap)
+	miniatures.rekey(moved.get)
+	prerendering.clear()
+	versions = dict((moved[p], v) for p, v in ink_versions.items() if p in moved)
+	ink_versions.clear()
+	ink_versions.update(versions)
+	
+	# strokes follow their page, those of pages changed in place stay
+	strokes_pages = dict(moved)
+	for page_number in range(min(document.page_count, index.page_count)):
+		if page_number not in moved and page_number not in matches:
+			strokes_pages[page_number] = page_number
+	stroke_log.renumber(dict((p, strokes_pages.get(p)) for p in stroke_log.offsets),
+	                    index.fingerprints)
+	drawings.clear()
+	
+	pdf, document, sidecar = index.pdf, index, new_sidecar
+	document_digest = sidecar.provisional_digest # until digested in the background
+	frames   = document.frames
+	sections = sorted(set(document.sections))
+	thumbnails = document.miniatures_layout(MINIATURE_WIDTH-MINIATURE_MARGIN, MINIATURE_MARGIN)
+	MINIATURES_HEIGHT = thumbnails.height
+	sidecar.save(document.dump())
+	stroke_log.fingerprint(document.fingerprints)
+	if sidecar.known_digest is None:
+		background(digest_document, sidecar)
+	else:
+		stroke_log.document(document_digest)
+	
+	# movies already probed are kept
+	probed = dict((m.url.absoluteString(), m) for m in movies.values() if not m.pending)
+	movies.clear()
+	poster_rects.clear()
+	for page_number, i, annotation in links:
+		register_link(page_number, i, annotation, probed)
+	
+	# presenter state carries over
+	page_count = document.page_count
+	last_page = page_count-1
+	current_page = max(first_page, min(current_page, last_page))
+	past_pages[:] = [p for p in past_pages if p <= last_page]
+	future_pages[:] = [p for p in future_pages if p <= last_page]
+	if current_stroke:
+		current_stroke = (min(current_stroke[0], last_page),) + current_stroke[1:]
+	
+	if document.two_screens and len(document.beamer_notes) < document.page_count:
+		background(extract_beamer_notes)
+	if None in document.fingerprints:
+		background(fingerprint_pages)
+	prefetch_slides()
+	prepare_movies()
+	refresher.refresh_all()
+
+if watch_document: # reloads once the document has been rewritten
+	FileWatcher(url.path(), lambda: callAfter(reload_document)).watch()
 
 
 # page drawing ###############################################################
@@ -570,44 +2819,228 @@ def stroke(path, color=NSColor.blackColor(), outline=NSColor.whiteColor(), size=
 	path.setLineWidth_(size)
 	path.stroke()
 
+def stroke_path(points):
+	"""bezier path through a flat array of x, y coordinates"""
+	path = NSBezierPath.bezierPath()
+	path.setLineCapStyle_(NSRoundLineCapStyle)
+	path.setLineJoinStyle_(NSRoundLineJoinStyle)
+	path.moveToPoint_((points[0], points[1]))
+	for i in range(2, len(points), 2):
+		path.lineToPoint_((points[i], points[i+1]))
+	return path
+
+def color_bytes(color):
+	"""(r, g, b, a) bytes of a color"""
+	rgba = color.colorUsingColorSpaceName_(NSCalibratedRGBColorSpace).getRed_green_blue_alpha_(
+		None, None, None, None)
+	return tuple(int(round(255*c)) for c in rgba)
+
+def draw_strokes(strokes):
+	for points, (r, g, b, a), size in strokes:
+		color = NSColor.colorWithCalibratedRed_green_blue_alpha_(r/255., g/255., b/255., a/255.)
+		stroke(stroke_path(points), color, size=size)
+
+
+# slides are rendered as bitmaps (pages around the current one in advance),
+# so that redraws and page turns are mostly blits
+
+slides = LRUCache((user_defaults.integerForKey_(SLIDES_BUDGET) or 256) * 2**20)
+slide_scales = {} # pixels per point of the views showing slides
+slide_renders = queue.Queue() # (page_number, width, height) to prerender
+prerendering = set()
+
+def slide_key(page_number, scale):
+	"""cache key of a page drawn at scale, None if too large to be cached"""
+	_, (w, h) = document.crop_box(page_number)
+	pw, ph = int(ceil(w*scale)), int(ceil(h*scale))
+	if pw*ph > MAX_SLIDE_PIXELS:
+		return
+	return page_number, pw, ph
+
+def render_slide(index, page_number, pw, ph):
+	"""bitmap of the crop box of a page, drawn in page space like the overlays"""
+	page = index.page(page_number)
+	bounds = index.crop_box(page_number)
+	(x, y), size = bounds
+	def draw():
+		transform = NSAffineTransform.transform()
+		transform.translateXBy_yBy_(-x, -y) # crop box at the origin of the bitmap
+		transform.concat()
+		NSEraseRect(bounds)
+		page.drawWithBox_(kPDFDisplayBoxCropBox)
+	return NSImage.alloc().initWithCGImage_size_(
+		render_bitmap(size, (pw, ph), draw), size)
+
+def draw_slide(page_number, scale, view):
+	"""draw the content of a page at scale pixels per point for view"""
+	if slide_scales.get(view) != scale:
+		slide_scales[view] = scale
+		prefetch_slides()
+	bounds = document.crop_box(page_number)
+	key = slide_key(page_number, scale)
+	if key is None:
+		NSEraseRect(bounds)
+		document.page(page_number).drawWithBox_(kPDFDisplayBoxCropBox)
+		return
+	image = slides.get(key)
+	if image is None:
+		image = render_slide(document, *key)
+		slides.put(key, image, 4*key[1]*key[2])
+	image.drawInRect_fromRect_operation_fraction_(bounds, NSZeroRect, NSCompositeCopy, 1.)
+
+def prefetch_slides():
+	"""queue the rendering of the pages around the current one"""
+	for page_number in range(max(first_page, current_page-PREFETCH_PAGES),
+	                         min(last_page, current_page+PREFETCH_PAGES)+1):
+		for scale in set(slide_scales.values()):
+			key = slide_key(page_number, scale)
+			if key is None or key in slides or key in prerendering:
+				continue
+			prerendering.add(key)
+			slide_renders.put(key)
+
+prerender_index = [] # index and its copy for the prerenderer document instance
+
+def prerender(key):
+	"""render a slide (in a background thread)"""
+	page_number, pw, ph = key
+	index, image = document, None
+	if abs(page_number - current_page) <= PREFETCH_PAGES: # still useful
+		with autorelease_pool():
+			if not prerender_index or prerender_index[0] is not index: # pdf documents are not thread safe
+				prerender_index[:] = [index, index.rebind(PDFDocument.alloc().initWithURL_(url))]
+			image = render_slide(prerender_index[1], *key)
+	callAfter(prerendered, index, key, image)
+
+def prerendered(index, key, image):
+	prerendering.discard(key)
+	if image is not None and index is document: # not reloaded meanwhile
+		slides.put(key, image, 4*key[1]*key[2])
+
+consume(slide_renders, prerender)
+
+
+# finished strokes are simplified and flattened into a bitmap per page (its
+# ink layer), only the stroke in progress is drawn as vectors
+
+inks = LRUCache(INK_CACHE_SIZE)
+ink_versions = defaultdict(int) # bumped when the strokes of a page change
+
+def end_stroke():
+	"""simplify the stroke in progress and add it to its page"""
+	global current_stroke
+	page_number, points, _, color, size = current_stroke
+	current_stroke = None
+	tolerance = INK_TOLERANCE / max(list(slide_scales.values()) or [1.])
+	points, color = array('f', simplify(points, tolerance)), color_bytes(color)
+	page_strokes(page_number).append((points, color, size))
+	stroke_log.append(page_number, points, color, size, stroke_fingerprint(page_number))
+	ink_versions[page_number] += 1
+
+def erase_strokes(page_number):
+	drawings[page_number] = []
+	stroke_log.erase(page_number)
+	ink_versions[page_number] += 1
+
+def render_ink(strokes, bounds, pw, ph):
+	(x, y), size = bounds
+	def draw():
+		NSRectFillUsingOperation(((0, 0), size), NSCompositeClear)
+		transform = NSAffineTransform.transform()
+		transform.translateXBy_yBy_(-x, -y)
+		transform.concat()
+		draw_strokes(strokes)
+	return NSImage.alloc().initWithCGImage_size_(
+		render_bitmap(size, (pw, ph), draw), size)
+
+def draw_ink(page_number, scale):
+	"""draw the strokes of a page at scale pixels per point"""
+	strokes = page_strokes(page_number)
+	if strokes:
+		key = page_number, ink_versions[page_number], scale
+		ink = inks.get(key)
+		if ink is None:
+			bounds = strokes_bounds(strokes, document.crop_box(page_number))
+			_, (w, h) = bounds
+			pw, ph = int(ceil(w*scale)), int(ceil(h*scale))
+			if pw*ph > MAX_SLIDE_PIXELS: # too large to be cached
+				draw_strokes(strokes)
+			else:
+				ink = render_ink(strokes, bounds, pw, ph), bounds
+				inks.put(key, ink, 4*pw*ph)
+		if ink is not None:
+			image, bounds = ink
+			image.drawInRect_fromRect_operation_fraction_(
+				bounds, NSZeroRect, NSCompositeSourceOver, 1.)
+	
+	if current_stroke and current_stroke[0] == page_number:
+		_, _, path, color, size = current_stroke
+		stroke(path, color, size=size)
+
 
-def draw_page(page):
+def transform_scale(transform):
+	"""scale factor of an affine transform"""
+	t = transform.transformStruct()
+	return sqrt(abs(t.m11*t.m22 - t.m12*t.m21))
+
+poster_rects = {} # letterboxed poster of each movie link, None if too small
+
+def poster_rect(annotation, poster):
+	"""bounds of a poster fitting a movie link, keeping its aspect ratio"""
+	if annotation not in poster_rects:
+		(x, y), (w, h) = annotation.bounds()
+		rect = None
+		if h >= MIN_POSTER_HEIGHT:
+			pw, ph = poster.size()
+			aspect_ratio = (pw*h)/(w*ph)
+			if aspect_ratio < 1:
+				dw = w * (1.-aspect_ratio)
+				x += dw/2.
+				w -= dw
+			else:
+				dh = h * (1.-1./aspect_ratio)
+				y += dh/2.
+				h -= dh
+			rect = (x, y), (w, h)
+		poster_rects[annotation] = rect
+	return poster_rects[annotation]
+
+def draw_page(page_number, scale, view):
 	bbox.concat()
 	
-	NSEraseRect(page.boundsForBox_(kPDFDisplayBoxCropBox))
-	page.drawWithBox_(kPDFDisplayBoxCropBox)
-	
-	for annotation in annotations(page):
+	scale *= transform_scale(bbox)
+	draw_slide(page_number, scale, view)
+	draw_overlays(page_number, scale)
+
+def draw_overlays(page_number, scale):
+	"""draw the posters of the movies and the ink of a page"""
+	for annotation in document.links(page_number):
 		if not annotation in movies:
 			continue
-		bounds = annotation.bounds()
 		
-		_, poster = movies[annotation]
-		if poster is None:
+		poster = movies[annotation].poster
+		if poster is None: # not probed yet
 			continue
 		
-		bounds_size = bounds.size
-		if bounds_size.height < MIN_POSTER_HEIGHT:
-			continue
-		
-		poster_size = poster.size()
-		aspect_ratio = ((poster_size.width*bounds_size.height)/
-		                (bounds_size.width*poster_size.height))
-		if aspect_ratio < 1:
-			dw = bounds.size.width * (1.-aspect_ratio)
-			bounds.origin.x += dw/2.
-			bounds.size.width -= dw
-		else:
-			dh = bounds.size.height * (1.-1./aspect_ratio)
-			bounds.origin.y += dh/2.
-			bounds.size.height -= dh
-		
-		poster.drawInRect_fromRect_operation_fraction_(
-			bounds, NSZeroRect, NSCompositeCopy, 1.
-		)
+		rect = poster_rect(annotation, poster)
+		if rect is not None:
+			poster.drawInRect_fromRect_operation_fraction_(
+				rect, NSZeroRect, NSCompositeCopy, 1.
+			)
 	
-	for path, color, size in drawings[current_page]:
-		stroke(path, color, size=size)
+	draw_ink(page_number, scale)
+
+def overlays_state(page_number):
+	"""what the overlays of a page depend on: its ink and probed posters"""
+	posters = ()
+	if document.flags[page_number] & DocumentIndex.HAS_MOVIE:
+		posters = tuple(movies[annotation].poster is not None
+		                for annotation in document.links(page_number) if annotation in movies)
+	return ink_versions[page_number], posters
+
+
+# timings of the drawing stages of the views, toggled with 'i'
+profiler = FrameProfiler()
 
 
 # presentation ###############################################################
@@ -618,17 +3051,27 @@ class SlideView(NSView):
 	show_cursor = False
 	show_spotlight = False
 	hide_timer = None
+	drawn = None # inputs when last drawn
+	
+	def inputs(self):
+		"""what the drawing depends on (but the cursor)"""
+		return (current_page, bbox.transformStruct(), ink_versions[current_page],
+		        self.show_spotlight, self.spotlight_radius, self.cursor_scale)
+	
+	def refresh_changes(self):
+		if self.drawn != self.inputs():
+			self.setNeedsDisplay_(True)
 	
 	def drawRect_(self, rect):
+		profiler.begin("slide")
+		self.drawn = self.inputs()
 		bounds = self.bounds()
 		width, height = bounds.size
 		
 		NSRectFillUsingOperation(bounds, NSCompositeClear)
 		
 		# current page
-		page = pdf.pageAtIndex_(current_page)
-		page_rect = page.boundsForBox_(kPDFDisplayBoxCropBox)
-		_, (w, h) = page_rect
+		_, (w, h) = document.crop_box(current_page)
 		r = min(width/w, height/h)
 		
 		NSGraphicsContext.saveGraphicsState()
@@ -637,7 +3080,8 @@ class SlideView(NSView):
 		transform.scaleXBy_yBy_(r, r)
 		transform.translateXBy_yBy_(-w/2., -h/2.)
 		transform.concat()
-		draw_page(page)
+		draw_page(current_page, r*self.window().backingScaleFactor(), "slide")
+		profiler.mark("page")
 		
 		x, y = cursor_location
 		if self.show_spotlight:
@@ -663,6 +3107,10 @@ class SlideView(NSView):
 		self.transform = transform
 		self.transform.invert()
 		NSGraphicsContext.restoreGraphicsState()
+		profiler.mark("cursor")
+		profiler.end()
+		if not startup.reported:
+			startup.report("first frame")
 	
 	def showCursor(self):
 		self.show_cursor = True
@@ -683,6 +3131,8 @@ class MovieView(NSView):
 	def initWithFrame_(self, frame):
 		assert NSView.initWithFrame_(self, frame) == self
 		
+		from AVFoundation import AVPlayer, AVPlayerLayer
+		self.player = player = AVPlayer.playerWithURL_(None) # until one of the pool is shown
 		self.setWantsLayer_(True)
 		player_layer = AVPlayerLayer.playerLayerWithPlayer_(player)
 		player_layer.setFrame_(frame)
@@ -693,6 +3143,10 @@ class MovieView(NSView):
 		self.slider.setAction_("slide:")
 		add_subview(self, self.slider, NSViewWidthSizable)
 		
+		self.progress = PlaybackProgress(self.showProgress_)
+		self.observer = None # (player, periodic time observer) while playing
+		self.observed_duration = None
+		
 		return self
 	
 	def mouseDown_(self, event):
@@ -710,56 +3164,72 @@ class MovieView(NSView):
 		self._pause()
 		
 		p = slider.doubleValue()
-		(t, st, _, _) = player.currentTime()
+		(t, st, _, _) = self.player.currentTime()
 		try:
-			(d, sd, _, _) = player.currentItem().duration()
+			(d, sd, _, _) = self.player.currentItem().duration()
 			t = int(p*(1.*d/sd)*st)
 		except: # no current item
 			return
-		player.seekToTime_toleranceBefore_toleranceAfter_(
+		self.player.seekToTime_toleranceBefore_toleranceAfter_(
 			(t, st, 1, 0), (1, st, 1, 0), (1, st, 1, 0))
 		self.seekSlider_(None)
 	
 	def stepByCount_(self, count):
 		self._pause()
-		player.currentItem().stepByCount_(count)
+		self.player.currentItem().stepByCount_(count)
 		self.seekSlider_(None)
 	
 	def seekSlider_(self, timer):
-		(t, st, _, _) = player.currentTime()
-		try:
-			(d, sd, _, _) = player.currentItem().duration()
-			p = (1.*t/st) / (1.*d/sd)
-		except: # no current item
-			return 0.
-		self.slider.setDoubleValue_(p)
-		return p
+		item = self.player.currentItem()
+		if item is None:
+			return
+		duration = cmtime_seconds(item.duration())
+		if self.observer is not None and duration != self.observed_duration:
+			self.observe() # duration was not known yet
+		self.progress.update(cmtime_seconds(self.player.currentTime()), duration, self.isPlaying())
+	
+	def showProgress_(self, position):
+		self.slider.setDoubleValue_(position)
 	
 	def play(self):
-		player.play()
-		self.timer = NSTimer.scheduledTimerWithTimeInterval_target_selector_userInfo_repeats_(
-			1./15,
-			self, self.seekSlider_,
-			None, YES
-		)
+		self.player.play()
+		self.observe()
+	
+	def observe(self):
+		"""follow the progress while playing, as often as the slider may show it"""
+		self.unobserve()
+		item = self.player.currentItem()
+		if item is None:
+			return
+		self.progress.width = self.slider.convertSizeToBacking_(self.slider.bounds().size).width
+		self.observed_duration = duration = cmtime_seconds(item.duration())
+		interval = self.progress.interval(duration)
+		self.observer = self.player, self.player.addPeriodicTimeObserverForInterval_queue_usingBlock_(
+			(int(ceil(interval*600)), 600, 1, 0), None, lambda time: self.seekSlider_(None))
+	
+	def unobserve(self):
+		if self.observer is not None:
+			player, observer = self.observer
+			player.removeTimeObserver_(observer)
+			self.observer = None
 	
-	def playItem_(self, player_item):
-		player.replaceCurrentItemWithPlayerItem_(player_item)
+	def playPlayer_(self, player):
+		if player is not self.player:
+			self._pause()
+			self.player = player
+			self.layer().setPlayer_(player)
 		self.play()
 	
 	def _pause(self):
-		player.pause()
-		try:
-			self.timer.invalidate()
-		except:
-			pass
+		self.player.pause()
+		self.unobserve()
 
 	def pause(self):
 		self._pause()
 		self.seekSlider_(None)
 	
 	def isPlaying(self):
-		return player.rate() > 0.
+		return self.player.rate() > 0.
 
 
 class VideoView(NSView):
@@ -772,6 +3242,17 @@ class VideoView(NSView):
 		self.w = w
 		self.h = h
 		self.setTranslatesAutoresizingMaskIntoConstraints_(False)
+		
+		from AVFoundation import AVCaptureSession, AVCaptureVideoPreviewLayer
+		try: # missing constants for some bindings
+			from AVFoundation import (
+				AVLayerVideoGravityResizeAspectFill,
+				AVCaptureSessionPreset320x240,
+			)
+		except ImportError:
+			AVLayerVideoGravityResizeAspectFill = "AVLayerVideoGravityResizeAspectFill"
+			AVCaptureSessionPreset320x240 = "AVCaptureSessionPreset320x240"
+		
 		self.session = AVCaptureSession.alloc().init()
 		if self.session.canSetSessionPreset_(AVCaptureSessionPreset320x240):
 			self.session.setSessionPreset_(AVCaptureSessionPreset320x240)
@@ -787,6 +3268,11 @@ class VideoView(NSView):
 	
 	def setHidden_(self, hidden):
 		if hidden == False:
+			from AVFoundation import AVCaptureDevice, AVCaptureDeviceInput
+			try: # missing constant for some bindings
+				from AVFoundation import AVMediaTypeVideo
+			except ImportError:
+				AVMediaTypeVideo = "vide"
 			device = AVCaptureDevice.defaultDeviceWithMediaType_(AVMediaTypeVideo)
 			input = _e(AVCaptureDeviceInput.deviceInputWithDevice_error_(device, None))
 			if self.session.canAddInput_(input):
@@ -810,55 +3296,66 @@ class VideoView(NSView):
 
 class MessageView(NSView):
 	fps = 20. # frame per seconds for animation
-	pps = 40. # pixels per seconds for scrolling
+	pps = 40. # pixels per seconds for scrolling (when feed is not crowded)
 	
-	input_lines = [u"…"]
-	should_check = True
+	text = None # message being scrolled
+	timer = None # animation timer, only running while scrolling
 	
 	def initWithFrame_(self, frame):
 		assert NSView.initWithFrame_(self, frame) == self
-		self.redisplay_timer = NSTimer.scheduledTimerWithTimeInterval_target_selector_userInfo_repeats_(
-			1./self.fps,
-			self, "redisplay:", nil,
-			True
-		)
-		return self
-	
-	def redisplay_(self, timer):
-		self.setNeedsDisplay_(True)
-	
-	def check_input(self):
-		while True:
-			ready, _, _ = select.select([sys.stdin], [], [], 0)
-			if not ready:
-				break
-			line = sys.stdin.readline().decode('utf-8')
-			self.input_lines.append(line.rstrip())
-	
-	def drawRect_(self, rect):
-		if self.should_check:
-			self.check_input()
-			try:
-				self.text = self.input_lines.pop(0)
-			except IndexError:
-				pass
-			else:
-				self.start = time.time()
-				self.should_check = False
-		text = NSString.stringWithString_(self.text)
-		x = rect.size.width - self.pps*(time.time()-self.start)
-		for attr in [{
+		self.attributes = [{
 			NSFontAttributeName:            NSFont.labelFontOfSize_(30),
 			NSStrokeColorAttributeName:     NSColor.colorWithDeviceWhite_alpha_(0., .75),
 			NSStrokeWidthAttributeName:     20.,
 		}, {
 			NSFontAttributeName:            NSFont.labelFontOfSize_(30),
 			NSForegroundColorAttributeName: NSColor.colorWithDeviceWhite_alpha_(1., .75),
-		}]:
-			text.drawAtPoint_withAttributes_((x, 4.), attr)
-		tw, _ = text.sizeWithAttributes_(attr)
-		if x < -tw:
-			self.should_check = True
+		}]
+		return self
+	
+	def wake(self):
+		"""a message has been queued"""
+		if self.text is None:
+			self.next_message()
+	
+	def next_message(self):
+		self.setNeedsDisplay_(True)
+		message = feed.pop()
+		if message is None:
+			self.text = None
+			if self.timer:
+				self.timer.invalidate()
+				self.timer = None
+			return
+		self.text = [ # outline then fill
+			NSAttributedString.alloc().initWithString_attributes_(message, attributes)
+			for attributes in self.attributes
+		]
+		self.text_width, _ = self.text[-1].size()
+		self.speed = feed.speed(self.pps)
+		self.start = time.time()
+		if self.timer is None:
+			self.timer = NSTimer.scheduledTimerWithTimeInterval_target_selector_userInfo_repeats_(
+				1./self.fps,
+				self, "redisplay:", nil,
+				True
+			)
+	
+	def position(self):
+		return self.bounds().size.width - self.speed*(time.time()-self.start)
+	
+	def redisplay_(self, timer):
+		if self.position() < -self.text_width: # scrolled out
+			self.next_message()
+		else:
+			self.setNeedsDisplay_(True)
+	
+	def drawRect_(self, rect):
+		if self.text is None:
+			return
+		x = self.position()
+		for text in self.text:
+			text.drawAtPoint_((x, 4.))
 
 
 # presenter view #############################################################
@@ -870,6 +3367,41 @@ def transform_rect(transform, rect):
 	origin, size = rect
 	return (transform.transformPoint_(origin), transform.transformSize_(size))
 
+
+# text is laid out once for given font size and width
+
+text_layouts = LRUCache(256)
+
+def text_layout(text, font_size, width=None):
+	"""return text as an attributed string (white, in label font) and its size"""
+	key = text, font_size, width
+	layout = text_layouts.get(key)
+	if layout is None:
+		attributed = NSAttributedString.alloc().initWithString_attributes_(text, {
+			NSFontAttributeName:            NSFont.labelFontOfSize_(font_size),
+			NSForegroundColorAttributeName: NSColor.whiteColor(),
+		})
+		if width is None:
+			size = attributed.size()
+		else:
+			_, size = attributed.boundingRectWithSize_options_(
+				(width, 1e6), NSStringDrawingUsesLineFragmentOrigin)
+		layout = text_layouts[key] = attributed, size
+	return layout
+
+help_layout = [] # parsed on first display
+
+def help_text():
+	if not help_layout:
+		help_layout.append(_h("".join([
+			"<table style='color: white; font-family: LucidaGrande; font-size: 8pt;'>"
+		] + [
+			"<tr><th style='padding: 0 1em;' align='right'>%s</th><td>%s</td></tr>" % h for h in HELP
+		] + [
+			"</table>"
+		])))
+	return help_layout[0]
+
 class PresenterView(NSView):
 	transform = NSAffineTransform.transform()
 	duration = presentation_duration * 60.
@@ -884,6 +3416,8 @@ class PresenterView(NSView):
 	miniature_origin = 0
 	page_state = None
 	page = None
+	regions = None # layout of the regions when last drawn
+	drawn = None # inputs of the regions when last drawn
 	
 	def draw_miniatures(self):
 		_, (width, height) = self.bounds()
@@ -892,37 +3426,99 @@ class PresenterView(NSView):
 		
 		if self.page_state != current_page: # ensure current page in view when page changed
 			self.page_state = current_page
-			(_, h, o), _ = thumbnails[current_page]
+			_, h, o = thumbnails[current_page]
 			self.miniature_origin = min(o-MINIATURE_MARGIN, self.miniature_origin)
 			self.miniature_origin = max(self.miniature_origin, o+h+MINIATURE_MARGIN-height)
 		
 		self.miniature_origin = min(MINIATURES_HEIGHT-height, self.miniature_origin)
 		self.miniature_origin = max(self.miniature_origin, -MINIATURE_MARGIN)
 		
-		for i in range(page_count):
-			(w, h, o), image = thumbnails[i]
+		for i in thumbnails.visible(self.miniature_origin, height):
+			w, h, o = thumbnails[i]
 			y = self.miniature_origin+height-o-h
-			if y < -h:
-				break
-			if y > height:
-				continue
-			image.drawInRect_fromRect_operation_fraction_(
+			thumbnail(i).drawInRect_fromRect_operation_fraction_(
 				((x, y), (w, h)), NSZeroRect, NSCompositeCopy, 1.
 			)
 			if i == current_page:
 				NSColor.yellowColor().setFill()
 				NSFrameRectWithWidth(((x, y), (w, h)), 2)
 			
-			page_number = NSString.stringWithString_("%s" % (i+1,))
-			attr = {
-				NSFontAttributeName:            NSFont.labelFontOfSize_(10),
-				NSForegroundColorAttributeName: NSColor.whiteColor(),
-			}
-			tw, _ = page_number.sizeWithAttributes_(attr)
-			page_number.drawAtPoint_withAttributes_((x-tw-2, y+h-12), attr)
+			page_number, (tw, _) = text_layout("%s" % (i+1,), 10)
+			page_number.drawAtPoint_((x-tw-2, y+h-12))
+	
+	
+	def clock(self):
+		now = time.time()
+		if now - self.duration_change_time <= 1: # duration changed, display it
+			clock = time.gmtime(self.duration)
+		elif self.absolute_time:
+			clock = time.localtime(now)
+		else:
+			running_duration = now - self.start_time + self.elapsed_duration
+			clock = time.gmtime(abs(self.duration - running_duration))
+		return time.strftime("%H:%M:%S", clock)
+	
+	def layout(self):
+		"""rects of the regions of the view that are redrawn independently"""
+		_, (width, height) = self.bounds()
+		width -= MINIATURE_WIDTH
+		margin = width / 20.
+		current_width = (width-3*margin)*2/3.
+		font_size = margin/2.
+		_, (w, h) = document.crop_box(current_page)
+		current_height = h*current_width/w
+		top = height-1.5*margin
+		return {
+			"current":     ((margin, top-current_height), (current_width, current_height)),
+			"clock":       ((margin, top), (current_width/2., 1.5*margin)),
+			"page number": ((margin+current_width/2., top), (current_width/2., 1.5*margin)),
+			"notes":       ((margin, font_size), (current_width, height-current_height-2.5*margin)),
+			"help":        ((2*margin+current_width, 0), (width-2*margin-current_width, top)),
+			"timings":     ((2*margin+current_width, 0), (width-2*margin-current_width, top)),
+			"next":        ((2*margin+current_width, 0), (current_width/2., top)),
+			"miniatures":  ((width, 0), (MINIATURE_WIDTH, height)),
+		}
+	
+	def inputs(self):
+		"""what the drawing of each region depends on"""
+		drawing = state == DRAW
+		zoom = bbox.transformStruct()
+		timings = None
+		if profiler.enabled and not self.show_help:
+			timings = profiler.summary()
+		next_overlays = current_page < last_page and overlays_state(current_page+1)
+		return {
+			"current":     (current_page, zoom, overlays_state(current_page), shown(video_view)),
+			"clock":       (self.clock(), drawing),
+			"page number": (self.target_page, current_page, drawing),
+			"notes":       (current_page, self.notes_scale, drawing,
+			                current_page in document.beamer_notes),
+			"help":        (self.show_help, drawing),
+			"timings":     (timings, drawing),
+			"next":        (current_page, zoom, next_overlays, drawing),
+			"miniatures":  (current_page, self.miniature_origin, drawing),
+		}
 	
+	def refresh_changes(self):
+		"""mark as needing display the regions whose inputs changed"""
+		if not self.regions:
+			self.setNeedsDisplay_(True)
+			return
+		inputs = self.inputs()
+		layout = self.layout()
+		for name, rect in self.regions.items():
+			if self.drawn.get(name) != inputs[name]:
+				self.setNeedsDisplayInRect_(rect)
+				self.setNeedsDisplayInRect_(layout[name]) # layout may change too
 	
 	def drawRect_(self, rect):
+		profiler.begin("presenter")
+		self.draw_regions()
+		profiler.end()
+		if not startup.reported:
+			startup.report("first frame")
+	
+	def draw_regions(self):
 		bounds = self.bounds()
 		width, height = bounds.size
 		width -= MINIATURE_WIDTH
@@ -931,121 +3527,116 @@ class PresenterView(NSView):
 		current_width = (width-3*margin)*2/3.
 		font_size = margin/2.
 		
+		self.regions = regions = self.layout()
+		inputs = self.inputs()
+		self.drawn = self.drawn or {}
+		def needs_drawing(name):
+			if not self.needsToDrawRect_(regions[name]):
+				return False
+			self.drawn[name] = inputs[name]
+			return True
+		
 		# current
-		self.page = pdf.pageAtIndex_(current_page)
-		page_rect = self.page.boundsForBox_(kPDFDisplayBoxCropBox)
+		self.page = document.page(current_page)
+		page_rect = document.crop_box(current_page)
 		_, (w, h) = page_rect
 		r = current_width/w
 		current_height = h*r
 		
-		NSGraphicsContext.saveGraphicsState()
-		transform = NSAffineTransform.transform()
-		transform.translateXBy_yBy_(margin, height-1.5*margin)
-		transform.scaleXBy_yBy_(r, r)
-		transform.translateXBy_yBy_(0., -h)
-		transform.concat()
-		
-		NSGraphicsContext.saveGraphicsState()
-		draw_page(self.page)
-		
-		# links
-		NSColor.blueColor().setFill()
-		for annotation in annotations(self.page):
-			if type(annotation) == PDFAnnotationLink:
+		if needs_drawing("current"):
+			NSGraphicsContext.saveGraphicsState()
+			transform = NSAffineTransform.transform()
+			transform.translateXBy_yBy_(margin, height-1.5*margin)
+			transform.scaleXBy_yBy_(r, r)
+			transform.translateXBy_yBy_(0., -h)
+			transform.concat()
+			
+			NSGraphicsContext.saveGraphicsState()
+			draw_page(current_page, r*self.window().backingScaleFactor(), "current")
+			
+			# links
+			NSColor.blueColor().setFill()
+			for annotation in document.links(current_page):
 				NSFrameRectWithWidth(annotation.bounds(), .5)
+			
+			self.transform = transform
+			self.transform.prependTransform_(bbox)
+			self.resetCursorRects()
+			self.transform.invert()
+			
+			NSGraphicsContext.restoreGraphicsState()
+			
+			# screen border & cropping
+			NSColor.grayColor().setFill()
+			NSFrameRect(page_rect)
+			
+			# video view proxy
+			if shown(video_view):
+				NSColor.colorWithCalibratedWhite_alpha_(.25, .25).setFill()
+				rect = transform_rect(slide_view.transform, video_view.frame())
+				NSRectFillUsingOperation(rect, NSCompositeSourceAtop)
+			
+			NSGraphicsContext.restoreGraphicsState()
+			NSRectFillUsingOperation(((0, 0), (margin, height)), NSCompositeClear)
+			NSRectFillUsingOperation(((margin, height-1.5*margin), (width+MINIATURE_WIDTH-margin, 1.5*margin)), NSCompositeClear)
+			NSRectFillUsingOperation(((margin+r*w, 0), (width+MINIATURE_WIDTH-margin+r*w, height)), NSCompositeClear)
+			NSRectFillUsingOperation(((0, 0), (width+MINIATURE_WIDTH, height-1.5*margin-r*h)), NSCompositeClear)
+			profiler.mark("current")
 		
-		self.transform = transform
-		self.transform.prependTransform_(bbox)
-		self.resetCursorRects()
-		self.transform.invert()
-		
-		NSGraphicsContext.restoreGraphicsState()
-		
-		# screen border & cropping
-		NSColor.grayColor().setFill()
-		NSFrameRect(page_rect)
-
-		# video view proxy
-		if not video_view.isHidden():
-			NSColor.colorWithCalibratedWhite_alpha_(.25, .25).setFill()
-			rect = transform_rect(slide_view.transform, video_view.frame())
-			NSRectFillUsingOperation(rect, NSCompositeSourceAtop)
-
-		NSGraphicsContext.restoreGraphicsState()
-		NSRectFillUsingOperation(((0, 0), (margin, height)), NSCompositeClear)
-		NSRectFillUsingOperation(((margin, height-1.5*margin), (width+MINIATURE_WIDTH-margin, 1.5*margin)), NSCompositeClear)
-		NSRectFillUsingOperation(((margin+r*w, 0), (width+MINIATURE_WIDTH-margin+r*w, height)), NSCompositeClear)
-		NSRectFillUsingOperation(((0, 0), (width+MINIATURE_WIDTH, height-1.5*margin-r*h)), NSCompositeClear)
-		
-		if state == DRAW:
+		if state == DRAW: # only the current page is shown while drawing
+			for name in regions:
+				needs_drawing(name)
 			return
 		
 		# time
-		now = time.time()
-		if now - self.duration_change_time <= 1: # duration changed, display it
-			clock = time.gmtime(self.duration)
-		elif self.absolute_time:
-			clock = time.localtime(now)
-		else:
-			running_duration = now - self.start_time + self.elapsed_duration
-			clock = time.gmtime(abs(self.duration - running_duration))
-		clock = NSString.stringWithString_(time.strftime("%H:%M:%S", clock))
-		clock.drawAtPoint_withAttributes_((margin, height-1.4*margin), {
-			NSFontAttributeName:            NSFont.labelFontOfSize_(margin),
-			NSForegroundColorAttributeName: NSColor.whiteColor(),
-		})
-		app.dockTile().setBadgeLabel_(clock)
-	
+		if needs_drawing("clock"):
+			clock, _ = inputs["clock"]
+			text, _ = text_layout(clock, margin)
+			text.drawAtPoint_((margin, height-1.4*margin))
+			profiler.mark("clock")
+			app.dockTile().setBadgeLabel_(clock)
+			profiler.mark("dock badge")
+		
 		# page number
-		if self.target_page:
-			page_number = NSString.stringWithString_("goto %s/%s" % (
-				self.target_page, page_count))
-		else:
-			page_number = NSString.stringWithString_("(%s) %s/%s" % (
-				self.page.label(), current_page+1, page_count))
-		attr = {
-			NSFontAttributeName:            NSFont.labelFontOfSize_(font_size),
-			NSForegroundColorAttributeName: NSColor.whiteColor(),
-		}
-		tw, _ = page_number.sizeWithAttributes_(attr)
-		page_number.drawAtPoint_withAttributes_((margin+current_width-tw,
-		                                         height-1.4*margin), attr)
+		if needs_drawing("page number"):
+			if self.target_page:
+				page_number = "goto %s/%s" % (self.target_page, page_count)
+			else:
+				page_number = "(%s) %s/%s" % (
+					document.labels[current_page], current_page+1, page_count)
+			page_number, (tw, _) = text_layout(page_number, font_size)
+			page_number.drawAtPoint_((margin+current_width-tw, height-1.4*margin))
+			profiler.mark("page number")
 		
 		# notes
-		note = NSString.stringWithString_("".join(
-			"\n\n".join(notes[current_page])
-			for notes in [pdf_notes, beamer_notes]
-		))
-		note.drawInRect_withAttributes_(
-			((margin, font_size), (current_width, height-current_height-2.5*margin)),
-			{
-				NSFontAttributeName:            NSFont.labelFontOfSize_(font_size*self.notes_scale),
-				NSForegroundColorAttributeName: NSColor.whiteColor(),
-			}
-		)
+		if needs_drawing("notes"):
+			note, _ = text_layout(document.notes(current_page),
+			                      font_size*self.notes_scale, current_width)
+			note.drawInRect_(regions["notes"])
+			profiler.mark("notes")
 		
 		
 		# help
-		if self.show_help:
-			help_text = _h("".join([
-				"<table style='color: white; font-family: LucidaGrande; font-size: 8pt;'>"
-			] + [
-				"<tr><th style='padding: 0 1em;' align='right'>%s</th><td>%s</td></tr>" % h for h in HELP
-			] + [
-				"</table>"
-			]))
-			help_text.drawAtPoint_((2*margin+current_width, 0))
+		if needs_drawing("help") and self.show_help:
+			help_text().drawAtPoint_((2*margin+current_width, 0))
+			profiler.mark("help")
+		
+		# timings
+		if needs_drawing("timings") and profiler.enabled and not self.show_help:
+			timings, _ = text_layout(profiler.summary(), font_size/2., width-2*margin-current_width)
+			timings.drawAtPoint_((2*margin+current_width, 0))
 		
 		
 		# thumbnails
-		self.draw_miniatures()
+		if needs_drawing("miniatures"):
+			self.draw_miniatures()
+			self.drawn["miniatures"] = self.inputs()["miniatures"] # origin may have moved
+			profiler.mark("miniatures")
 		
 		# next page
-		if current_page < last_page:
-			page = pdf.pageAtIndex_(current_page+1)
-		else:
+		if current_page >= last_page or not needs_drawing("next"):
 			return
-		page_rect = page.boundsForBox_(kPDFDisplayBoxCropBox)
+		page_rect = document.crop_box(current_page+1)
 		_, (w, h) = page_rect
 		r = current_width/2./w
 		
@@ -1056,8 +3647,9 @@ class PresenterView(NSView):
 		transform.translateXBy_yBy_(0., -h)
 		transform.concat()
 		
-		NSEraseRect(page_rect)
-		page.drawWithBox_(kPDFDisplayBoxCropBox)
+		scale = r*self.window().backingScaleFactor()
+		draw_slide(current_page+1, scale, "next")
+		draw_overlays(current_page+1, scale)
 		NSColor.colorWithCalibratedWhite_alpha_(.25, .25).setFill()
 		NSRectFillUsingOperation(page_rect, NSCompositeSourceAtop)
 		
@@ -1067,6 +3659,7 @@ class PresenterView(NSView):
 		NSColor.grayColor().setFill()
 		NSFrameRect(page_rect)
 		NSGraphicsContext.restoreGraphicsState()
+		profiler.mark("next")
 	
 	
 	def resetCursorRects(self):
@@ -1083,17 +3676,14 @@ class PresenterView(NSView):
 		self.discardCursorRects()
 		self.removeAllToolTips()
 		
-		for i, annotation in enumerate(annotations(self.page)):
-			if type(annotation) != PDFAnnotationLink:
-				continue
-			
+		for i, annotation in enumerate(document.links(current_page)):
 			rect = transform_rect(self.transform, annotation.bounds())
 			self.addCursorRect_cursor_(rect, NSCursor.pointingHandCursor())
 			self.addToolTipRect_owner_userData_(rect, self, i)
 	
 	
 	def view_stringForToolTip_point_userData_(self, view, tag, point, data):
-		annotation = annotations(self.page)[data]
+		annotation = document.links(current_page)[data]
 		return annotation.toolTip() or ""
 	
 	def zoomAt_by_(self, point, percent):
@@ -1121,6 +3711,7 @@ class PresenterView(NSView):
 				else: # reset bbox to identity
 					global bbox
 					bbox = NSAffineTransform.transform()
+				return
 		
 		if hasModifiers(event, NSControlKeyMask | NSCommandKeyMask):
 			c = event.charactersIgnoringModifiers()
@@ -1130,8 +3721,8 @@ class PresenterView(NSView):
 		if c == 'q': # quit
 			app.terminate_(self)
 		
-		elif c == 'r': # relaunch
-			exit_relaunch(url.path(), current_page)
+		elif c == 'r': # reload
+			reload_document()
 		
 		elif c in "0123456789" + CR + DEL:
 			if c == '0' and not self.target_page: # skip leading 0
@@ -1164,8 +3755,11 @@ class PresenterView(NSView):
 		elif c == '?':
 			self.show_help = not self.show_help
 		
+		elif c == 'i': # drawing timings, frames are logged too
+			profiler.toggle(os.path.join(cache_directory(), "frames.jsonl"))
+		
 		elif c == ' ': # play/pause video
-			if movie_view.isHidden(): # or toggle timer
+			if not shown(movie_view): # or toggle timer
 				send('t')
 				return
 			
@@ -1175,7 +3769,7 @@ class PresenterView(NSView):
 				movie_view.play()
 		
 		elif c in "<>": # movie navigation
-			if movie_view.isHidden():
+			if not shown(movie_view):
 				return
 			movie_view.stepByCount_(1 if c == '>' else -1)
 		
@@ -1205,7 +3799,7 @@ class PresenterView(NSView):
 			if c == '=': c = '+'
 			if c == '_': c = '-'
 			
-			if web_view.isHidden(): # scaling notes
+			if not shown(web_view): # scaling notes
 				if c == '+':
 					self.notes_scale *= 1.1
 				elif c == '-':
@@ -1242,7 +3836,7 @@ class PresenterView(NSView):
 				color_chooser.orderOut_(None)
 		
 		elif c == 'e': # erase annotation
-			del drawings[current_page]
+			erase_strokes(current_page)
 		
 		else:
 			actions = {
@@ -1310,7 +3904,7 @@ class PresenterView(NSView):
 		slide_view.showCursor()
 	
 	def mouseDragged_(self, event):
-		global state, cursor_location
+		global state, cursor_location, current_stroke
 		cursor_location = self.transform.transformPoint_(event.locationInWindow())
 		if state == CLIC:
 			if hypot(cursor_location.x-self.press_location.x, cursor_location.y-self.press_location.y) < 5:
@@ -1320,20 +3914,28 @@ class PresenterView(NSView):
 			self.path.setLineJoinStyle_(NSRoundLineJoinStyle)
 			self.path.moveToPoint_(self.press_location)
 			self.path.lineToPoint_(cursor_location)
-			drawings[current_page].append((self.path, color_chooser.color(), slide_view.cursor_scale*2))
+			(x0, y0), (x1, y1) = self.press_location, cursor_location
+			self.points = array('d', [x0, y0, x1, y1])
+			current_stroke = (current_page, self.points, self.path,
+			                  color_chooser.color(), slide_view.cursor_scale*2)
 			state = DRAW
 		elif state == DRAW:
 			self.path.lineToPoint_(cursor_location)
+			self.points.extend(cursor_location)
 		elif state == BBOX:
 			delta = self.transform.transformSize_((event.deltaX(), -event.deltaY()))
 			bbox.translateXBy_yBy_(delta.width, delta.height)
 		slide_view.showCursor()
-		self.setNeedsDisplay_(True)
+		if state == DRAW: # current stroke has been extended
+			self.setNeedsDisplayInRect_(self.regions["current"])
+		refresher.refresh([self])
 	
 	def mouseUp_(self, event):
 		global state
 		if state == CLIC:
 			self.click_(event)
+		elif state == DRAW:
+			end_stroke()
 		state = IDLE
 		refresher.refresh()
 	
@@ -1345,11 +3947,7 @@ class PresenterView(NSView):
 		_, (width, height) = self.bounds()
 		ex, ey = event.locationInWindow()
 		if ex > width - MINIATURE_WIDTH: # miniature
-			for i in range(page_count):
-				(_, h, o), _ = thumbnails[i]
-				if ey + h + MINIATURE_MARGIN > self.miniature_origin-o+height:
-					break
-			goto_page(i)
+			goto_page(thumbnails.index_at(self.miniature_origin+height-ey))
 			return
 		
 		annotation = self.page.annotationAtPoint_(self.press_location)
@@ -1361,9 +3959,8 @@ class PresenterView(NSView):
 			return
 		
 		if annotation in movies:
-			player_item, _ = movies[annotation]
-			presentation_show(movie_view)
-			movie_view.playItem_(player_item)
+			presentation_show(get_movie_view())
+			movie_view.playPlayer_(players.use(movies[annotation]).player)
 			return
 		
 		action = annotation.mouseUpAction()
@@ -1389,7 +3986,7 @@ class PresenterView(NSView):
 			goto_page(pdf.indexForPage_(destination.page()))
 		
 		elif url:
-			web_view.mainFrame().loadRequest_(NSURLRequest.requestWithURL_(url))
+			get_web_view().mainFrame().loadRequest_(NSURLRequest.requestWithURL_(url))
 
 
 # application delegate #######################################################
@@ -1427,11 +4024,18 @@ def setup_menu(delegate):
 	
 	app.setMainMenu_(main_menu)
 	
-	app.setApplicationIconImage_(ICON)
+	app.setApplicationIconImage_(icon_image())
 
 
 # notifications
 
+version_check = VersionCheck(os.path.join(cache_directory(), "version.json"))
+
+def check_version(refresh, checked):
+	"""get the latest version (in a background thread), then checked(version)
+	(in the main thread)"""
+	callAfter(checked, version_check.latest(refresh))
+
 try:
 	from Foundation import (NSUserNotificationCenter, NSUserNotification)
 except ImportError:
@@ -1449,7 +4053,9 @@ else:
 	def notify_update():
 		if user_defaults.boolForKey_(NO_NOTIFY):
 			return
-		version = get_version()
+		background(check_version, False, version_checked)
+	
+	def version_checked(version):
 		if version in [VERSION, None]:
 			return
 		notification = NSUserNotification.alloc().init()
@@ -1459,22 +4065,6 @@ else:
 		notification_center.scheduleNotification_(notification)
 
 
-def get_version():
-	try:
-		data, response, _ = NSURLConnection.sendSynchronousRequest_returningResponse_error_(
-			NSURLRequest.requestWithURL_cachePolicy_timeoutInterval_(
-				NSURL.URLWithString_(HOME + "releases/version.txt?v=%s"%VERSION),
-				NSURLRequestReloadIgnoringLocalCacheData,
-				2
-			), None, None
-		)
-		assert response.statusCode() == 200 # found
-		version = bytearray(data).decode("utf-8").strip()
-	except:
-		version = None
-	return version
-
-
 class ApplicationDelegate(NSObject):
 	def about_(self, sender):
 		app.orderFrontStandardAboutPanelWithOptions_({
@@ -1483,11 +4073,13 @@ class ApplicationDelegate(NSObject):
 			"Copyright":          _s(COPYRIGHT),
 			"ApplicationVersion": _s("%s %s" % (NAME, VERSION)),
 			"Credits":            _h(CREDITS),
-			"ApplicationIcon":    ICON,
+			"ApplicationIcon":    icon_image(),
 		})
 	
 	def update_(self, sender):
-		version = get_version()
+		background(check_version, True, self.updateChecked_)
+	
+	def updateChecked_(self, version):
 		if version is None:
 			NSAlert.alertWithError_(
 				NSError.errorWithDomain_code_userInfo_("unable to connect to internet,", 1, {})
@@ -1529,6 +4121,7 @@ class ApplicationDelegate(NSObject):
 	def applicationWillTerminate_(self, notification):
 		recent_files[url.path()] = current_page
 		user_defaults.setObject_forKey_(recent_files, RECENT_FILES)
+		profiler.close()
 		presentation_show()
 	
 	def fullScreen_(self, sender):
@@ -1594,8 +4187,9 @@ def setup_touchbar():
 			items = [u"?", "NSTouchBarItemIdentifierFixedSpaceSmall", u"<", u">"]
 			if slide_view.isHidden():
 				items += ["NSTouchBarItemIdentifierFixedSpaceSmall", u"u"]
-			if not movie_view.isHidden():
+			if shown(movie_view):
 				items += ["NSTouchBarItemIdentifierFixedSpaceSmall", u"play", u"p"]
+				movie_view.progress.reset() # shown on the new touchbar too
 				movie_view.seekSlider_(None)
 			touchbar.setDefaultItemIdentifiers_(items)
 			return touchbar
@@ -1629,8 +4223,8 @@ def setup_touchbar():
 
 	global MovieView
 	class TouchBarMovieView(MovieView):
-		def seekSlider_(self, timer):
-			p = super(TouchBarMovieView, self).seekSlider_(timer)
+		def showProgress_(self, p):
+			super(TouchBarMovieView, self).showProgress_(p)
 			try:
 				delegate = app.delegate()
 				touchbar = delegate.touchbar
@@ -1646,7 +4240,6 @@ def setup_touchbar():
 				if play.action() == "pause":
 					play.setImage_(ImagePlay)
 					play.setAction_("play")
-			return p
 		
 		def setHidden_(self, hidden):
 			super(TouchBarMovieView, self).setHidden_(hidden)
@@ -1709,56 +4302,88 @@ add_subview(presentation_view, slide_view)
 black_view = create_view(NSView, frame=frame)
 add_subview(presentation_view, black_view)
 
-# web view
+# web, movie and video views are created the first time they are needed, they
+# are kept under the message view
+
+web_view = movie_view = video_view = message_view = None
 
-web_view = WebView.alloc().initWithFrame_frameName_groupName_(frame, nil, nil)
+def shown(view):
+	"""is an on demand view created and visible"""
+	return view is not None and not view.isHidden()
+
+def add_hidden_subview(subview):
+	subview.setHidden_(True)
+	add_subview(presentation_view, subview)
+	if message_view is not None: # keeps messages on top
+		presentation_view.addSubview_positioned_relativeTo_(subview, NSWindowBelow, message_view)
 
 class WebFrameLoadDelegate(NSObject):
 	def webView_didCommitLoadForFrame_(self, view, frame):
 		presentation_show(web_view)
 web_frame_load_delegate = WebFrameLoadDelegate.alloc().init()
-web_view.setFrameLoadDelegate_(web_frame_load_delegate)
-
-add_subview(presentation_view, web_view)
 
-# movie view
-
-movie_view = create_view(MovieView, frame=frame)
-add_subview(presentation_view, movie_view)
-
-# video view
-
-video_view = VideoView.alloc().initWithFrame_(((0, 0), (200, 180)))
-add_subview(presentation_view, video_view)
-video_view.align_((VideoView.BOTTOM, VideoView.RIGHT))
+def get_web_view():
+	global web_view
+	if web_view is None:
+		from WebKit import WebView
+		web_view = WebView.alloc().initWithFrame_frameName_groupName_(
+			presentation_view.frame(), nil, nil)
+		web_view.setFrameLoadDelegate_(web_frame_load_delegate)
+		add_hidden_subview(web_view)
+	return web_view
+
+def get_movie_view():
+	global movie_view
+	if movie_view is None:
+		movie_view = create_view(MovieView, frame=presentation_view.frame())
+		add_hidden_subview(movie_view)
+	return movie_view
+
+def get_video_view():
+	global video_view
+	if video_view is None:
+		video_view = VideoView.alloc().initWithFrame_(((0, 0), (200, 180)))
+		add_hidden_subview(video_view)
+		video_view.align_((VideoView.BOTTOM, VideoView.RIGHT))
+	return video_view
 
 # message view
 
 if show_feed:
-	frame.size.height = 40
+	frame.size.height = FEED_HEIGHT
 	message_view = MessageView.alloc().initWithFrame_(frame)
 	add_subview(presentation_view, message_view, NSViewWidthSizable)
+	
+	feed = Feed(policy=feed_policy, notify=lambda: callAfter(message_view.wake))
+	feed.push(u"…")
+	if feed_stdin:
+		background(feed.read, sys.stdin)
+	for path in feed_pipes:
+		background(feed.run, feed.read_pipe, path)
+	for address in feed_sockets:
+		background(feed.run, feed.serve, address)
 
 
 # views visibility
 
 def presentation_show(visible_view=slide_view):
 	for view in [slide_view, black_view, web_view, movie_view]:
-		view.setHidden_(view != visible_view)
+		if view is None: # not created yet
+			continue
+		hidden = view != visible_view
+		if view.isHidden() != hidden:
+			view.setHidden_(hidden)
 
 def toggle_view(view):
 	presentation_show(view if view.isHidden() else slide_view)
 
 def toggle_black_view(): toggle_view(black_view)
-def toggle_web_view():   toggle_view(web_view)
-def toggle_movie_view(): toggle_view(movie_view)
+def toggle_web_view():   toggle_view(get_web_view())
+def toggle_movie_view(): toggle_view(get_movie_view())
 def toggle_video_view():
-	if video_view.isHidden():
-		video_view.setHidden_(False)
-	else:
-		video_view.setHidden_(True)
+	video_view = get_video_view()
+	video_view.setHidden_(not video_view.isHidden())
 
-toggle_video_view()
 presentation_show()
 
 
@@ -1770,6 +4395,7 @@ presenter_view   = create_view(PresenterView, window=presenter_window)
 presenter_window.center()
 presenter_window.makeFirstResponder_(presenter_view)
 presentation_window.makeFirstResponder_(presenter_view)
+startup.mark("windows")
 
 
 # handling full screens ######################################################
@@ -1812,10 +4438,15 @@ class Refresher(NSObject):
 		self.refresh(timer.userInfo())
 	
 	def refresh(self, views=None):
+		"""mark what changed in the slides showing views as needing display"""
 		if views is None:
-			views = [window.contentView() for window in app.windows()]
-		else:
-			views = views[:]
+			views = [presenter_view, slide_view]
+		for view in views:
+			view.refresh_changes()
+	
+	def refresh_all(self):
+		"""mark all views as needing display"""
+		views = [window.contentView() for window in app.windows()]
 		while views:
 			view = views.pop()
 			view.setNeedsDisplay_(True)